@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING
 
 from .state_builder import (
     rebuild_run_state,
+    rebuild_run_states,
     recover_run_state,
     verify_run_state,
 )
@@ -69,6 +70,7 @@ __all__ = [
     "list_runs",
     # State Builder (crash recovery)
     "rebuild_run_state",
+    "rebuild_run_states",
     "recover_run_state",
     "verify_run_state",
     # Service (imported lazily at runtime, statically available for type checking)
@@ -39,18 +39,81 @@ Usage:
 from __future__ import annotations
 
 import logging
-import subprocess
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .workspace import Workspace
 
 logger = logging.getLogger(__name__)
 
+# One status call yields HEAD, changed paths, and the porcelain text.
+# --no-optional-locks keeps status from rewriting the index, and
+# --no-ahead-behind skips the upstream walk that --branch would do.
+_STATUS_ARGS = [
+    "--no-optional-locks",
+    "status",
+    "--porcelain=v2",
+    "--branch",
+    "--no-ahead-behind",
+    "--untracked-files=normal",
+    "-z",
+]
+
+# Space-separated fields before the path in porcelain v2 entries
+_V2_PATH_FIELD = {b"1": 8, b"2": 9, b"u": 10}
+
+
+def _parse_status_v2(raw: bytes) -> Tuple[str, Set[str], str]:
+    """Parse `git status --porcelain=v2 --branch -z` output.
+
+    Args:
+        raw: Raw stdout of the status command.
+
+    Returns:
+        Tuple of (HEAD sha, changed paths, porcelain v1 style text). The sha
+        is empty before the first commit. Renames contribute both paths.
+    """
+    head = ""
+    changed: Set[str] = set()
+    lines: List[str] = []
+
+    records = iter(raw.split(b"\0"))
+    for record in records:
+        kind = record[:1]
+        if kind == b"#":
+            if record.startswith(b"# branch.oid "):
+                oid = record[13:].decode("ascii", "replace")
+                head = "" if oid == "(initial)" else oid
+            continue
+        if kind in (b"?", b"!"):
+            if kind == b"?":
+                path = record[2:].decode("utf-8", "replace")
+                changed.add(path)
+                lines.append(f"?? {path}")
+            continue
+        skip = _V2_PATH_FIELD.get(kind)
+        if skip is None:
+            continue  # Empty trailer
+        fields = record.split(b" ", skip)
+        if len(fields) <= skip:
+            continue
+        xy = fields[1].decode("ascii", "replace").replace(".", " ")
+        path = fields[skip].decode("utf-8", "replace")
+        changed.add(path)
+        if kind == b"2":
+            orig = next(records, b"").decode("utf-8", "replace")
+            changed.add(orig)
+            lines.append(f"{xy} {orig} -> {path}")
+        else:
+            lines.append(f"{xy} {path}")
+
+    return head, changed, "\n".join(lines)
+
 
 # =============================================================================
 # Enums and Data Classes
@@ -77,7 +140,7 @@ class ViolationType(str, Enum):
     SECRET_EXPOSURE = "secret_exposure"
 
 
-@dataclass
+@dataclass(slots=True)
 class Violation:
     """A detected boundary violation.
 
@@ -117,7 +180,7 @@ class Violation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceState:
     """Snapshot of workspace state for comparison.
 
@@ -125,7 +188,7 @@ class WorkspaceState:
 
     Attributes:
         timestamp: When snapshot was taken.
-        git_status: Output of git status --porcelain.
+        git_status: git status --porcelain style lines (unquoted paths).
         git_ref: Current HEAD ref.
         changed_files: Set of files with changes.
         real_repo_ref: Real repo HEAD (for shadow mode comparison).
@@ -150,6 +213,11 @@ class BoundaryViolationError(Exception):
         )
 
 
+def _compile_secret_re(patterns: Set[str]) -> "re.Pattern[str]":
+    """Compile secret path patterns into one literal alternation."""
+    return re.compile("|".join(re.escape(p) for p in sorted(patterns)))
+
+
 # =============================================================================
 # Boundary Scanner
 # =============================================================================
@@ -187,6 +255,9 @@ class BoundaryScanner:
         "token",
     }
 
+    # One alternation finds any secret pattern in a single pass per path
+    _SECRET_RE = _compile_secret_re(SECRET_PATTERNS)
+
     def __init__(
         self,
         workspace: "Workspace",
@@ -206,6 +277,10 @@ class BoundaryScanner:
         self._step_id = step_id
         self._repo_root = Path(repo_root).resolve()
         self._baseline = baseline_state
+        self._secret_re = self._SECRET_RE
+        if self.SECRET_PATTERNS is not BoundaryScanner.SECRET_PATTERNS:
+            # Subclass-supplied patterns need their own alternation
+            self._secret_re = _compile_secret_re(self.SECRET_PATTERNS)
 
     def capture_state(self) -> WorkspaceState:
         """Capture current workspace state.
@@ -215,34 +290,42 @@ class BoundaryScanner:
         """
         timestamp = datetime.now(timezone.utc).isoformat()
 
-        # Get git status
-        git_status = self._run_git(["status", "--porcelain"])
-
-        # Get current ref
-        git_ref = self._run_git(["rev-parse", "HEAD"])
-
-        # Get changed files
-        changed_files = set()
-        for line in git_status.split("\n"):
-            if line and len(line) > 3:
-                changed_files.add(line[3:])
-
-        state = WorkspaceState(
+        shadow = self._workspace.is_shadow()
+        # A shadow fork checked out in the real repo shares its HEAD, so
+        # only a separate workspace root needs its own rev-parse
+        separate_root = (
+            shadow and Path(self._workspace.root()).resolve() != self._repo_root
+        )
+        if separate_root:
+            # The real repo ref is independent of the workspace status, so
+            # the two git subprocesses run concurrently
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                real_ref_future = pool.submit(
+                    self._run_git, ["rev-parse", "HEAD"], self._repo_root
+                )
+                status_raw = self._run_git(_STATUS_ARGS)
+                real_repo_ref = (
+                    real_ref_future.result().decode("utf-8", "replace").strip()
+                )
+        else:
+            status_raw = self._run_git(_STATUS_ARGS)
+            real_repo_ref = ""
+
+        # Get git status, current ref, and changed files in one call
+        git_ref, changed_files, git_status = _parse_status_v2(status_raw)
+        if shadow and not separate_root:
+            real_repo_ref = git_ref
+
+        return WorkspaceState(
             timestamp=timestamp,
             git_status=git_status,
             git_ref=git_ref,
             changed_files=changed_files,
+            real_repo_ref=real_repo_ref,
         )
 
-        # For shadow mode, also capture real repo state
-        if self._workspace.is_shadow():
-            state.real_repo_ref = self._run_git(
-                ["rev-parse", "HEAD"],
-                cwd=self._repo_root,
-            )
-
-        return state
-
     def scan(
         self,
         current_state: Optional[WorkspaceState] = None,
@@ -361,20 +444,19 @@ class BoundaryScanner:
         """Check for potential secret exposure in changed files."""
         violations = []
 
+        search = self._secret_re.search
         for file_path in current.changed_files:
-            file_lower = file_path.lower()
-            for pattern in self.SECRET_PATTERNS:
-                if pattern in file_lower:
-                    violations.append(Violation(
-                        type=ViolationType.SECRET_EXPOSURE,
-                        severity=ViolationSeverity.WARNING,
-                        path=file_path,
-                        operation="modify",
-                        detail=f"File {file_path} may contain secrets (matched '{pattern}')",
-                        step_id=self._step_id,
-                        remediation="Review file for sensitive data before committing.",
-                    ))
-                    break  # Only one warning per file
+            match = search(file_path.lower())
+            if match:  # Only one warning per file
+                violations.append(Violation(
+                    type=ViolationType.SECRET_EXPOSURE,
+                    severity=ViolationSeverity.WARNING,
+                    path=file_path,
+                    operation="modify",
+                    detail=f"File {file_path} may contain secrets (matched '{match.group()}')",
+                    step_id=self._step_id,
+                    remediation="Review file for sensitive data before committing.",
+                ))
 
         return violations
 
@@ -382,20 +464,24 @@ class BoundaryScanner:
         self,
         args: List[str],
         cwd: Optional[Path] = None,
-    ) -> str:
-        """Run a git command and return stdout."""
+    ) -> bytes:
+        """Run a git command and return raw stdout bytes."""
+        # Deferred to the first scan: importing the module stays cheap for
+        # callers that only need the violation types
+        import subprocess
+
         try:
             result = subprocess.run(
                 ["git"] + args,
                 cwd=str(cwd or self._workspace.root()),
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=30,
             )
-            return result.stdout.strip()
+            return result.stdout
         except Exception as e:
             logger.warning("Git command failed: %s", e)
-            return ""
+            return b""
 
 
 # =============================================================================
@@ -76,6 +76,8 @@ class StepContext:
         teaching_notes: Optional teaching notes for the step.
         routing: Optional routing context for microloop state.
         workspace: Optional workspace abstraction for isolation and boundary checks.
+        run_base: RUN_BASE path for this step's artifacts (derived at init).
+        is_shadow_mode: Whether executing in a shadow workspace (derived at init).
     """
 
     repo_root: Path
@@ -93,22 +95,24 @@ class StepContext:
     teaching_notes: Optional[TeachingNotes] = None
     routing: Optional[RoutingContext] = None
     workspace: Optional["Workspace"] = None
+    run_base: Path = field(init=False, repr=False, compare=False)
+    is_shadow_mode: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def run_base(self) -> Path:
-        """Get the RUN_BASE path for this step's artifacts.
+    def __post_init__(self) -> None:
+        """Resolve the workspace-dependent paths once.
 
         Uses workspace.run_base if available, otherwise falls back to
-        repo_root-based calculation.
+        repo_root-based calculation. The inputs are fixed once a step
+        starts, and dataclasses.replace() re-runs this hook.
         """
         if self.workspace is not None:
-            return self.workspace.run_base
-        return Path(self.repo_root) / "swarm" / "runs" / self.run_id / self.flow_key
-
-    @property
-    def is_shadow_mode(self) -> bool:
-        """Check if executing in shadow workspace mode."""
-        return self.workspace is not None and self.workspace.is_shadow()
+            self.run_base = self.workspace.run_base
+            self.is_shadow_mode = self.workspace.is_shadow()
+        else:
+            self.run_base = (
+                Path(self.repo_root) / "swarm" / "runs" / self.run_id / self.flow_key
+            )
+            self.is_shadow_mode = False
 
 
 @dataclass
@@ -47,9 +47,12 @@ from __future__ import annotations
 import hashlib
 import logging
 import re
+import sys
+import time
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -58,10 +61,11 @@ logger = logging.getLogger(__name__)
 # Normalization Patterns
 # =============================================================================
 
-# Patterns to remove during normalization (noise that varies but doesn't indicate progress)
+# Patterns to remove during normalization (noise that varies but doesn't indicate progress).
+# Each pattern must require at least one of _NOISE_TRIGGERS to match.
 NOISE_PATTERNS = [
     # Timestamps in various formats
-    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}",  # ISO timestamps
+    r"\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}:\d{2}",  # ISO timestamps
     r"\d{2}:\d{2}:\d{2}",  # Time only
     r"\d+\.\d+s",  # Duration in seconds
     # Line numbers (vary across runs)
@@ -86,8 +90,16 @@ NOISE_PATTERNS = [
     r"try \d+",
 ]
 
-# Compiled patterns for efficiency
-_NOISE_REGEX = re.compile("|".join(NOISE_PATTERNS), re.IGNORECASE)
+# Compiled patterns for efficiency. Input is lowercased before matching, so
+# the alternation is compiled case-sensitively (IGNORECASE slows every branch).
+_NOISE_REGEX = re.compile("|".join(NOISE_PATTERNS))
+
+# Characters at least one of which every noise pattern needs in ASCII text.
+# Substring checks are memchr-fast, so ASCII text containing none of them
+# (e.g. a long message without digits or paths) skips the much slower
+# regex scan. Non-ASCII text always gets the scan, since \d also matches
+# other scripts' digits.
+_NOISE_TRIGGERS = tuple("0123456789-/\\")
 
 
 # =============================================================================
@@ -95,10 +107,13 @@ _NOISE_REGEX = re.compile("|".join(NOISE_PATTERNS), re.IGNORECASE)
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StallInfo:
     """Information about stall detection state.
 
+    Immutable so that ProgressTracker can hand out one cached instance
+    until the next iteration is recorded.
+
     Attributes:
         is_stalled: Whether the tracker considers progress stalled.
         stall_count: Number of consecutive identical signatures.
@@ -138,9 +153,9 @@ def stall_info_to_dict(info: StallInfo) -> Dict[str, Any]:
 
 def stall_info_from_dict(data: Dict[str, Any]) -> StallInfo:
     """Parse StallInfo from dictionary."""
-    stall_started_at = None
-    if "stall_started_at" in data and data["stall_started_at"]:
-        stall_started_at = datetime.fromisoformat(data["stall_started_at"])
+    stall_started_at = data.get("stall_started_at")
+    if stall_started_at:
+        stall_started_at = datetime.fromisoformat(stall_started_at)
 
     return StallInfo(
         is_stalled=data.get("is_stalled", False),
@@ -158,6 +173,9 @@ def stall_info_from_dict(data: Dict[str, Any]) -> StallInfo:
 # Signature Computation
 # =============================================================================
 
+# Signature recorded for successful iterations (computed once at import)
+SUCCESS_SIGNATURE = "SUCCESS_" + hashlib.sha256(b"success").hexdigest()[:8]
+
 
 def normalize_error_output(error_output: str) -> str:
     """Normalize error output by removing noise.
@@ -175,19 +193,13 @@ def normalize_error_output(error_output: str) -> str:
     # Lowercase for case-insensitive matching
     normalized = error_output.lower()
 
-    # Strip leading/trailing whitespace
-    normalized = normalized.strip()
-
-    # Remove noise patterns
-    normalized = _NOISE_REGEX.sub("", normalized)
-
-    # Collapse multiple whitespace to single space
-    normalized = re.sub(r"\s+", " ", normalized)
+    # Remove noise patterns (single pass over the fused alternation),
+    # unless no pattern can possibly match
+    if not normalized.isascii() or any(t in normalized for t in _NOISE_TRIGGERS):
+        normalized = _NOISE_REGEX.sub("", normalized)
 
-    # Strip again after substitutions
-    normalized = normalized.strip()
-
-    return normalized
+    # Collapse whitespace runs and strip both ends in one C-level pass
+    return " ".join(normalized.split())
 
 
 def compute_error_signature(error_output: str) -> str:
@@ -203,7 +215,23 @@ def compute_error_signature(error_output: str) -> str:
         16-character hex signature (SHA256 truncated).
     """
     normalized = normalize_error_output(error_output)
-    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+    return hashlib.sha256(normalized.encode()).digest()[:8].hex()
+
+
+# Python exception names in priority order, mapped to their category
+_EXCEPTION_CATEGORIES: Tuple[Tuple[str, str], ...] = (
+    ("typeerror", "type_error"),
+    ("importerror", "import_error"),
+    ("modulenotfounderror", "import_error"),
+    ("attributeerror", "attribute_error"),
+    ("nameerror", "name_error"),
+    ("assertionerror", "assertion_error"),
+    ("valueerror", "value_error"),
+    ("keyerror", "key_error"),
+    ("indexerror", "index_error"),
+    ("syntaxerror", "syntax_error"),
+    ("runtimeerror", "runtime_error"),
+)
 
 
 def extract_error_category(error_output: str) -> str:
@@ -218,28 +246,13 @@ def extract_error_category(error_output: str) -> str:
         Error category string (e.g., "type_error", "import_error", "assertion").
     """
     lower = error_output.lower()
+    has_error = "error" in lower
 
-    # Python exceptions
-    if "typeerror" in lower:
-        return "type_error"
-    if "importerror" in lower or "modulenotfounderror" in lower:
-        return "import_error"
-    if "attributeerror" in lower:
-        return "attribute_error"
-    if "nameerror" in lower:
-        return "name_error"
-    if "assertionerror" in lower:
-        return "assertion_error"
-    if "valueerror" in lower:
-        return "value_error"
-    if "keyerror" in lower:
-        return "key_error"
-    if "indexerror" in lower:
-        return "index_error"
-    if "syntaxerror" in lower:
-        return "syntax_error"
-    if "runtimeerror" in lower:
-        return "runtime_error"
+    # Python exceptions (all contain "error", so skip them when it's absent)
+    if has_error:
+        for needle, category in _EXCEPTION_CATEGORIES:
+            if needle in lower:
+                return category
 
     # Test framework patterns
     if "failed" in lower and "test" in lower:
@@ -252,7 +265,7 @@ def extract_error_category(error_output: str) -> str:
         return "flaky"
 
     # Build/compile patterns
-    if "compile" in lower and "error" in lower:
+    if has_error and "compile" in lower:
         return "compile_error"
     if "linker" in lower or "undefined reference" in lower:
         return "linker_error"
@@ -260,7 +273,7 @@ def extract_error_category(error_output: str) -> str:
         return "dependency"
 
     # Generic
-    if "error" in lower:
+    if has_error:
         return "generic_error"
     if "exception" in lower:
         return "exception"
@@ -275,7 +288,31 @@ def extract_error_category(error_output: str) -> str:
 # =============================================================================
 
 
-@dataclass
+# Recommendation by stall depth (stall_count // stall_threshold, capped at 2)
+_RECOMMENDATIONS = ("continue", "investigate", "escalate")
+
+# Minimum number of iterations retained in the tracker's history buffers
+MIN_HISTORY_SIZE = 128
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    """Convert a recorded POSIX timestamp to an aware UTC datetime."""
+    return datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+def _append_counted(buffer: Deque[str], counts: Dict[str, int], sig: str) -> None:
+    """Append to a bounded deque, keeping per-signature counts in step."""
+    if len(buffer) == buffer.maxlen:
+        evicted = buffer[0]
+        if counts[evicted] == 1:
+            del counts[evicted]
+        else:
+            counts[evicted] -= 1
+    buffer.append(sig)
+    counts[sig] = counts.get(sig, 0) + 1
+
+
+@dataclass(slots=True)
 class ProgressTracker:
     """Track progress velocity for stall detection (Elephant Protocol).
 
@@ -287,20 +324,91 @@ class ProgressTracker:
     the same signature appears consecutively, indicating no progress is
     being made despite continued iteration.
 
+    History is kept in bounded deques holding the most recent `capacity`
+    iterations (default max(MIN_HISTORY_SIZE, 8 * stall_threshold)); stall
+    detection and the iteration count are tracked separately and are not
+    bounded.
+
     Attributes:
-        error_signatures: History of error signatures.
+        error_signatures: Recent history of error signatures.
         stall_threshold: Number of identical signatures before declaring stall.
-        _timestamps: Timestamp for each recorded iteration.
-        _categories: Error category for each iteration (optional).
+        capacity: Iterations of history to retain (None = default size).
+        _timestamps: POSIX time (time.time()) of each retained iteration;
+            converted to datetime only when read or serialized.
+        _categories: Error category for each retained iteration (optional).
+            None until first read; see _raw_errors.
+        _raw_errors: Raw error text for iterations whose category has not
+            been extracted yet (None once extracted), aligned with _categories.
+        _last_raw: Raw text of the most recent record_iteration call.
+        _last_raw_signature: Signature computed for _last_raw, reused when
+            the same text is recorded again (the steady-state stall case).
+        _run_count: Length of the trailing run of identical signatures,
+            maintained on append so stall checks don't rescan history.
+        _total_iterations: Iterations recorded since creation or reset.
+        _window: The last stall_threshold signatures (velocity window).
+        _window_counts: Occurrences of each signature within _window, so
+            velocity is len(_window_counts) / len(_window) without a scan.
+        _history_counts: Occurrences of each signature within
+            error_signatures, giving StallInfo.unique_signatures in O(1).
+        _cached_info: StallInfo for the current state, or None once a new
+            iteration is recorded or the tracker is reset.
     """
 
-    error_signatures: List[str] = field(default_factory=list)
+    error_signatures: Deque[str] = field(default_factory=deque)
     stall_threshold: int = 3  # Number of identical signatures before stall
+    capacity: Optional[int] = None  # History size; None = derived from threshold
 
     # Internal tracking
-    _timestamps: List[datetime] = field(default_factory=list, repr=False)
-    _categories: List[str] = field(default_factory=list, repr=False)
+    _timestamps: Deque[float] = field(default_factory=deque, repr=False)
+    _categories: Deque[Optional[str]] = field(default_factory=deque, repr=False)
     _stall_started_at: Optional[datetime] = field(default=None, repr=False)
+    _run_count: int = field(default=0, init=False, repr=False)
+    _total_iterations: int = field(default=0, init=False, repr=False)
+    _window: Deque[str] = field(default_factory=deque, init=False, repr=False)
+    _window_counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _history_counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _cached_info: Optional[StallInfo] = field(default=None, init=False, repr=False)
+    _raw_errors: Deque[Optional[str]] = field(default_factory=deque, init=False, repr=False)
+    _pending_categories: int = field(default=0, init=False, repr=False)
+    _last_raw: Optional[str] = field(default=None, init=False, repr=False)
+    _last_raw_signature: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Bound the history buffers and derive counters from seeded history.
+
+        Seeded histories may be any sequence; they are copied into fresh
+        deques, so the caller's containers are never aliased.
+        """
+        history_size = self.capacity or max(MIN_HISTORY_SIZE, self.stall_threshold * 8)
+        seeded = self.error_signatures
+        self.error_signatures = deque(maxlen=history_size)
+        self._timestamps = deque(self._timestamps, maxlen=history_size)
+        self._categories = deque(self._categories, maxlen=history_size)
+        self._raw_errors = deque([None] * len(self._categories), maxlen=history_size)
+        self._window = deque(maxlen=max(self.stall_threshold, 1))
+        for sig in map(sys.intern, seeded):
+            self._append_signature(sig)
+
+    def _append_signature(self, sig: str) -> None:
+        """Append a signature and update the trailing run length."""
+        if self.error_signatures and self.error_signatures[-1] == sig:
+            self._run_count += 1
+        else:
+            self._run_count = 1
+        self._total_iterations += 1
+        self._cached_info = None
+        _append_counted(self.error_signatures, self._history_counts, sig)
+        _append_counted(self._window, self._window_counts, sig)
+
+    def _materialize_categories(self) -> None:
+        """Extract any categories deferred by record_iteration."""
+        if not self._pending_categories:
+            return
+        for i, raw in enumerate(self._raw_errors):
+            if raw is not None:
+                self._categories[i] = extract_error_category(raw)
+                self._raw_errors[i] = None
+        self._pending_categories = 0
 
     def compute_signature(self, error_output: str) -> str:
         """Compute normalized signature from error output.
@@ -321,30 +429,80 @@ class ProgressTracker:
         Args:
             error_output: Raw error text from this iteration.
         """
-        sig = self.compute_signature(error_output)
-        self.error_signatures.append(sig)
-        self._timestamps.append(datetime.now(timezone.utc))
-        self._categories.append(extract_error_category(error_output))
+        if error_output == self._last_raw:
+            # Identical raw text: skip normalization and hashing
+            sig = self._last_raw_signature
+        else:
+            # Interned so repeated signatures share one string object
+            sig = sys.intern(self.compute_signature(error_output))
+            self._last_raw = error_output
+            self._last_raw_signature = sig
+        self._append_signature(sig)
+        self._timestamps.append(time.time())
+        # Category extraction is deferred until a category is read
+        self._categories.append(None)
+        self._raw_errors.append(error_output)
+        self._pending_categories += 1
 
         # Track when stall started
         if self.is_stalled() and self._stall_started_at is None:
             # Stall started on the first repeated signature
             stall_count = self.get_stall_count()
             if stall_count >= self.stall_threshold and len(self._timestamps) >= stall_count:
-                self._stall_started_at = self._timestamps[-stall_count]
+                self._stall_started_at = _to_datetime(self._timestamps[-stall_count])
         elif not self.is_stalled():
             self._stall_started_at = None
 
+    def record_batch(
+        self,
+        signatures: Sequence[str],
+        categories: Sequence[str],
+        timestamps: Sequence[datetime],
+    ) -> None:
+        """Append already-computed history in bulk (e.g. when restoring state).
+
+        Signatures are taken as-is and stall_started_at is left untouched.
+        Derived counters are recomputed once for the whole batch rather
+        than per entry.
+
+        Args:
+            signatures: Error signatures, oldest first.
+            categories: Error category for each iteration.
+            timestamps: Timestamp for each iteration.
+        """
+        sigs = list(map(sys.intern, signatures))
+        previous = self.error_signatures[-1] if self.error_signatures else None
+
+        self.error_signatures.extend(sigs)
+        self._categories.extend(categories)
+        self._raw_errors.extend([None] * len(categories))
+        self._timestamps.extend(ts.timestamp() for ts in timestamps)
+        self._window.extend(sigs)
+        self._total_iterations += len(sigs)
+        self._cached_info = None
+
+        if sigs:
+            last = sigs[-1]
+            run = 0
+            for sig in reversed(sigs):
+                if sig != last:
+                    break
+                run += 1
+            if run == len(sigs) and previous == last:
+                run += self._run_count
+            self._run_count = run
+            self._history_counts = dict(Counter(self.error_signatures))
+            self._window_counts = dict(Counter(self._window))
+
     def record_success(self) -> None:
         """Record a successful iteration (no error).
 
         This breaks the stall pattern since success is a different outcome.
         """
-        # Use a special signature for success
-        success_sig = "SUCCESS_" + hashlib.sha256(b"success").hexdigest()[:8]
-        self.error_signatures.append(success_sig)
-        self._timestamps.append(datetime.now(timezone.utc))
+        self._append_signature(SUCCESS_SIGNATURE)
+        self._timestamps.append(time.time())
         self._categories.append("success")
+        self._raw_errors.append(None)
         self._stall_started_at = None
 
     def is_stalled(self) -> bool:
@@ -353,10 +511,10 @@ class ProgressTracker:
         Returns:
             True if the last N signatures are identical.
         """
-        if len(self.error_signatures) < self.stall_threshold:
-            return False
-        recent = self.error_signatures[-self.stall_threshold :]
-        return len(set(recent)) == 1
+        if self.stall_threshold > 0:
+            return self._run_count >= self.stall_threshold
+        # A non-positive threshold compares the whole retained history
+        return 0 < len(self.error_signatures) <= self._run_count
 
     def get_stall_count(self) -> int:
         """Get count of consecutive identical signatures.
@@ -364,16 +522,7 @@ class ProgressTracker:
         Returns:
             Number of consecutive identical signatures at the end.
         """
-        if not self.error_signatures:
-            return 0
-        last_sig = self.error_signatures[-1]
-        count = 0
-        for sig in reversed(self.error_signatures):
-            if sig == last_sig:
-                count += 1
-            else:
-                break
-        return count
+        return self._run_count
 
     def get_velocity(self) -> float:
         """Get progress velocity.
@@ -387,39 +536,39 @@ class ProgressTracker:
         if len(self.error_signatures) < 2:
             return 1.0
         # Use recent window for velocity calculation
-        window = min(len(self.error_signatures), self.stall_threshold)
-        recent = self.error_signatures[-window:]
-        unique = len(set(recent))
-        return unique / len(recent)
+        return len(self._window_counts) / len(self._window)
 
     def get_stall_info(self) -> StallInfo:
         """Get comprehensive stall information.
 
+        The result is cached until the next iteration is recorded, so
+        repeated polls (build_stall_context, should_suggest_sidequest)
+        share one instance.
+
         Returns:
             StallInfo with all stall detection metrics.
         """
+        if self._cached_info is not None:
+            return self._cached_info
+
         is_stalled = self.is_stalled()
         stall_count = self.get_stall_count()
         velocity = self.get_velocity()
 
-        # Determine recommendation
-        if not is_stalled:
-            recommendation = "continue"
-        elif stall_count >= self.stall_threshold * 2:
-            recommendation = "escalate"
-        else:
-            recommendation = "investigate"
+        # Below threshold -> continue, 1x -> investigate, 2x or more -> escalate
+        recommendation = _RECOMMENDATIONS[min(stall_count // max(self.stall_threshold, 1), 2)]
 
-        return StallInfo(
+        self._cached_info = StallInfo(
             is_stalled=is_stalled,
             stall_count=stall_count,
             velocity=velocity,
             last_signature=self.error_signatures[-1] if self.error_signatures else "",
-            unique_signatures=len(set(self.error_signatures)),
-            total_iterations=len(self.error_signatures),
+            unique_signatures=len(self._history_counts),
+            total_iterations=self._total_iterations,
             stall_started_at=self._stall_started_at,
             recommendation=recommendation,
         )
+        return self._cached_info
 
     def get_error_category(self) -> Optional[str]:
         """Get the error category of the most recent iteration.
@@ -429,19 +578,26 @@ class ProgressTracker:
         """
         if not self._categories:
             return None
+        if self._categories[-1] is None:
+            self._categories[-1] = extract_error_category(self._raw_errors[-1])
+            self._raw_errors[-1] = None
+            self._pending_categories -= 1
         return self._categories[-1]
 
     def get_signature_history(self) -> List[Tuple[str, str, datetime]]:
-        """Get full history of signatures with categories and timestamps.
+        """Get retained history of signatures with categories and timestamps.
 
         Returns:
             List of (signature, category, timestamp) tuples.
         """
+        self._materialize_categories()
+        # Snapshot to lists: indexing into the middle of a deque is O(n)
+        categories = list(self._categories)
+        timestamps = list(self._timestamps)
         result = []
-        for i in range(len(self.error_signatures)):
-            sig = self.error_signatures[i]
-            cat = self._categories[i] if i < len(self._categories) else "unknown"
-            ts = self._timestamps[i] if i < len(self._timestamps) else datetime.now(timezone.utc)
+        for i, sig in enumerate(self.error_signatures):
+            cat = categories[i] if i < len(categories) else "unknown"
+            ts = _to_datetime(timestamps[i]) if i < len(timestamps) else datetime.now(timezone.utc)
             result.append((sig, cat, ts))
         return result
 
@@ -450,11 +606,21 @@ class ProgressTracker:
         self.error_signatures.clear()
         self._timestamps.clear()
         self._categories.clear()
+        self._raw_errors.clear()
+        self._pending_categories = 0
+        self._last_raw = None
+        self._last_raw_signature = ""
         self._stall_started_at = None
+        self._run_count = 0
+        self._total_iterations = 0
+        self._window.clear()
+        self._window_counts.clear()
+        self._history_counts.clear()
+        self._cached_info = None
 
     def __len__(self) -> int:
         """Return number of iterations recorded."""
-        return len(self.error_signatures)
+        return self._total_iterations
 
 
 # =============================================================================
@@ -486,6 +652,21 @@ def build_stall_context(tracker: ProgressTracker) -> Dict[str, Any]:
     }
 
 
+# Sidequest decision per recommendation: (should_suggest, reason template).
+# The tracker only recommends "continue" when not stalled.
+_SIDEQUEST_DECISIONS: Dict[str, Tuple[bool, str]] = {
+    "continue": (False, "Not stalled"),
+    "investigate": (
+        True,
+        "Stalled for {stall_count} iterations, investigation sidequest suggested",
+    ),
+    "escalate": (
+        True,
+        "Stalled for {stall_count} iterations with same error, escalation recommended",
+    ),
+}
+
+
 def should_suggest_sidequest(tracker: ProgressTracker) -> Tuple[bool, str]:
     """Determine if a sidequest should be suggested based on stall state.
 
@@ -496,17 +677,8 @@ def should_suggest_sidequest(tracker: ProgressTracker) -> Tuple[bool, str]:
         Tuple of (should_suggest, reason).
     """
     info = tracker.get_stall_info()
-
-    if not info.is_stalled:
-        return False, "Not stalled"
-
-    if info.recommendation == "escalate":
-        return True, f"Stalled for {info.stall_count} iterations with same error, escalation recommended"
-
-    if info.recommendation == "investigate":
-        return True, f"Stalled for {info.stall_count} iterations, investigation sidequest suggested"
-
-    return False, "No sidequest needed"
+    should_suggest, reason = _SIDEQUEST_DECISIONS[info.recommendation]
+    return should_suggest, reason.format(stall_count=info.stall_count)
 
 
 # =============================================================================
@@ -514,16 +686,18 @@ def should_suggest_sidequest(tracker: ProgressTracker) -> Tuple[bool, str]:
 # =============================================================================
 
 
-def create_tracker(stall_threshold: int = 3) -> ProgressTracker:
+def create_tracker(stall_threshold: int = 3, capacity: Optional[int] = None) -> ProgressTracker:
     """Create a new ProgressTracker with the specified threshold.
 
     Args:
         stall_threshold: Number of identical signatures before declaring stall.
+        capacity: Iterations of history to retain. Defaults to
+            max(MIN_HISTORY_SIZE, 8 * stall_threshold).
 
     Returns:
         New ProgressTracker instance.
     """
-    return ProgressTracker(stall_threshold=stall_threshold)
+    return ProgressTracker(stall_threshold=stall_threshold, capacity=capacity)
 
 
 def tracker_to_dict(tracker: ProgressTracker) -> Dict[str, Any]:
@@ -535,10 +709,12 @@ def tracker_to_dict(tracker: ProgressTracker) -> Dict[str, Any]:
     Returns:
         Dictionary representation.
     """
+    tracker._materialize_categories()
     return {
         "error_signatures": list(tracker.error_signatures),
         "stall_threshold": tracker.stall_threshold,
-        "timestamps": [ts.isoformat() for ts in tracker._timestamps],
+        "capacity": tracker.capacity,
+        "timestamps": [_to_datetime(ts).isoformat() for ts in tracker._timestamps],
         "categories": list(tracker._categories),
         "stall_started_at": (
             tracker._stall_started_at.isoformat() if tracker._stall_started_at else None
@@ -556,13 +732,14 @@ def tracker_from_dict(data: Dict[str, Any]) -> ProgressTracker:
         ProgressTracker instance.
     """
     tracker = ProgressTracker(
-        error_signatures=list(data.get("error_signatures", [])),
         stall_threshold=data.get("stall_threshold", 3),
+        capacity=data.get("capacity"),
+    )
+    tracker.record_batch(
+        data.get("error_signatures", []),
+        data.get("categories", []),
+        [datetime.fromisoformat(ts) for ts in data.get("timestamps", [])],
     )
-    tracker._timestamps = [
-        datetime.fromisoformat(ts) for ts in data.get("timestamps", [])
-    ]
-    tracker._categories = list(data.get("categories", []))
     if data.get("stall_started_at"):
         tracker._stall_started_at = datetime.fromisoformat(data["stall_started_at"])
     return tracker
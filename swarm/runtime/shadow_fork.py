@@ -39,11 +39,15 @@ Usage:
 from __future__ import annotations
 
 import logging
+import os
+import shutil
 import subprocess
+import tempfile
+import weakref
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Dict, Optional, Tuple
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -53,8 +57,90 @@ SHADOW_BRANCH_PREFIX = "shadow/"
 MARKER_FILE = ".shadow_fork_active"
 PRE_PUSH_HOOK_MARKER = "# SHADOW_FORK_PUSH_GUARD"
 
+# Guard section added to the pre-push hook while a shadow fork is active
+_PUSH_GUARD_SCRIPT = f"""
+{PRE_PUSH_HOOK_MARKER}
+# Block pushes while shadow fork is active
+if [ -f "{MARKER_FILE}" ]; then
+    echo "ERROR: Push blocked by shadow fork isolation."
+    echo "Shadow fork is active. Use allow_push() before pushing."
+    exit 1
+fi
+{PRE_PUSH_HOOK_MARKER}_END
+"""
+
+# Hook contents are handled as bytes; the markers are pure ASCII
+_PUSH_GUARD_BLOCK = _PUSH_GUARD_SCRIPT.encode()
+_PUSH_GUARD_MARKER = PRE_PUSH_HOOK_MARKER.encode("ascii")
+_PUSH_GUARD_END_MARKER = _PUSH_GUARD_MARKER + b"_END"
+
+# Complete pre-push hook written when no hook exists yet
+_PUSH_GUARD_HOOK = b"#!/bin/sh\n" + _PUSH_GUARD_BLOCK
+
+# Environment overrides for git subprocesses: don't take optional index
+# locks (e.g. status refreshing the index), and keep messages in the C
+# locale so stderr is stable and git skips loading translations.
+_GIT_ENV_OVERRIDES = {"GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
+
+# Read size when streaming git output into a caller's sink
+_DIFF_CHUNK_SIZE = 64 * 1024
+
+# Forks created by this process that have not been cleaned up, keyed by
+# resolved repo root. Lets create() refuse a second fork without touching
+# the marker file; the marker still guards against other processes.
+_ACTIVE: "weakref.WeakValueDictionary[Path, ShadowFork]" = weakref.WeakValueDictionary()
+
+# Parsed marker files keyed by path, validated by (mtime_ns, size, inode)
+# so polling load_shadow_state only costs a stat while the marker is
+# unchanged.
+_STATE_CACHE: Dict[Path, Tuple[Tuple[int, int, int], Dict[str, str]]] = {}
+
+
+def _parse_commit_sha(output: str) -> Optional[str]:
+    """Extract the commit SHA from ``git commit`` summary output.
+
+    The summary line looks like ``[branch (root-commit) <sha>] subject``.
+
+    Args:
+        output: Stdout of ``git -c core.abbrev=no commit``.
+
+    Returns:
+        The full hex SHA, or None if the output is not in the expected form.
+    """
+    if not output.startswith("["):
+        return None
+    header, sep, _ = output.partition("]")
+    if not sep:
+        return None
+    sha = header.rsplit(" ", 1)[-1]
+    if len(sha) in (40, 64) and all(c in "0123456789abcdef" for c in sha):
+        return sha
+    return None
+
+
+def _parse_branch_status(output: str) -> Tuple[Optional[str], bool]:
+    """Parse ``git status --porcelain=v2 --branch`` output.
 
-@dataclass
+    Args:
+        output: Stdout of the status command.
+
+    Returns:
+        Tuple of (current branch name or None if detached, whether the
+        working tree has uncommitted or untracked changes).
+    """
+    branch = None
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head ") :]
+            if head != "(detached)":
+                branch = head
+        elif not line.startswith("#"):
+            # Headers come first, so the branch is already known
+            return branch, True
+    return branch, False
+
+
+@dataclass(slots=True, weakref_slot=True)
 class ShadowFork:
     """Git branch isolation layer for safe speculative execution.
 
@@ -68,6 +154,12 @@ class ShadowFork:
         original_branch: Name of the branch before shadow fork (None if not created).
         base_branch: The branch to create shadow from (default: main).
         _push_allowed: Internal flag tracking if push is allowed.
+        _git: Absolute path of the git executable, resolved once.
+        _env: Environment for git subprocesses, built once.
+        _marker_path: Path to the shadow fork marker file.
+        _hook_path: Path to the pre-push hook.
+        _active_key: Resolved repo root this fork is registered under in
+            _ACTIVE, or None while no fork is active.
     """
 
     repo_root: Path
@@ -75,6 +167,18 @@ class ShadowFork:
     original_branch: Optional[str] = None
     base_branch: str = "main"
     _push_allowed: bool = field(default=False, repr=False)
+    _git: Optional[str] = field(default=None, init=False, repr=False)
+    _env: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _marker_path: Path = field(init=False, repr=False)
+    _hook_path: Path = field(init=False, repr=False)
+    _active_key: Optional[Path] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Resolve git, its environment and the fork's file paths once."""
+        self._git = shutil.which("git")
+        self._env = {**os.environ, **_GIT_ENV_OVERRIDES}
+        self._marker_path = self.repo_root / MARKER_FILE
+        self._hook_path = self.repo_root / ".git" / "hooks" / "pre-push"
 
     def _run_git(
         self,
@@ -92,10 +196,15 @@ class ShadowFork:
         Returns:
             Tuple of (success, stdout, stderr).
         """
+        if self._git is None:
+            logger.error("Git not found in PATH")
+            return False, "", "Git not found in PATH"
         try:
             result = subprocess.run(
-                ["git"] + args,
-                cwd=str(self.repo_root),
+                [self._git, *args],
+                cwd=self.repo_root,
+                env=self._env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -132,17 +241,9 @@ class ShadowFork:
             return stdout
         return None
 
-    def _get_marker_path(self) -> Path:
-        """Get the path to the shadow fork marker file."""
-        return self.repo_root / MARKER_FILE
-
-    def _get_pre_push_hook_path(self) -> Path:
-        """Get the path to the pre-push hook."""
-        return self.repo_root / ".git" / "hooks" / "pre-push"
-
     def _is_shadow_active(self) -> bool:
         """Check if a shadow fork is currently active."""
-        return self._get_marker_path().exists()
+        return self._marker_path.exists()
 
     def _generate_shadow_branch_name(self) -> str:
         """Generate a timestamped shadow branch name.
@@ -169,9 +270,18 @@ class ShadowFork:
         Raises:
             RuntimeError: If shadow fork creation fails.
         """
-        # Check if already in a shadow fork
+        # Check if this process already has a shadow fork here
+        active_key = self.repo_root.resolve()
+        active = _ACTIVE.get(active_key)
+        if active is not None:
+            raise RuntimeError(
+                f"Shadow fork already active. Existing shadow: {active.shadow_branch}. "
+                "Call cleanup() before creating a new shadow fork."
+            )
+
+        # Check if another process is in a shadow fork
         if self._is_shadow_active():
-            marker_path = self._get_marker_path()
+            marker_path = self._marker_path
             try:
                 content = marker_path.read_text().strip()
                 raise RuntimeError(
@@ -182,62 +292,62 @@ class ShadowFork:
                 # Marker exists but unreadable - continue with cleanup
                 self._cleanup_marker()
 
-        # Save current branch before switching
-        current = self._get_current_branch()
+        # Save current branch before switching. The same status call
+        # reports uncommitted changes, which would be carried over.
+        success, stdout, _ = self._run_git(
+            ["status", "--porcelain=v2", "--branch"],
+            check=False,
+        )
+        current, dirty = _parse_branch_status(stdout) if success else (None, False)
         if current is None:
             raise RuntimeError("Not on a branch. Cannot create shadow fork.")
         self.original_branch = current
         self.base_branch = base_branch
 
-        # Check for uncommitted changes that would be lost
-        success, stdout, _ = self._run_git(["status", "--porcelain"])
-        if success and stdout:
+        if dirty:
             logger.warning(
                 "Working tree has uncommitted changes. "
                 "These will be carried into the shadow branch."
             )
 
-        # Ensure base branch exists
-        success, _, stderr = self._run_git(
-            ["rev-parse", "--verify", base_branch],
-            check=False,
-        )
-        if not success:
-            raise RuntimeError(
-                f"Base branch '{base_branch}' does not exist: {stderr}"
-            )
-
         # Generate shadow branch name
         self.shadow_branch = self._generate_shadow_branch_name()
 
-        # Create and switch to shadow branch
+        # Create and switch to shadow branch; this fails on a missing base
+        # branch too, so the base is only verified to explain a failure
         success, _, stderr = self._run_git(
-            ["checkout", "-b", self.shadow_branch, base_branch]
+            ["checkout", "-b", self.shadow_branch, base_branch],
+            check=False,
         )
         if not success:
+            shadow_branch, self.shadow_branch = self.shadow_branch, None
+            base_exists, _, _ = self._run_git(
+                ["rev-parse", "--verify", "--quiet", f"{base_branch}^{{commit}}"],
+                check=False,
+            )
+            if not base_exists:
+                raise RuntimeError(
+                    f"Base branch '{base_branch}' does not exist: {stderr}"
+                )
             raise RuntimeError(
-                f"Failed to create shadow branch '{self.shadow_branch}': {stderr}"
+                f"Failed to create shadow branch '{shadow_branch}': {stderr}"
             )
 
         # Install push guard
         self.block_upstream_push()
 
         # Create marker file
-        marker_path = self._get_marker_path()
         try:
-            marker_content = (
-                f"shadow_branch={self.shadow_branch}\n"
-                f"original_branch={self.original_branch}\n"
-                f"base_branch={self.base_branch}\n"
-                f"created_at={datetime.now(timezone.utc).isoformat()}\n"
-            )
-            marker_path.write_text(marker_content)
+            self._write_marker()
         except IOError as e:
             # Rollback: delete shadow branch and return to original
             self._run_git(["checkout", self.original_branch], check=False)
             self._run_git(["branch", "-D", self.shadow_branch], check=False)
             raise RuntimeError(f"Failed to create marker file: {e}")
 
+        _ACTIVE[active_key] = self
+        self._active_key = active_key
+
         logger.info(
             "Created shadow fork '%s' from '%s'",
             self.shadow_branch,
@@ -264,6 +374,54 @@ class ShadowFork:
             return ""
         return stdout
 
+    def get_diff_into(self, sink: BinaryIO) -> int:
+        """Stream the diff of shadow branch against base branch into a sink.
+
+        Unlike get_diff(), the diff is copied in fixed-size chunks and never
+        decoded or held in memory as a whole, which suits large diffs bound
+        for a file or request body.
+
+        Args:
+            sink: Binary file-like object the raw diff bytes are written to.
+
+        Returns:
+            Number of bytes written, or -1 on error.
+        """
+        if self.shadow_branch is None:
+            logger.warning("No shadow branch active")
+            return -1
+        if self._git is None:
+            logger.error("Git not found in PATH")
+            return -1
+
+        args = ["diff", f"{self.base_branch}...{self.shadow_branch}"]
+        written = 0
+        try:
+            # stderr goes to a file rather than a second pipe: git could
+            # block on a full stderr pipe while stdout is still being read
+            with tempfile.TemporaryFile() as err, subprocess.Popen(
+                [self._git, *args],
+                cwd=self.repo_root,
+                env=self._env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=err,
+            ) as proc:
+                while chunk := proc.stdout.read(_DIFF_CHUNK_SIZE):
+                    sink.write(chunk)
+                    written += len(chunk)
+                returncode = proc.wait()
+                err.seek(0)
+                stderr = err.read()
+        except OSError as e:
+            logger.error("Git command failed: %s", e)
+            return -1
+
+        if returncode != 0:
+            logger.error("Failed to get diff: %s", stderr.decode(errors="replace").strip())
+            return -1
+        return written
+
     def commit_checkpoint(self, message: str) -> str:
         """Create a checkpoint commit in the shadow branch.
 
@@ -287,30 +445,34 @@ class ShadowFork:
         if not success:
             raise RuntimeError(f"Failed to stage changes: {stderr}")
 
-        # Check if there are changes to commit
-        success, stdout, _ = self._run_git(
-            ["diff", "--cached", "--quiet"],
+        # Create checkpoint commit. With core.abbrev=no the summary line
+        # carries the full SHA, and a clean index makes commit fail with
+        # "nothing to commit", so no separate diff/rev-parse is needed.
+        success, stdout, stderr = self._run_git(
+            [
+                "-c",
+                "core.abbrev=no",
+                "commit",
+                "-m",
+                f"[checkpoint] {message}",
+            ],
             check=False,
         )
-        if success:
-            # No changes to commit, return current HEAD
-            success, sha, _ = self._run_git(["rev-parse", "HEAD"])
-            if success:
-                logger.info("No changes to checkpoint, returning current HEAD")
-                return sha
-            raise RuntimeError("Failed to get current HEAD")
-
-        # Create checkpoint commit
-        success, _, stderr = self._run_git(
-            ["commit", "-m", f"[checkpoint] {message}"]
-        )
         if not success:
-            raise RuntimeError(f"Failed to create checkpoint: {stderr}")
-
-        # Get the commit SHA
-        success, sha, stderr = self._run_git(["rev-parse", "HEAD"])
-        if not success:
-            raise RuntimeError(f"Failed to get checkpoint SHA: {stderr}")
+            if "nothing to commit" in stdout:
+                # No changes to commit, return current HEAD
+                success, sha, _ = self._run_git(["rev-parse", "HEAD"])
+                if success:
+                    logger.info("No changes to checkpoint, returning current HEAD")
+                    return sha
+                raise RuntimeError("Failed to get current HEAD")
+            raise RuntimeError(f"Failed to create checkpoint: {stderr or stdout}")
+
+        sha = _parse_commit_sha(stdout)
+        if sha is None:
+            success, sha, stderr = self._run_git(["rev-parse", "HEAD"])
+            if not success:
+                raise RuntimeError(f"Failed to get checkpoint SHA: {stderr}")
 
         logger.info("Created checkpoint at %s: %s", sha[:8], message)
         return sha
@@ -398,45 +560,49 @@ class ShadowFork:
         This is called automatically during create() but can be
         called again if the hook is removed.
         """
-        hook_path = self._get_pre_push_hook_path()
+        hook_path = self._hook_path
 
         # Create hooks directory if needed
         hook_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if hook already exists
-        existing_content = ""
-        if hook_path.exists():
+        # Fast path: no hook yet, so create it executable in one go
+        try:
+            fd = os.open(hook_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o755)
+        except FileExistsError:
+            pass
+        except OSError as e:
+            logger.warning("Failed to install push guard: %s", e)
+            return
+        else:
             try:
-                existing_content = hook_path.read_text()
-            except IOError:
-                pass  # Hook unreadable - will be recreated
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_PUSH_GUARD_HOOK)
+                logger.debug("Installed push guard hook")
+            except OSError as e:
+                logger.warning("Failed to install push guard: %s", e)
+            return
+
+        # Hook already exists
+        existing_content = b""
+        try:
+            existing_content = hook_path.read_bytes()
+        except IOError:
+            pass  # Hook unreadable - will be recreated
 
         # Check if our guard is already installed
-        if PRE_PUSH_HOOK_MARKER in existing_content:
+        if _PUSH_GUARD_MARKER in existing_content:
             logger.debug("Push guard already installed")
             return
 
-        # Create or append to hook
-        hook_script = f"""
-{PRE_PUSH_HOOK_MARKER}
-# Block pushes while shadow fork is active
-if [ -f "{MARKER_FILE}" ]; then
-    echo "ERROR: Push blocked by shadow fork isolation."
-    echo "Shadow fork is active. Use allow_push() before pushing."
-    exit 1
-fi
-{PRE_PUSH_HOOK_MARKER}_END
-"""
-
         try:
             if existing_content:
                 # Append to existing hook
-                new_content = existing_content + "\n" + hook_script
+                new_content = existing_content + b"\n" + _PUSH_GUARD_BLOCK
             else:
                 # Create new hook with shebang
-                new_content = "#!/bin/sh\n" + hook_script
+                new_content = _PUSH_GUARD_HOOK
 
-            hook_path.write_text(new_content)
+            hook_path.write_bytes(new_content)
             # Make hook executable (Unix-like systems)
             hook_path.chmod(0o755)
             logger.debug("Installed push guard hook")
@@ -451,38 +617,35 @@ fi
         """
         self._push_allowed = True
 
-        hook_path = self._get_pre_push_hook_path()
-        if not hook_path.exists():
-            return
-
+        hook_path = self._hook_path
         try:
-            content = hook_path.read_text()
+            content = hook_path.read_bytes()
         except IOError:
-            return
+            return  # No hook (or unreadable) - nothing to remove
 
         # Remove our guard section
-        if PRE_PUSH_HOOK_MARKER not in content:
+        if _PUSH_GUARD_MARKER not in content:
             return
 
         # Remove everything between markers
-        lines = content.split("\n")
+        lines = content.split(b"\n")
         new_lines = []
         in_guard = False
 
         for line in lines:
-            if PRE_PUSH_HOOK_MARKER in line and "_END" not in line:
+            if _PUSH_GUARD_MARKER in line and b"_END" not in line:
                 in_guard = True
                 continue
-            if f"{PRE_PUSH_HOOK_MARKER}_END" in line:
+            if _PUSH_GUARD_END_MARKER in line:
                 in_guard = False
                 continue
             if not in_guard:
                 new_lines.append(line)
 
-        new_content = "\n".join(new_lines)
+        new_content = b"\n".join(new_lines)
 
         # Remove empty hooks
-        if new_content.strip() in ("", "#!/bin/sh"):
+        if new_content.strip() in (b"", b"#!/bin/sh"):
             try:
                 hook_path.unlink()
                 logger.debug("Removed empty push hook")
@@ -490,14 +653,44 @@ fi
                 pass  # Hook deletion failed - not critical
         else:
             try:
-                hook_path.write_text(new_content)
+                hook_path.write_bytes(new_content)
                 logger.debug("Removed push guard from hook")
             except IOError as e:
                 logger.warning("Failed to update push hook: %s", e)
 
+    def _write_marker(self) -> None:
+        """Atomically write the marker file describing this fork.
+
+        The content goes to a temporary file in repo_root that is then
+        renamed over the marker, so concurrent readers (e.g. the pre-push
+        hook or load_shadow_state) never see a partially written file.
+
+        Raises:
+            OSError: If the marker cannot be written.
+        """
+        content = (
+            f"shadow_branch={self.shadow_branch}\n"
+            f"original_branch={self.original_branch}\n"
+            f"base_branch={self.base_branch}\n"
+            f"created_at={datetime.now(timezone.utc).isoformat()}\n"
+        ).encode()
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f"{MARKER_FILE}.", suffix=".tmp", dir=self.repo_root
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_name, self._marker_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
     def _cleanup_marker(self) -> None:
         """Remove the marker file."""
-        marker_path = self._get_marker_path()
+        marker_path = self._marker_path
         try:
             if marker_path.exists():
                 marker_path.unlink()
@@ -550,6 +743,9 @@ fi
 
         # Remove marker file
         self._cleanup_marker()
+        if self._active_key is not None and _ACTIVE.get(self._active_key) is self:
+            del _ACTIVE[self._active_key]
+        self._active_key = None
 
         # Reset state
         self.shadow_branch = None
@@ -569,20 +765,35 @@ def load_shadow_state(repo_root: Path) -> Optional[ShadowFork]:
         ShadowFork instance with loaded state, or None if no active fork.
     """
     marker_path = repo_root / MARKER_FILE
-    if not marker_path.exists():
-        return None
-
     try:
-        content = marker_path.read_text()
-    except IOError:
+        st = marker_path.stat()
+    except OSError:
+        _STATE_CACHE.pop(marker_path, None)
         return None
 
-    # Parse marker file
-    state = {}
-    for line in content.strip().split("\n"):
-        if "=" in line:
-            key, value = line.split("=", 1)
-            state[key.strip()] = value.strip()
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _STATE_CACHE.get(marker_path)
+    if cached is not None and cached[0] == stamp:
+        state = cached[1]
+    else:
+        try:
+            fd = os.open(marker_path, os.O_RDONLY)
+            try:
+                # The marker is a few short lines; one read gets all of it
+                content = os.read(fd, max(st.st_size, 4096)).decode()
+            finally:
+                os.close(fd)
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        # Parse marker file
+        state = {
+            key.strip(): value.strip()
+            for key, _, value in (
+                line.partition("=") for line in content.splitlines() if "=" in line
+            )
+        }
+        _STATE_CACHE[marker_path] = (stamp, state)
 
     fork = ShadowFork(
         repo_root=repo_root,
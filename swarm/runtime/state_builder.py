@@ -22,18 +22,29 @@ Usage:
 
     # Verify stored state matches event log
     is_valid = verify_run_state("run-20251208-143022-abc123")
+
+    # Rebuild many independent runs across worker processes
+    states = rebuild_run_states(run_ids)
 """
 
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import Future
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .storage import (
+    EVENTS_FILE,
+    RUN_STATE_FILE,
     RUNS_DIR,
-    read_events,
+    get_run_path,
+    iter_event_offsets,
+    load_latest_snapshot,
     read_run_state,
+    write_snapshot,
 )
 from .types import (
     HandoffEnvelope,
@@ -51,6 +62,16 @@ from .types import (
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Write a snapshot when a rebuild had to replay at least this many events,
+# so the next rebuild only replays what was appended since.
+SNAPSHOT_EVERY_N_EVENTS = 200
+
+# (size, mtime_ns, inode) of a file; changes on append and on atomic replace
+_FileStamp = Tuple[int, int, int]
+
+# Run dir -> stamps of (run_state.json, events.jsonl) last verified as matching
+_VERIFIED: Dict[Path, Tuple[_FileStamp, _FileStamp]] = {}
+
 
 class StateRebuilderError(Exception):
     """Raised when state rebuilding fails."""
@@ -61,19 +82,28 @@ class StateRebuilderError(Exception):
 def rebuild_run_state(
     run_id: RunId,
     runs_dir: Path = RUNS_DIR,
+    use_snapshot: bool = True,
+    snapshot_every: int = SNAPSHOT_EVERY_N_EVENTS,
 ) -> RunState:
-    """Rebuild RunState by replaying all events from events.jsonl.
+    """Rebuild RunState by replaying events from events.jsonl.
 
-    This function reads all events from the event log and applies them
+    This function streams events from the event log and applies them
     in order to reconstruct the RunState. It is the canonical way to
     recover state after a crash or verify state integrity.
 
+    If a snapshot exists, replay starts from the snapshotted state and
+    only events with a later seq are applied. When a rebuild replays at
+    least ``snapshot_every`` events, it writes a new snapshot.
+
     The rebuilt state will match what would have been stored in
     run_state.json if all events had been processed correctly.
 
     Args:
         run_id: The unique run identifier.
         runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+        use_snapshot: If False, ignore snapshots and replay every event.
+        snapshot_every: Minimum number of replayed events that triggers
+            writing a snapshot. 0 disables snapshot writes.
 
     Returns:
         The reconstructed RunState.
@@ -87,10 +117,14 @@ def rebuild_run_state(
         >>> print(state.status)  # "running" or "succeeded" etc.
         >>> print(state.flow_key)  # "build" etc.
     """
-    events = read_events(run_id, runs_dir)
-
-    if not events:
-        raise FileNotFoundError(f"No events found for run: {run_id}")
+    snapshot = load_latest_snapshot(run_id, runs_dir) if use_snapshot else None
+    if snapshot is not None:
+        version, state, offset = snapshot
+        state = _replay_events(run_id, runs_dir, state, version, snapshot_every, offset)
+        if state is not None:
+            return state
+        # Snapshot does not line up with the log (log replaced or truncated)
+        logger.warning("Ignoring stale snapshot %d for run '%s'", version, run_id)
 
     # Initialize empty state - will be populated from events
     state = RunState(
@@ -98,10 +132,66 @@ def rebuild_run_state(
         flow_key="",
         status="pending",
     )
+    state = _replay_events(run_id, runs_dir, state, 0, snapshot_every)
+    if state is None:
+        raise FileNotFoundError(f"No events found for run: {run_id}")
+    return state
+
 
-    # Replay all events in order
-    for event in events:
+def _replay_events(
+    run_id: RunId,
+    runs_dir: Path,
+    state: RunState,
+    version: int,
+    snapshot_every: int,
+    offset: int = 0,
+) -> Optional[RunState]:
+    """Stream events after ``version`` from the log and fold them into state.
+
+    With a snapshot offset, reading starts at the line of event ``version``
+    itself, so nothing the snapshot covers is decoded. Without one, older
+    events are decoded and skipped.
+
+    Returns None if the log holds no event with seq >= version, i.e. the log
+    is empty or (for version > 0) the snapshot does not match it.
+    """
+    applied = 0
+    last_seq = version
+    last_offset = offset
+    covered = False
+    # Raw envelope dicts by step, oldest first; the newest that decodes wins
+    pending_envelopes: Dict[str, List[Dict[str, Any]]] = {}
+
+    for line_offset, event in iter_event_offsets(run_id, runs_dir, offset):
+        if offset and not covered:
+            # The offset must land exactly on the snapshot's own event
+            if line_offset != offset or event.seq != version:
+                return None
+            covered = True
+            continue
+        if version and event.seq <= version:
+            # Seeing the snapshot's own event confirms the log still covers it
+            covered = covered or event.seq == version
+            continue
+        _defer_envelope(event, pending_envelopes)
         state = _apply_event(state, event)
+        applied += 1
+        last_seq = event.seq
+        last_offset = line_offset
+
+    for step_id, envelopes in pending_envelopes.items():
+        for envelope_data in reversed(envelopes):
+            if _store_envelope(state, step_id, envelope_data):
+                break
+
+    if not applied and not covered:
+        return None
+
+    if snapshot_every and applied >= snapshot_every and last_seq > version:
+        try:
+            write_snapshot(run_id, last_seq, state, runs_dir, offset=last_offset)
+        except OSError as e:
+            logger.warning("Failed to write snapshot for run '%s': %s", run_id, e)
 
     return state
 
@@ -125,61 +215,17 @@ def _apply_event(state: RunState, event: RunEvent) -> RunState:
     # Update timestamp from event
     state.timestamp = event.ts
 
-    # Apply event based on kind
-    if kind == "run_started":
-        state = _apply_run_started(state, event, payload)
-
-    elif kind == "step_started":
-        state = _apply_step_started(state, event, payload)
-
-    elif kind == "step_completed":
-        state = _apply_step_completed(state, event, payload)
-
-    elif kind == "route_decision":
-        state = _apply_route_decision(state, event, payload)
-
-    elif kind == "checkpoint":
-        state = _apply_checkpoint(state, event, payload)
-
-    elif kind == "flow_paused":
-        state = _apply_flow_paused(state, event, payload)
-
-    elif kind == "run_stopped":
-        state = _apply_run_stopped(state, event, payload)
-
-    elif kind == "run_completed":
-        state = _apply_run_completed(state, event, payload)
-
-    elif kind == "run_failed":
-        state = _apply_run_failed(state, event, payload)
-
-    elif kind == "flow_started":
-        state = _apply_flow_started(state, event, payload)
-
-    elif kind == "flow_completed":
-        state = _apply_flow_completed(state, event, payload)
-
-    elif kind == "macro_route":
-        state = _apply_macro_route(state, event, payload)
-
-    elif kind == "detour_started":
-        state = _apply_detour_started(state, event, payload)
-
-    elif kind == "detour_completed":
-        state = _apply_detour_completed(state, event, payload)
-
-    elif kind == "node_injected":
-        state = _apply_node_injected(state, event, payload)
+    handler = _EVENT_HANDLERS.get(kind)
+    if handler is not None:
+        return handler(state, event, payload)
 
     # Log unhandled event types at debug level (they may be informational)
-    else:
-        logger.debug(
-            "Unhandled event kind '%s' for run '%s' at step '%s'",
-            kind,
-            state.run_id,
-            event.step_id,
-        )
-
+    logger.debug(
+        "Unhandled event kind '%s' for run '%s' at step '%s'",
+        kind,
+        state.run_id,
+        event.step_id,
+    )
     return state
 
 
@@ -245,15 +291,7 @@ def _apply_step_completed(
         # If envelope data is in payload, parse and store it
         envelope_data = payload.get("envelope")
         if envelope_data:
-            try:
-                envelope = handoff_envelope_from_dict(envelope_data)
-                state.handoff_envelopes[step_id] = envelope
-            except (KeyError, TypeError) as e:
-                logger.warning(
-                    "Failed to parse envelope for step '%s': %s",
-                    step_id,
-                    e,
-                )
+            _store_envelope(state, step_id, envelope_data)
 
         # Update step_index if provided
         if "next_step_index" in payload:
@@ -262,6 +300,41 @@ def _apply_step_completed(
     return state
 
 
+def _store_envelope(state: RunState, step_id: str, envelope_data: Dict[str, Any]) -> bool:
+    """Parse a serialized HandoffEnvelope and store it for step_id.
+
+    Returns:
+        True if the envelope was parsed and stored.
+    """
+    try:
+        state.handoff_envelopes[step_id] = handoff_envelope_from_dict(envelope_data)
+    except (KeyError, TypeError) as e:
+        logger.warning(
+            "Failed to parse envelope for step '%s': %s",
+            step_id,
+            e,
+        )
+        return False
+    return True
+
+
+def _defer_envelope(event: RunEvent, pending: Dict[str, List[Dict[str, Any]]]) -> None:
+    """Move a step_completed envelope out of the payload for later decoding.
+
+    Steps inside loops complete many times and each completion overwrites
+    the previous envelope, so during a full replay envelopes are decoded
+    newest first and only until one parses; a malformed last envelope
+    falls back to the one before it, as eager decoding would. Events come
+    straight from the log reader and are not shared, so popping from the
+    payload is safe.
+    """
+    if event.kind != "step_completed" or not event.payload:
+        return
+    step_id = event.step_id or event.payload.get("step_id")
+    if step_id and event.payload.get("envelope"):
+        pending.setdefault(step_id, []).append(event.payload.pop("envelope"))
+
+
 def _apply_route_decision(
     state: RunState,
     event: RunEvent,
@@ -308,6 +381,9 @@ def _apply_checkpoint(
             state.current_step_id = snapshot["current_step_id"]
         if "loop_state" in snapshot:
             state.loop_state.update(snapshot["loop_state"])
+        if "flow_transition_history" in snapshot:
+            # The checkpoint carries the full history; replace, don't extend
+            state.flow_transition_history = list(snapshot["flow_transition_history"])
 
     return state
 
@@ -537,6 +613,29 @@ def _apply_node_injected(
     return state
 
 
+# Dispatch table for _apply_event: one dict lookup per replayed event instead
+# of walking an if/elif chain of string comparisons.
+_EventHandler = Callable[[RunState, RunEvent, Dict[str, Any]], RunState]
+
+_EVENT_HANDLERS: Dict[str, _EventHandler] = {
+    "run_started": _apply_run_started,
+    "step_started": _apply_step_started,
+    "step_completed": _apply_step_completed,
+    "route_decision": _apply_route_decision,
+    "checkpoint": _apply_checkpoint,
+    "flow_paused": _apply_flow_paused,
+    "run_stopped": _apply_run_stopped,
+    "run_completed": _apply_run_completed,
+    "run_failed": _apply_run_failed,
+    "flow_started": _apply_flow_started,
+    "flow_completed": _apply_flow_completed,
+    "macro_route": _apply_macro_route,
+    "detour_started": _apply_detour_started,
+    "detour_completed": _apply_detour_completed,
+    "node_injected": _apply_node_injected,
+}
+
+
 def verify_run_state(
     run_id: RunId,
     runs_dir: Path = RUNS_DIR,
@@ -557,11 +656,23 @@ def verify_run_state(
     Note:
         Returns True if no stored state exists (nothing to verify against).
         Returns False if events exist but no stored state exists.
+        A successful result is remembered per run and reused, without a
+        rebuild, until run_state.json or events.jsonl changes on disk.
     """
+    run_path = get_run_path(run_id, runs_dir)
+    stamps = _verify_stamps(run_path)
+    if stamps is not None and _VERIFIED.get(run_path) == stamps:
+        # Neither file changed since the last successful verification
+        return True
+
     stored_state = read_run_state(run_id, runs_dir)
 
     try:
-        rebuilt_state = rebuild_run_state(run_id, runs_dir)
+        # Replay the full log and write no snapshot: the check must not
+        # trust, or produce, the snapshots it is meant to audit
+        rebuilt_state = rebuild_run_state(
+            run_id, runs_dir, use_snapshot=False, snapshot_every=0
+        )
     except FileNotFoundError:
         # No events to rebuild from - this is OK if no state either
         return stored_state is None
@@ -623,9 +734,24 @@ def verify_run_state(
         )
         return False
 
+    if stamps is not None and stamps == _verify_stamps(run_path):
+        _VERIFIED[run_path] = stamps
     return True
 
 
+def _verify_stamps(run_path: Path) -> Optional[Tuple[_FileStamp, _FileStamp]]:
+    """Stat stamps of run_state.json and events.jsonl, or None if either is missing."""
+    try:
+        state_st = os.stat(run_path / RUN_STATE_FILE)
+        events_st = os.stat(run_path / EVENTS_FILE)
+    except OSError:
+        return None
+    return (
+        (state_st.st_size, state_st.st_mtime_ns, state_st.st_ino),
+        (events_st.st_size, events_st.st_mtime_ns, events_st.st_ino),
+    )
+
+
 def recover_run_state(
     run_id: RunId,
     runs_dir: Path = RUNS_DIR,
@@ -640,7 +766,8 @@ def recover_run_state(
     Args:
         run_id: The unique run identifier.
         runs_dir: Base directory for runs. Defaults to RUNS_DIR.
-        force: If True, always rebuild even if stored state is valid.
+        force: If True, always rebuild even if stored state is valid, and
+            replay the full event log without using snapshots.
 
     Returns:
         The recovered RunState, or None if recovery failed.
@@ -655,7 +782,7 @@ def recover_run_state(
             return stored_state
 
     try:
-        return rebuild_run_state(run_id, runs_dir)
+        return rebuild_run_state(run_id, runs_dir, use_snapshot=not force)
     except FileNotFoundError:
         logger.warning(
             "Cannot recover state for run '%s': no events found",
@@ -669,3 +796,52 @@ def recover_run_state(
             e,
         )
         return None
+
+
+def rebuild_run_states(
+    run_ids: Sequence[RunId],
+    runs_dir: Path = RUNS_DIR,
+    max_workers: Optional[int] = None,
+) -> Dict[RunId, RunState]:
+    """Rebuild several runs, sharding the replays across worker processes.
+
+    Each run has its own event log, so rebuilds are independent and the
+    replay loop (CPU-bound JSON decode + fold) scales with cores. A single
+    run, or max_workers=1, is rebuilt in-process without starting a pool.
+
+    Args:
+        run_ids: Runs to rebuild.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+        max_workers: Worker process count. Defaults to the CPU count.
+
+    Returns:
+        Mapping of run_id to rebuilt RunState. Runs that could not be
+        rebuilt (no events, unreadable log) are logged and omitted.
+    """
+    states: Dict[RunId, RunState] = {}
+
+    def _collect(run_id: RunId, result: Callable[[], RunState]) -> None:
+        try:
+            states[run_id] = result()
+        except FileNotFoundError:
+            logger.warning("Cannot rebuild state for run '%s': no events found", run_id)
+        except Exception as e:
+            logger.error("Failed to rebuild state for run '%s': %s", run_id, e)
+
+    if len(run_ids) <= 1 or max_workers == 1:
+        for run_id in run_ids:
+            _collect(run_id, partial(rebuild_run_state, run_id, runs_dir))
+        return states
+
+    # Deferred: concurrent.futures.process pulls in multiprocessing, which
+    # every `import swarm.runtime` would otherwise pay for
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures: Dict[RunId, Future[RunState]] = {
+            run_id: executor.submit(rebuild_run_state, run_id, runs_dir) for run_id in run_ids
+        }
+        for run_id, future in futures.items():
+            _collect(run_id, future.result)
+
+    return states
@@ -28,6 +28,7 @@ Usage:
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -359,6 +360,7 @@ def _step_result_to_dict(step_result: Any) -> Dict[str, Any]:
 
     The step_result can be:
     - A dict: returned as-is
+    - Any other Mapping (e.g. a read-only MappingProxyType): copied to a dict
     - A StepResult dataclass: converted to dict with status, output, etc.
     - An object with to_dict(): uses that method
     - Any other object: extracts common attributes
@@ -375,6 +377,9 @@ def _step_result_to_dict(step_result: Any) -> Dict[str, Any]:
     if isinstance(step_result, dict):
         return step_result
 
+    if isinstance(step_result, Mapping):
+        return dict(step_result)
+
     # Try to_dict() method first (common pattern for dataclasses with custom serialization)
     if hasattr(step_result, "to_dict") and callable(step_result.to_dict):
         return step_result.to_dict()
@@ -10,6 +10,8 @@ The storage layout is:
         spec.json          # RunSpec serialized
         events.jsonl       # newline-delimited RunEvent objects
         run_state.json     # RunState serialized (durable program counter)
+        snapshots/         # RunState snapshots for fast event replay
+          <seq>.json       # State after applying events up to seq
         <flow_key>/        # existing artifact directories (signal/, plan/, etc.)
           handoff/        # HandoffEnvelope JSON files for each step
             <step_id>.json
@@ -20,9 +22,10 @@ Usage:
         get_run_path, run_exists, create_run_dir,
         write_spec, read_spec,
         write_summary, read_summary, update_summary, finalize_run_success,
-        append_event, read_events,
+        append_event, read_events, iter_events, iter_event_offsets,
         query_navigator_events, summarize_navigator_events,  # For Wisdom analysis
         write_run_state, read_run_state, update_run_state,
+        write_snapshot, load_latest_snapshot,
         write_envelope, read_envelope, list_envelopes,
         commit_step_completion,
         list_runs, discover_legacy_runs,
@@ -37,7 +40,7 @@ import os
 import tempfile
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .types import (
     HandoffEnvelope,
@@ -70,8 +73,21 @@ META_FILE = "meta.json"
 SPEC_FILE = "spec.json"
 EVENTS_FILE = "events.jsonl"
 RUN_STATE_FILE = "run_state.json"
+SNAPSHOTS_DIR = "snapshots"
 LEGACY_META_FILE = "run.json"  # Old-style optional metadata
 
+# Read buffer for streaming events.jsonl; large logs are read sequentially
+_EVENTS_READ_BUFFER = 1 << 20
+
+# Reused codecs for the event log. json.dumps builds a fresh JSONEncoder on
+# every call whenever a non-default option (ensure_ascii) is passed, and
+# json.loads adds type checks per call; binding once trims both off the
+# append/replay hot path. Output is byte-identical to json.dumps.
+_encode_event_line = json.JSONEncoder(ensure_ascii=False).encode
+_decode_event_line = json.JSONDecoder().decode
+
+_EVENTS_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
 # -----------------------------------------------------------------------------
 # Per-run locking for thread safety
 # -----------------------------------------------------------------------------
@@ -92,6 +108,8 @@ _RUN_LOCKS_LOCK = threading.Lock()
 
 _run_sequences: Dict[str, int] = {}
 _seq_lock = threading.Lock()
+# run_id -> (events.jsonl path, byte offset already folded into _run_sequences)
+_seq_scan_offsets: Dict[str, Tuple[Path, int]] = {}
 
 
 def _next_seq(run_id: str) -> int:
@@ -119,18 +137,41 @@ def _init_seq_from_disk(run_id: str, run_dir: Path) -> None:
     after a restart. It scans existing events to find the highest sequence
     number and initializes the counter to continue from there.
 
+    create_run_dir (and so every append_event) calls this, so the byte
+    offset scanned so far is remembered per run and only lines appended
+    since then are read. A full rescan happens when the in-memory counter
+    is missing (restart), the run moved, or the file shrank.
+
     Args:
         run_id: The unique run identifier.
         run_dir: Path to the run directory.
     """
     events_file = run_dir / EVENTS_FILE
-    if not events_file.exists():
+    try:
+        size = events_file.stat().st_size
+    except OSError:
         return
 
+    with _seq_lock:
+        scanned = _seq_scan_offsets.get(run_id)
+        if run_id in _run_sequences and scanned is not None and scanned[0] == events_file:
+            offset = scanned[1]
+        else:
+            offset = 0
+    if offset == size:
+        return
+    if offset > size:
+        offset = 0
+
     max_seq = 0
     try:
-        with open(events_file, "r", encoding="utf-8") as f:
+        with open(events_file, "rb") as f:
+            f.seek(offset)
             for line in f:
+                if not line.endswith(b"\n"):
+                    # Partial trailing line from an in-flight write
+                    break
+                offset += len(line)
                 if line.strip():
                     try:
                         event = json.loads(line)
@@ -140,8 +181,9 @@ def _init_seq_from_disk(run_id: str, run_dir: Path) -> None:
     except (OSError, IOError):
         pass
 
-    if max_seq > 0:
-        with _seq_lock:
+    with _seq_lock:
+        _seq_scan_offsets[run_id] = (events_file, offset)
+        if max_seq > 0:
             # Only update if disk has higher seq than in-memory
             current = _run_sequences.get(run_id, 0)
             if max_seq > current:
@@ -149,6 +191,18 @@ def _init_seq_from_disk(run_id: str, run_dir: Path) -> None:
                 logger.debug("Recovered sequence counter for run '%s': max_seq=%d", run_id, max_seq)
 
 
+def _mark_seq_scanned(run_id: str, events_file: Path, start: int, end: int) -> None:
+    """Extend the scanned range over a line this process wrote at [start, end).
+
+    The range only grows when the line began exactly at the scanned EOF.
+    Otherwise another writer appended in between, and the next
+    _init_seq_from_disk must read those lines from the old offset.
+    """
+    with _seq_lock:
+        if _seq_scan_offsets.get(run_id) == (events_file, start):
+            _seq_scan_offsets[run_id] = (events_file, end)
+
+
 def _get_run_lock(run_id: RunId) -> threading.Lock:
     """Get or create a lock for a specific run ID.
 
@@ -173,7 +227,7 @@ def _get_run_lock(run_id: RunId) -> threading.Lock:
 # -----------------------------------------------------------------------------
 
 
-def _atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
+def _atomic_write_json(path: Path, data: Any, indent: Optional[int] = 2) -> None:
     """Write JSON data to a file atomically.
 
     Uses a temporary file + os.replace pattern to ensure atomicity.
@@ -182,7 +236,7 @@ def _atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
     Args:
         path: Destination file path.
         data: JSON-serializable data.
-        indent: JSON indentation level.
+        indent: JSON indentation level (None for compact output).
     """
     parent = path.parent
     parent.mkdir(parents=True, exist_ok=True)
@@ -195,7 +249,10 @@ def _atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
     )
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+            # One dumps() + write() rather than json.dump(): dump() streams
+            # through the pure-Python iterencode, roughly 4x slower than the
+            # C encoder used by dumps() for the same bytes.
+            f.write(json.dumps(data, indent=indent, ensure_ascii=False))
             f.flush()
             os.fsync(f.fileno())  # Ensure data is on disk
 
@@ -616,11 +673,19 @@ def append_event(run_id: RunId, event: RunEvent, runs_dir: Path = RUNS_DIR) -> N
             event.seq = _next_seq(run_id)
 
             data = run_event_to_dict(event)
-            line = json.dumps(data, ensure_ascii=False)
-
-            with open(events_path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
-                f.flush()  # Ensure data reaches OS buffer
+            line = (_encode_event_line(data) + "\n").encode("utf-8")
+
+            # Raw O_APPEND write: one syscall per event, no buffered/text
+            # wrapper to build, and the line lands at EOF in one piece
+            fd = os.open(events_path, _EVENTS_APPEND_FLAGS, 0o644)
+            try:
+                view = memoryview(line)
+                while view:
+                    view = view[os.write(fd, view):]
+                end = os.lseek(fd, 0, os.SEEK_CUR)
+                _mark_seq_scanned(run_id, events_path, end - len(line), end)
+            finally:
+                os.close(fd)
         except (OSError, IOError) as e:
             logger.warning(
                 "Failed to append event for run '%s' at %s: %s",
@@ -638,6 +703,72 @@ def append_event(run_id: RunId, event: RunEvent, runs_dir: Path = RUNS_DIR) -> N
             # Don't re-raise - malformed events shouldn't crash the run
 
 
+def iter_events(
+    run_id: RunId, runs_dir: Path = RUNS_DIR, since_seq: int = 0
+) -> Iterator[RunEvent]:
+    """Stream events from events.jsonl one at a time.
+
+    Unlike read_events, only one decoded event is live at a time, so
+    replaying a long log does not materialize it in memory.
+
+    Args:
+        run_id: The unique run identifier.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+        since_seq: Only yield events with a seq greater than this value.
+            Defaults to 0 (all events, including legacy events without seq).
+
+    Yields:
+        RunEvent objects in chronological order. Yields nothing if the
+        file doesn't exist, is empty, or cannot be opened.
+    """
+    for _, event in iter_event_offsets(run_id, runs_dir):
+        if since_seq and event.seq <= since_seq:
+            continue
+        yield event
+
+
+def iter_event_offsets(
+    run_id: RunId, runs_dir: Path = RUNS_DIR, start_offset: int = 0
+) -> Iterator[Tuple[int, RunEvent]]:
+    """Stream events together with the byte offset at which each line starts.
+
+    Passing a previously yielded offset back as start_offset resumes at
+    that event without reading or decoding anything before it; snapshots
+    record one so rebuilds can skip the prefix they already cover.
+
+    Args:
+        run_id: The unique run identifier.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+        start_offset: Byte offset of a line start to begin reading from.
+
+    Yields:
+        (offset, RunEvent) tuples in file order. Malformed lines are skipped.
+    """
+    events_path = get_run_path(run_id, runs_dir) / EVENTS_FILE
+
+    try:
+        f = open(events_path, "rb", buffering=_EVENTS_READ_BUFFER)
+    except OSError:
+        return
+
+    with f:
+        if start_offset:
+            f.seek(start_offset)
+        offset = start_offset
+        for raw in f:
+            line_offset = offset
+            offset += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                event = run_event_from_dict(_decode_event_line(line.decode("utf-8")))
+            except (UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError):
+                # Skip malformed lines
+                continue
+            yield line_offset, event
+
+
 def read_events(run_id: RunId, runs_dir: Path = RUNS_DIR) -> List[RunEvent]:
     """Read all events from events.jsonl.
 
@@ -649,30 +780,11 @@ def read_events(run_id: RunId, runs_dir: Path = RUNS_DIR) -> List[RunEvent]:
         List of RunEvent objects in chronological order.
         Returns empty list if file doesn't exist or is empty.
     """
-    run_path = get_run_path(run_id, runs_dir)
-    events_path = run_path / EVENTS_FILE
-
-    if not events_path.exists():
-        return []
-
-    events: List[RunEvent] = []
     try:
-        with open(events_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    events.append(run_event_from_dict(data))
-                except (json.JSONDecodeError, KeyError, TypeError):
-                    # Skip malformed lines
-                    continue
+        return list(iter_events(run_id, runs_dir))
     except OSError:
         return []
 
-    return events
-
 
 # Navigator event types for Wisdom analysis
 NAVIGATOR_EVENT_TYPES = frozenset(
@@ -1068,6 +1180,90 @@ def update_run_state(run_id: RunId, updates: Dict[str, Any], runs_dir: Path = RU
         return updated_state
 
 
+# -----------------------------------------------------------------------------
+# RunState snapshots (for bounded event replay)
+# -----------------------------------------------------------------------------
+
+
+def write_snapshot(
+    run_id: RunId,
+    version: int,
+    state: RunState,
+    runs_dir: Path = RUNS_DIR,
+    offset: int = 0,
+) -> Path:
+    """Write a RunState snapshot taken after applying events up to a seq.
+
+    Snapshots let the state builder replay only events newer than the
+    snapshot. Only the newest snapshot is kept; older ones are removed
+    once the new one is on disk.
+
+    Args:
+        run_id: The unique run identifier.
+        version: The seq of the last event folded into the state.
+        state: The RunState as of that event.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+        offset: Byte offset in events.jsonl where the line of event
+            ``version`` starts (see iter_event_offsets). 0 if unknown.
+
+    Returns:
+        Path to the written snapshot file.
+    """
+    snapshots_path = get_run_path(run_id, runs_dir) / SNAPSHOTS_DIR
+    snapshot_path = snapshots_path / f"{version}.json"
+
+    _atomic_write_json(
+        snapshot_path,
+        {"version": version, "offset": offset, "state": run_state_to_dict(state)},
+        indent=None,
+    )
+
+    for old_path in snapshots_path.glob("*.json"):
+        if old_path != snapshot_path:
+            try:
+                old_path.unlink()
+            except OSError:
+                pass
+
+    return snapshot_path
+
+
+def load_latest_snapshot(
+    run_id: RunId,
+    runs_dir: Path = RUNS_DIR,
+) -> Optional[Tuple[int, RunState, int]]:
+    """Load the newest readable RunState snapshot for a run.
+
+    Args:
+        run_id: The unique run identifier.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+
+    Returns:
+        Tuple of (version, state, offset), or None if no valid snapshot
+        exists. offset is 0 for snapshots written without one.
+    """
+    snapshots_path = get_run_path(run_id, runs_dir) / SNAPSHOTS_DIR
+
+    try:
+        versions = sorted(
+            (int(path.stem) for path in snapshots_path.glob("*.json") if path.stem.isdigit()),
+            reverse=True,
+        )
+    except OSError:
+        return None
+
+    for version in versions:
+        data = _load_json_safe(snapshots_path / f"{version}.json", run_id, "snapshot")
+        if data is None:
+            continue
+        try:
+            return version, run_state_from_dict(data["state"]), int(data.get("offset", 0))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Invalid snapshot %d for run '%s': %s", version, run_id, e)
+
+    return None
+
+
 # -----------------------------------------------------------------------------
 # HandoffEnvelope I/O (for per-step handoff artifacts)
 # -----------------------------------------------------------------------------
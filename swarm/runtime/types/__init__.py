@@ -303,7 +303,7 @@ class RunSummary:
     description: Optional[str] = None  # Human-readable run description
 
 
-@dataclass
+@dataclass(slots=True)
 class RunEvent:
     """A single event in a run's timeline.
 
@@ -512,7 +512,9 @@ def run_event_from_dict(data: Dict[str, Any]) -> RunEvent:
         ts=_iso_to_datetime(data.get("ts")) or datetime.now(timezone.utc),
         kind=data.get("kind", "unknown"),
         flow_key=data.get("flow_key", ""),
-        event_id=data.get("event_id", _generate_event_id()),
+        # Only mint an ID for legacy events; a .get() default would run on
+        # every decoded event
+        event_id=data["event_id"] if "event_id" in data else _generate_event_id(),
         seq=data.get("seq", 0),
         step_id=data.get("step_id"),
         agent_key=data.get("agent_key"),
@@ -643,7 +645,7 @@ def handoff_envelope_from_dict(data: Dict[str, Any]) -> HandoffEnvelope:
 # -----------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class InterruptionFrame:
     """Frame representing an interruption point in the execution stack.
 
@@ -671,7 +673,7 @@ class InterruptionFrame:
     sidequest_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumePoint:
     """A saved resume point for continuation after interruption.
 
@@ -713,7 +715,7 @@ class InjectedNode:
     routing_override: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InjectedNodeSpec:
     """Full execution specification for a dynamically injected node.
 
@@ -744,7 +746,7 @@ class InjectedNodeSpec:
     total_in_sequence: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class RunState:
     """Durable program counter for stepwise flow execution with detour support.
 
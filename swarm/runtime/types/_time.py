@@ -13,7 +13,8 @@ def _datetime_to_iso(dt: Optional[datetime]) -> Optional[str]:
     """Convert datetime to ISO format string with Z suffix."""
     if dt is None:
         return None
-    return dt.isoformat() + "Z" if not dt.isoformat().endswith("Z") else dt.isoformat()
+    iso = dt.isoformat()
+    return iso if iso.endswith("Z") else iso + "Z"
 
 
 def _iso_to_datetime(iso_str: Optional[str]) -> Optional[datetime]:
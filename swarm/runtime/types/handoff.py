@@ -28,7 +28,7 @@ from .routing import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class HandoffEnvelope:
     """Durable per-step handoff artifact for cross-step communication.
 
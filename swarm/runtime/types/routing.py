@@ -337,7 +337,7 @@ class RoutingCandidate:
     is_default: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingSignal:
     """Normalized routing decision signal for stepwise flow execution.
 
@@ -540,8 +540,8 @@ def routing_explanation_from_dict(data: Dict[str, Any]) -> RoutingExplanation:
     ]
 
     llm_reasoning = None
-    if "llm_reasoning" in data:
-        llm_data = data["llm_reasoning"]
+    llm_data = data.get("llm_reasoning")
+    if llm_data is not None:
         llm_reasoning = LLMReasoning(
             model_used=llm_data.get("model_used", ""),
             prompt_hash=llm_data.get("prompt_hash", ""),
@@ -562,16 +562,16 @@ def routing_explanation_from_dict(data: Dict[str, Any]) -> RoutingExplanation:
         )
 
     cel_evaluation = None
-    if "cel_evaluation" in data:
-        cel_data = data["cel_evaluation"]
+    cel_data = data.get("cel_evaluation")
+    if cel_data is not None:
         cel_evaluation = CELEvaluation(
             expressions_evaluated=cel_data.get("expressions_evaluated", []),
             context_variables=cel_data.get("context_variables", {}),
         )
 
     microloop_context = None
-    if "microloop_context" in data:
-        mc_data = data["microloop_context"]
+    mc_data = data.get("microloop_context")
+    if mc_data is not None:
         microloop_context = MicroloopContext(
             iteration=mc_data.get("iteration", 1),
             max_iterations=mc_data.get("max_iterations", 3),
@@ -582,8 +582,8 @@ def routing_explanation_from_dict(data: Dict[str, Any]) -> RoutingExplanation:
         )
 
     metrics = None
-    if "metrics" in data:
-        m_data = data["metrics"]
+    m_data = data.get("metrics")
+    if m_data is not None:
         metrics = DecisionMetrics(
             total_time_ms=m_data.get("total_time_ms", 0),
             edges_total=m_data.get("edges_total", 0),
@@ -593,8 +593,8 @@ def routing_explanation_from_dict(data: Dict[str, Any]) -> RoutingExplanation:
         )
 
     stall_context = None
-    if "stall_context" in data:
-        sc_data = data["stall_context"]
+    sc_data = data.get("stall_context")
+    if sc_data is not None:
         stall_context = StallContext(
             is_stalled=sc_data.get("is_stalled", False),
             stall_count=sc_data.get("stall_count", 0),
@@ -54,16 +54,27 @@ from __future__ import annotations
 
 import logging
 import subprocess
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from .shadow_fork import ShadowFork, load_shadow_state
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on recorded boundary violations per workspace. A runaway step
+# can trigger thousands of violations; only the most recent are kept.
+MAX_BOUNDARY_VIOLATIONS = 10_000
+
+# Flows that operate on the real repo by default (Deploy actually merges).
+# Every other flow gets a shadow workspace for safety.
+REAL_WORKSPACE_FLOWS = frozenset({"deploy"})
+
 
 # =============================================================================
 # Data Classes
@@ -125,7 +136,7 @@ class PromotionResult:
     summary: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundaryViolation:
     """A detected boundary violation (file write outside workspace).
 
@@ -142,6 +153,54 @@ class BoundaryViolation:
     step_id: str = ""
 
 
+# =============================================================================
+# Git Output Helpers
+# =============================================================================
+
+
+# Porcelain status letter -> change bucket. The index column is checked
+# first, then the worktree column ("??" lands in untracked either way).
+_STATUS_BUCKETS: Dict[str, str] = {
+    "A": "added",
+    "C": "added",
+    "M": "modified",
+    "R": "modified",
+    "D": "deleted",
+    "?": "untracked",
+}
+
+
+def _numstat_totals(numstat: bytes) -> Dict[str, int]:
+    """Sum `git diff --numstat -z` output into diff statistics.
+
+    Each entry is ``<insertions>\t<deletions>\t<path>`` terminated by NUL.
+    Binary files report ``-`` for both counts and only count as changed
+    files. Renames emit an empty path followed by the old and new paths as
+    separate NUL-terminated fields, which carry no counts and are skipped.
+
+    Unlike the ``--stat`` summary line, this format is machine-readable and
+    not affected by the user's locale.
+
+    Args:
+        numstat: Raw output of ``git diff --numstat -z``.
+
+    Returns:
+        Dict with files_changed, insertions, and deletions counts.
+    """
+    stats = {"files_changed": 0, "insertions": 0, "deletions": 0}
+    for entry in numstat.split(b"\0"):
+        parts = entry.split(b"\t", 2)
+        if len(parts) != 3:
+            continue  # Empty trailer or rename path field
+        insertions, deletions, _ = parts
+        stats["files_changed"] += 1
+        if insertions != b"-":
+            stats["insertions"] += int(insertions)
+        if deletions != b"-":
+            stats["deletions"] += int(deletions)
+    return stats
+
+
 # =============================================================================
 # Abstract Workspace Interface
 # =============================================================================
@@ -218,15 +277,17 @@ class Workspace(ABC):
 
 
 # =============================================================================
-# Real Workspace Implementation
+# Shared Git-Backed Base
 # =============================================================================
 
 
-class RealWorkspace(Workspace):
-    """Workspace that operates directly on the real repository.
+class _GitWorkspaceBase(Workspace):
+    """Shared implementation for workspaces backed by a git checkout.
 
-    This is the simplest workspace - it just wraps the repo root.
-    Used for Deploy flow where we actually want to merge.
+    Both the real and shadow workspaces live in the same repository
+    location, so path resolution, git invocation, and status parsing are
+    identical. Subclasses only provide the mode-specific behavior:
+    snapshot_forensics, promote, cleanup, and is_shadow.
     """
 
     def __init__(
@@ -234,7 +295,7 @@ class RealWorkspace(Workspace):
         repo_root: Path,
         run_id: str,
     ):
-        """Initialize real workspace.
+        """Initialize the git-backed workspace.
 
         Args:
             repo_root: Path to the repository root.
@@ -242,20 +303,85 @@ class RealWorkspace(Workspace):
         """
         self._repo_root = Path(repo_root).resolve()
         self._run_id = run_id
+        # Both inputs are fixed for the workspace's lifetime
+        self._run_base = self._repo_root / "swarm" / "runs" / run_id
 
     def root(self) -> Path:
         """Get the repository root."""
         return self._repo_root
 
+    @property
+    def run_base(self) -> Path:
+        """Get RUN_BASE path."""
+        return self._run_base
+
+    def _run_git(self, args: List[str]) -> bytes:
+        """Run a git command and return raw stdout bytes.
+
+        Output is not decoded here; callers decode only what they keep as
+        text. stderr is discarded since no caller reads it.
+        """
+        try:
+            result = subprocess.run(
+                ["git"] + args,
+                cwd=str(self._repo_root),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
+            )
+            return result.stdout
+        except Exception as e:
+            logger.warning("Git command failed: %s", e)
+            return b""
+
+    def _git_text(self, args: List[str]) -> str:
+        """Run a git command and return stdout decoded, without trailing newlines.
+
+        Leading whitespace is preserved because it is significant in
+        porcelain status output.
+        """
+        return self._run_git(args).decode("utf-8", "replace").rstrip("\n")
+
+    def _parse_status(self, status: str) -> Dict[str, List[str]]:
+        """Parse git status --porcelain output into categorized changes."""
+        changes: Dict[str, List[str]] = {
+            "added": [],
+            "modified": [],
+            "deleted": [],
+            "untracked": [],
+        }
+
+        for line in status.split("\n"):
+            if not line:
+                continue
+            bucket = _STATUS_BUCKETS.get(line[0]) or _STATUS_BUCKETS.get(line[1:2])
+            if bucket:
+                changes[bucket].append(line[3:])
+
+        return changes
+
+
+# =============================================================================
+# Real Workspace Implementation
+# =============================================================================
+
+
+class RealWorkspace(_GitWorkspaceBase):
+    """Workspace that operates directly on the real repository.
+
+    This is the simplest workspace - it just wraps the repo root.
+    Used for Deploy flow where we actually want to merge.
+    """
+
     def snapshot_forensics(self) -> ForensicsSnapshot:
         """Capture git state for audit."""
         timestamp = datetime.now(timezone.utc).isoformat()
 
         # Get current branch
-        branch = self._run_git(["rev-parse", "--abbrev-ref", "HEAD"])
+        branch = self._git_text(["rev-parse", "--abbrev-ref", "HEAD"])
 
         # Get status
-        status = self._run_git(["status", "--porcelain"])
+        status = self._git_text(["status", "--porcelain"])
 
         # Parse status for file changes
         file_changes = self._parse_status(status)
@@ -288,85 +414,11 @@ class RealWorkspace(Workspace):
         """Real workspace is not a shadow."""
         return False
 
-    @property
-    def run_base(self) -> Path:
-        """Get RUN_BASE path."""
-        return self._repo_root / "swarm" / "runs" / self._run_id
-
-    def _run_git(self, args: List[str]) -> str:
-        """Run a git command and return stdout."""
-        try:
-            result = subprocess.run(
-                ["git"] + args,
-                cwd=str(self._repo_root),
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            return result.stdout.strip()
-        except Exception as e:
-            logger.warning("Git command failed: %s", e)
-            return ""
-
-    def _parse_status(self, status: str) -> Dict[str, List[str]]:
-        """Parse git status into categorized changes."""
-        changes: Dict[str, List[str]] = {
-            "added": [],
-            "modified": [],
-            "deleted": [],
-            "untracked": [],
-        }
-
-        for line in status.split("\n"):
-            if not line:
-                continue
-            code = line[:2]
-            path = line[3:]
-
-            if "A" in code:
-                changes["added"].append(path)
-            elif "M" in code:
-                changes["modified"].append(path)
-            elif "D" in code:
-                changes["deleted"].append(path)
-            elif "?" in code:
-                changes["untracked"].append(path)
-
-        return changes
-
     def _get_diff_stats(self) -> Dict[str, int]:
-        """Get diff statistics."""
-        try:
-            result = subprocess.run(
-                ["git", "diff", "--stat", "--cached"],
-                cwd=str(self._repo_root),
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            # Parse last line like "3 files changed, 10 insertions(+), 5 deletions(-)"
-            lines = result.stdout.strip().split("\n")
-            if lines:
-                last_line = lines[-1]
-                stats = {
-                    "files_changed": 0,
-                    "insertions": 0,
-                    "deletions": 0,
-                }
-                # Simple parsing
-                if "file" in last_line:
-                    parts = last_line.split(",")
-                    for part in parts:
-                        if "file" in part:
-                            stats["files_changed"] = int(part.split()[0])
-                        elif "insertion" in part:
-                            stats["insertions"] = int(part.split()[0])
-                        elif "deletion" in part:
-                            stats["deletions"] = int(part.split()[0])
-                return stats
-        except Exception:
-            pass  # Git diff stat parsing failed - return empty stats
-        return {}
+        """Get diff statistics for staged changes."""
+        return _numstat_totals(
+            self._run_git(["diff", "--numstat", "--cached", "-z"])
+        )
 
 
 # =============================================================================
@@ -374,7 +426,7 @@ class RealWorkspace(Workspace):
 # =============================================================================
 
 
-class ShadowForkWorkspace(Workspace):
+class ShadowForkWorkspace(_GitWorkspaceBase):
     """Workspace that operates in an isolated shadow branch.
 
     This wraps ShadowFork to provide the Workspace interface.
@@ -396,8 +448,7 @@ class ShadowForkWorkspace(Workspace):
             base_branch: Branch to create shadow from.
             shadow_fork: Existing ShadowFork to wrap (for recovery).
         """
-        self._repo_root = Path(repo_root).resolve()
-        self._run_id = run_id
+        super().__init__(repo_root=repo_root, run_id=run_id)
         self._base_branch = base_branch
 
         if shadow_fork:
@@ -409,7 +460,14 @@ class ShadowForkWorkspace(Workspace):
             )
 
         self._created = False
-        self._boundary_violations: List[BoundaryViolation] = []
+        # Ahead/behind counts with the `git rev-parse <base> HEAD` output
+        # they were computed for
+        self._divergence: Optional[Tuple[str, Dict[str, int]]] = None
+        # Raw (path, operation, time_ns, step_id) tuples; BoundaryViolation
+        # objects and ISO timestamps are only built on read.
+        self._boundary_violations: Deque[Tuple[str, str, int, str]] = deque(
+            maxlen=MAX_BOUNDARY_VIOLATIONS
+        )
 
     def create(self) -> str:
         """Create the shadow branch.
@@ -423,34 +481,46 @@ class ShadowForkWorkspace(Workspace):
             return branch_name
         return self._fork.shadow_branch or ""
 
-    def root(self) -> Path:
-        """Get the repository root (same location, different branch)."""
-        # Shadow fork uses same repo location but different branch
-        return self._repo_root
-
     def snapshot_forensics(self) -> ForensicsSnapshot:
-        """Capture shadow workspace state for audit."""
+        """Capture shadow workspace state for audit.
+
+        The diff, status, and divergence queries are independent, so they
+        run concurrently; each one spends its time blocked on a git
+        subprocess rather than holding the GIL.
+        """
         timestamp = datetime.now(timezone.utc).isoformat()
 
-        # Get diff stat from base (get_diff() returns str, not tuple)
-        if self._fork.shadow_branch:
-            diff_stat = self._run_git([
-                "diff", "--stat", f"{self._base_branch}...{self._fork.shadow_branch}"
-            ])
-        else:
-            diff_stat = ""
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            # Get diff stat from base (get_diff() returns str, not tuple)
+            if self._fork.shadow_branch:
+                numstat_future = pool.submit(self._run_git, [
+                    "diff", "--numstat", "-z",
+                    f"{self._base_branch}...{self._fork.shadow_branch}",
+                ])
+            else:
+                numstat_future = None
+
+            # --no-optional-locks keeps status from refreshing the index
+            # while the other queries are reading it
+            status_future = pool.submit(
+                self._git_text, ["--no-optional-locks", "status", "--porcelain"]
+            )
+
+            # Get upstream divergence
+            divergence_future = pool.submit(self._get_divergence)
 
-        # Get upstream divergence
-        divergence = self._get_divergence()
+            numstat = numstat_future.result() if numstat_future else b""
+            status = status_future.result()
+            divergence = divergence_future.result()
 
         return ForensicsSnapshot(
             timestamp=timestamp,
             workspace_root=str(self._repo_root),
             workspace_type="shadow",
             branch=self._fork.shadow_branch or "",
-            status=self._run_git(["status", "--porcelain"]),
-            diff_stats=self._parse_diff_stat(diff_stat),
-            file_changes=self._get_file_changes(),
+            status=status,
+            diff_stats=_numstat_totals(numstat),
+            file_changes=self._parse_status(status),
             upstream_divergence=divergence,
         )
 
@@ -480,7 +550,7 @@ class ShadowForkWorkspace(Workspace):
 
             if bridge_success:
                 # Get the resulting commit SHA
-                commit_sha = self._run_git(["rev-parse", "HEAD"])
+                commit_sha = self._git_text(["rev-parse", "HEAD"])
                 return PromotionResult(
                     success=True,
                     commit_sha=commit_sha,
@@ -511,11 +581,6 @@ class ShadowForkWorkspace(Workspace):
         """Shadow fork workspace is always a shadow."""
         return True
 
-    @property
-    def run_base(self) -> Path:
-        """Get RUN_BASE path."""
-        return self._repo_root / "swarm" / "runs" / self._run_id
-
     def checkpoint(self, message: str) -> str:
         """Create a checkpoint commit.
 
@@ -552,18 +617,16 @@ class ShadowForkWorkspace(Workspace):
     ) -> None:
         """Record a boundary violation.
 
+        Only the most recent MAX_BOUNDARY_VIOLATIONS are retained.
+
         Args:
             path: The violating path.
             operation: What was attempted.
             step_id: Which step caused it.
         """
-        violation = BoundaryViolation(
-            path=path,
-            operation=operation,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            step_id=step_id,
+        self._boundary_violations.append(
+            (path, operation, time.time_ns(), step_id)
         )
-        self._boundary_violations.append(violation)
         logger.warning(
             "Boundary violation: %s attempted %s on %s",
             step_id or "unknown",
@@ -572,76 +635,33 @@ class ShadowForkWorkspace(Workspace):
         )
 
     def get_boundary_violations(self) -> List[BoundaryViolation]:
-        """Get recorded boundary violations."""
-        return list(self._boundary_violations)
-
-    def _run_git(self, args: List[str]) -> str:
-        """Run a git command and return stdout."""
-        try:
-            result = subprocess.run(
-                ["git"] + args,
-                cwd=str(self._repo_root),
-                capture_output=True,
-                text=True,
-                timeout=30,
+        """Get recorded boundary violations, oldest first."""
+        return [
+            BoundaryViolation(
+                path=path,
+                operation=operation,
+                timestamp=datetime.fromtimestamp(
+                    recorded_ns / 1e9, tz=timezone.utc
+                ).isoformat(),
+                step_id=step_id,
             )
-            return result.stdout.strip()
-        except Exception as e:
-            logger.warning("Git command failed: %s", e)
-            return ""
-
-    def _parse_diff_stat(self, diff_stat: str) -> Dict[str, int]:
-        """Parse diff --stat output."""
-        stats = {"files_changed": 0, "insertions": 0, "deletions": 0}
-        if not diff_stat:
-            return stats
-
-        lines = diff_stat.strip().split("\n")
-        if lines:
-            last_line = lines[-1]
-            if "file" in last_line:
-                parts = last_line.split(",")
-                for part in parts:
-                    if "file" in part:
-                        stats["files_changed"] = int(part.split()[0])
-                    elif "insertion" in part:
-                        stats["insertions"] = int(part.split()[0])
-                    elif "deletion" in part:
-                        stats["deletions"] = int(part.split()[0])
-        return stats
-
-    def _get_file_changes(self) -> Dict[str, List[str]]:
-        """Get categorized file changes."""
-        status = self._run_git(["status", "--porcelain"])
-        changes: Dict[str, List[str]] = {
-            "added": [],
-            "modified": [],
-            "deleted": [],
-            "untracked": [],
-        }
-
-        for line in status.split("\n"):
-            if not line:
-                continue
-            code = line[:2]
-            path = line[3:]
-
-            if "A" in code:
-                changes["added"].append(path)
-            elif "M" in code:
-                changes["modified"].append(path)
-            elif "D" in code:
-                changes["deleted"].append(path)
-            elif "?" in code:
-                changes["untracked"].append(path)
-
-        return changes
+            for path, operation, recorded_ns, step_id in self._boundary_violations
+        ]
 
     def _get_divergence(self) -> Dict[str, int]:
-        """Get upstream divergence info."""
+        """Get upstream divergence info.
+
+        The counts are memoized against the SHAs of the base branch and
+        HEAD, so repeated snapshots with no new commits on either side
+        cost one rev-parse instead of a rev-list walk.
+        """
         try:
+            tips = self._git_text(["rev-parse", self._base_branch, "HEAD"])
+            if self._divergence is not None and self._divergence[0] == tips:
+                return dict(self._divergence[1])
+
             # Get ahead/behind counts
-            result = self._run_git([
+            result = self._git_text([
                 "rev-list",
                 "--left-right",
                 "--count",
@@ -650,10 +670,13 @@ class ShadowForkWorkspace(Workspace):
             if result:
                 parts = result.split()
                 if len(parts) == 2:
-                    return {
+                    divergence = {
                         "behind": int(parts[0]),
                         "ahead": int(parts[1]),
                     }
+                    if len(tips.split()) == 2:
+                        self._divergence = (tips, divergence)
+                    return dict(divergence)
         except Exception:
             pass  # Git divergence check failed - assume no divergence
         return {"behind": 0, "ahead": 0}
@@ -685,9 +708,7 @@ def create_workspace(
     """
     # Determine shadow mode based on flow if not explicitly set
     if shadow_mode is None:
-        # Deploy flow operates on real repo (it actually merges)
-        # All other flows use shadow for safety
-        shadow_mode = flow_key not in ("deploy",)
+        shadow_mode = flow_key not in REAL_WORKSPACE_FLOWS
 
     if shadow_mode:
         workspace = ShadowForkWorkspace(
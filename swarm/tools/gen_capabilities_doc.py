@@ -19,10 +19,12 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import io
+import os
 import sys
-from datetime import datetime, timezone
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, TextIO
 
 # Find repo root
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -54,6 +56,13 @@ This document lists what Flow Studio can do, with evidence pointers.
 
 """
 
+# Templates for the per-item lines, bound to format_map once at import
+CAPABILITY_HEADING_TPL = "### `{id}`\n\n**Status:** {badge}\n\n".format_map
+SUMMARY_ROW_TPL = "| `{id}` | {status} | {summary} |\n".format_map
+CODE_SYMBOL_TPL = "    - `{path}` → `{symbol}`\n".format_map
+PATH_ITEM_TPL = "    - `{path}`\n".format_map
+TEST_ITEM_TPL = "    - [{kind}] `{ref}`\n".format_map
+
 
 def parse_yaml_simple(content: str) -> Dict[str, Any]:
     """Parse YAML using PyYAML (standard library not sufficient for complex YAML)."""
@@ -77,127 +86,120 @@ def status_badge(status: str) -> str:
     return status
 
 
-def render_evidence(evidence: Dict[str, Any]) -> List[str]:
-    """Render evidence section as markdown lines."""
-    lines = []
-
+def render_evidence(evidence: Dict[str, Any], out: TextIO) -> None:
+    """Write the evidence section as markdown lines."""
     # Code evidence
     code = evidence.get("code", [])
     if code:
-        lines.append("  - **Code:**")
+        out.write("  - **Code:**\n")
         for c in code:
             path = c.get("path", "")
             symbol = c.get("symbol", "")
             if symbol:
-                lines.append(f"    - `{path}` → `{symbol}`")
+                out.write(CODE_SYMBOL_TPL({"path": path, "symbol": symbol}))
             else:
-                lines.append(f"    - `{path}`")
+                out.write(PATH_ITEM_TPL({"path": path}))
 
     # Test evidence
     tests = evidence.get("tests", [])
     if tests:
-        lines.append("  - **Tests:**")
+        out.write("  - **Tests:**\n")
         for t in tests:
-            kind = t.get("kind", "")
-            ref = t.get("ref", "")
-            lines.append(f"    - [{kind}] `{ref}`")
+            out.write(TEST_ITEM_TPL({"kind": t.get("kind", ""), "ref": t.get("ref", "")}))
 
     # Design evidence (for aspirational)
     design = evidence.get("design", [])
     if design:
-        lines.append("  - **Design:**")
+        out.write("  - **Design:**\n")
         for d in design:
-            path = d.get("path", "")
-            lines.append(f"    - `{path}`")
-
-    return lines
-
+            out.write(PATH_ITEM_TPL({"path": d.get("path", "")}))
 
-def render_capability(cap: Dict[str, Any]) -> List[str]:
-    """Render a single capability as markdown lines."""
-    lines = []
 
+def render_capability(cap: Dict[str, Any], out: TextIO) -> None:
+    """Write a single capability as markdown."""
     cap_id = cap.get("id", "unknown")
     status = cap.get("status", "unknown")
     summary = cap.get("summary", "")
     notes = cap.get("notes", "")
     evidence = cap.get("evidence", {})
 
-    lines.append(f"### `{cap_id}`")
-    lines.append("")
-    lines.append(f"**Status:** {status_badge(status)}")
-    lines.append("")
+    out.write(CAPABILITY_HEADING_TPL({"id": cap_id, "badge": status_badge(status)}))
     if summary:
-        lines.append(summary)
-        lines.append("")
+        out.write(f"{summary}\n\n")
     if notes:
-        lines.append(f"> {notes}")
-        lines.append("")
+        out.write(f"> {notes}\n\n")
 
     # Evidence
     if evidence:
-        lines.append("**Evidence:**")
-        lines.extend(render_evidence(evidence))
-        lines.append("")
+        out.write("**Evidence:**\n")
+        render_evidence(evidence, out)
+        out.write("\n")
 
-    return lines
-
-
-def render_surface(surface_key: str, surface_data: Dict[str, Any]) -> List[str]:
-    """Render a surface section as markdown lines."""
-    lines = []
 
+def render_surface(surface_key: str, surface_data: Dict[str, Any], out: TextIO) -> None:
+    """Write a surface section as markdown."""
     description = surface_data.get("description", "")
     capabilities = surface_data.get("capabilities", [])
 
     # Surface header
-    lines.append(f"## {surface_key.title()}")
-    lines.append("")
+    out.write(f"## {surface_key.title()}\n\n")
     if description:
-        lines.append(f"*{description}*")
-        lines.append("")
+        out.write(f"*{description}*\n\n")
 
     # Summary table
     if capabilities:
-        lines.append("| Capability | Status | Summary |")
-        lines.append("|------------|--------|---------|")
+        out.write("| Capability | Status | Summary |\n")
+        out.write("|------------|--------|---------|\n")
         for cap in capabilities:
-            cap_id = cap.get("id", "")
-            status = cap.get("status", "")
             summary = cap.get("summary", "")
             # Truncate summary for table
             if len(summary) > 60:
                 summary = summary[:57] + "..."
-            lines.append(f"| `{cap_id}` | {status} | {summary} |")
-        lines.append("")
+            out.write(SUMMARY_ROW_TPL({
+                "id": cap.get("id", ""),
+                "status": cap.get("status", ""),
+                "summary": summary,
+            }))
+        out.write("\n")
 
     # Detailed sections
     for cap in capabilities:
-        lines.extend(render_capability(cap))
+        render_capability(cap, out)
+
+    out.write("---\n\n")
 
-    lines.append("---")
-    lines.append("")
 
-    return lines
+def generation_timestamp() -> str:
+    """Return the current UTC time for the generated-doc footer."""
+    from datetime import datetime, timezone
 
+    return datetime.now(timezone.utc).isoformat()
 
-def generate_doc(registry: Dict[str, Any]) -> str:
-    """Generate the full markdown document."""
-    lines = [HEADER]
+
+def render_footer(generated_at: str) -> str:
+    """Return the generation timestamp line that ends the doc."""
+    return f"*Generated: {generated_at}*\n"
+
+
+def generate_doc(registry: Dict[str, Any], out: TextIO) -> None:
+    """Stream the markdown document, minus the timestamp footer, to `out`.
+
+    The body is deterministic for a given registry; callers append
+    render_footer() when writing the real file.
+    """
+    out.write(HEADER)
+    out.write("\n")
 
     # Table of contents
     surfaces = registry.get("surfaces", {})
-    lines.append("## Table of Contents")
-    lines.append("")
+    out.write("## Table of Contents\n\n")
     for surface_key in surfaces:
-        lines.append(f"- [{surface_key.title()}](#{surface_key})")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+        out.write(f"- [{surface_key.title()}](#{surface_key})\n")
+    out.write("\n---\n\n")
 
     # Surfaces
     for surface_key, surface_data in surfaces.items():
-        lines.extend(render_surface(surface_key, surface_data))
+        render_surface(surface_key, surface_data, out)
 
     # Footer with stats
     total_caps = 0
@@ -209,22 +211,21 @@ def generate_doc(registry: Dict[str, Any]) -> str:
             if status in by_status:
                 by_status[status] += 1
 
-    lines.append("## Statistics")
-    lines.append("")
-    lines.append(f"- **Total capabilities:** {total_caps}")
-    lines.append(f"- **Implemented:** {by_status['implemented']}")
-    lines.append(f"- **Supported:** {by_status['supported']}")
-    lines.append(f"- **Aspirational:** {by_status['aspirational']}")
-    lines.append("")
+    out.write("## Statistics\n\n")
+    out.write(f"- **Total capabilities:** {total_caps}\n")
+    out.write(f"- **Implemented:** {by_status['implemented']}\n")
+    out.write(f"- **Supported:** {by_status['supported']}\n")
+    out.write(f"- **Aspirational:** {by_status['aspirational']}\n")
+    out.write("\n---\n\n")
 
-    # Generation timestamp
-    now = datetime.now(timezone.utc).isoformat()
-    lines.append("---")
-    lines.append("")
-    lines.append(f"*Generated: {now}*")
-    lines.append("")
 
-    return "\n".join(lines)
+def strip_timestamp(s: str) -> str:
+    """Strip the trailing generation timestamp (the only line that varies)."""
+    lines = s.strip().split("\n")
+    # Remove last line if it's the timestamp
+    if lines and lines[-1].startswith("*Generated:"):
+        lines = lines[:-1]
+    return "\n".join(lines).rstrip()
 
 
 def main():
@@ -251,9 +252,6 @@ def main():
         print(f"ERROR: Failed to parse registry: {e}", file=sys.stderr)
         sys.exit(2)
 
-    # Generate doc
-    doc_content = generate_doc(registry)
-
     if args.check:
         # Check mode: compare with existing
         if not OUTPUT_PATH.exists():
@@ -261,17 +259,10 @@ def main():
             print("Run: make gen-capabilities-doc", file=sys.stderr)
             sys.exit(1)
 
+        buf = io.StringIO()
+        generate_doc(registry, buf)
         existing = OUTPUT_PATH.read_text(encoding="utf-8")
-
-        # Strip timestamps for comparison (last line varies)
-        def strip_timestamp(s: str) -> str:
-            lines = s.strip().split("\n")
-            # Remove last line if it's the timestamp
-            if lines and lines[-1].startswith("*Generated:"):
-                lines = lines[:-1]
-            return "\n".join(lines)
-
-        if strip_timestamp(existing) != strip_timestamp(doc_content):
+        if strip_timestamp(existing) != strip_timestamp(buf.getvalue()):
             print(f"FAIL: Generated doc is out of date: {OUTPUT_PATH}", file=sys.stderr)
             print("Run: make gen-capabilities-doc", file=sys.stderr)
             sys.exit(1)
@@ -279,9 +270,21 @@ def main():
         print(f"OK: {OUTPUT_PATH} is up to date")
         sys.exit(0)
 
-    # Write mode
+    # Write mode: stream to a temp file in the same directory, then swap it
+    # in atomically so readers never see a partial doc
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(doc_content, encoding="utf-8")
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=OUTPUT_PATH.parent,
+        prefix=f".{OUTPUT_PATH.name}.",
+        delete=False,
+    ) as tmp:
+        generate_doc(registry, tmp)
+        tmp.write(render_footer(generation_timestamp()))
+    # NamedTemporaryFile creates files 0600; the doc should stay world-readable
+    os.chmod(tmp.name, 0o644)
+    os.replace(tmp.name, OUTPUT_PATH)
     print(f"Generated: {OUTPUT_PATH}")
 
 
@@ -1877,8 +1877,10 @@ def validate_capability_registry() -> ValidationResult:
     # Parse capability registry (uses PyYAML, not SimpleYAMLParser which is for frontmatter)
     try:
         import yaml
+        # Prefer the libyaml-backed loader; same safe semantics, C speed.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         content = registry_path.read_text(encoding="utf-8")
-        registry = yaml.safe_load(content)
+        registry = yaml.load(content, Loader=loader)
     except ImportError:
         result.add_warning(
             "CAPABILITY",
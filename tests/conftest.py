@@ -13,10 +13,17 @@ warnings.filterwarnings(
     category=DeprecationWarning,
 )
 
+import hashlib
+import importlib.util
+import io
+import os
 import shutil
 import subprocess
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import pytest
 from fastapi.testclient import TestClient
@@ -57,19 +64,26 @@ except ImportError as e:
 # ============================================================================
 
 
-@pytest.fixture
-def temp_repo(tmp_path):
+# Files under these repo-relative paths are copied validator sources that
+# tests never modify, so per-test clones hardlink them instead of copying.
+_SHARED_BASELINE_PATHS = ("swarm/__init__.py", "swarm/tools/", "swarm/validator/")
+
+
+@pytest.fixture(scope="session")
+def _baseline_repo(tmp_path_factory):
     """
-    Create a temporary repository with minimal valid structure.
+    Build the minimal valid repository once per session.
 
-    Returns a Path to the temporary directory with:
+    Layout:
     - swarm/AGENTS.md (empty but valid)
     - .claude/agents/ (empty directory)
     - .claude/skills/ (empty directory)
     - swarm/flows/ (empty directory)
     - swarm/tools/validate_swarm.py (copied from real repo)
+
+    Tests must not use this directly; temp_repo hands out private clones.
     """
-    repo = tmp_path / "test_repo"
+    repo = tmp_path_factory.mktemp("baseline") / "test_repo"
     repo.mkdir()
 
     # Create directory structure
@@ -102,6 +116,46 @@ def temp_repo(tmp_path):
     return repo
 
 
+def clone_tree(src: Path, dest: Path, shared: Callable[[str], bool]) -> None:
+    """
+    Copy a session-wide template tree, hardlinking files that stay read-only.
+
+    ``shared`` receives each file's POSIX path relative to ``src`` and
+    returns True for files no test rewrites in place. Everything else is a
+    real copy so mutations never reach the template. Falls back to copying
+    when hardlinks are unavailable (e.g. Windows, cross-device).
+    """
+    def _copy(s: str, d: str) -> str:
+        if shared(Path(s).relative_to(src).as_posix()):
+            try:
+                os.link(s, d)
+                return d
+            except OSError:
+                pass
+        return shutil.copy2(s, d)
+
+    shutil.copytree(src, dest, copy_function=_copy)
+
+
+@pytest.fixture
+def temp_repo(tmp_path, _baseline_repo):
+    """
+    Create a temporary repository with minimal valid structure.
+
+    Returns a Path to the temporary directory with:
+    - swarm/AGENTS.md (empty but valid)
+    - .claude/agents/ (empty directory)
+    - .claude/skills/ (empty directory)
+    - swarm/flows/ (empty directory)
+    - swarm/tools/validate_swarm.py (copied from real repo)
+
+    The tree is cloned from a session-wide baseline rather than rebuilt.
+    """
+    repo = tmp_path / "test_repo"
+    clone_tree(_baseline_repo, repo, lambda rel: rel.startswith(_SHARED_BASELINE_PATHS))
+    return repo
+
+
 @pytest.fixture
 def valid_repo(temp_repo):
     """
@@ -288,21 +342,151 @@ def add_agent_to_registry(repo_path: Path, agent_key: str, line_hint: Optional[i
 # ============================================================================
 
 
+# Set to "1" to reuse validator results across tests whose repos are
+# byte-for-byte identical. Off by default so CI always runs the validator.
+VALIDATOR_CACHE_ENV = "FLOW_STUDIO_TEST_VALIDATOR_CACHE"
+
+# Set to "1" to run the validator as a `uv run` subprocess instead of
+# in-process (slower, but exercises the real CLI entry point).
+VALIDATOR_SUBPROCESS_ENV = "FLOW_STUDIO_TEST_VALIDATOR_SUBPROCESS"
+
+
+# Host bytes of each swarm/ source a temp repo has been compared against;
+# None for sources the host does not have.
+_host_swarm_sources: Dict[str, Optional[bytes]] = {}
+
+# Sources the validator imports, which a repo must keep to run in-process
+_REQUIRED_SWARM_SOURCES = frozenset(
+    ["swarm/tools/validate_swarm.py"]
+    + [
+        p.relative_to(_repo_root).as_posix()
+        for p in (_repo_root / "swarm" / "validator").glob("*.py")
+    ]
+)
+
+
+def _matches_host_swarm(repo_path: Path) -> bool:
+    """
+    Return True if every .py file under repo_path/swarm is identical to the host's.
+
+    The in-process runner imports the host's already-loaded swarm package,
+    so it is only faithful while the repo's copies of those sources are
+    unmodified. The repo must also still have validate_swarm.py and every
+    swarm/validator module the baseline copies in.
+    """
+    swarm_dir = repo_path / "swarm"
+    seen = set()
+    for path in swarm_dir.rglob("*.py"):
+        rel = path.relative_to(repo_path).as_posix()
+        if rel not in _host_swarm_sources:
+            host_file = _repo_root / rel
+            _host_swarm_sources[rel] = host_file.read_bytes() if host_file.is_file() else None
+        if path.read_bytes() != _host_swarm_sources[rel]:
+            return False
+        seen.add(rel)
+    return _REQUIRED_SWARM_SOURCES <= seen
+
+
+def _run_validator_in_process(
+    repo_path: Path, flags: List[str]
+) -> subprocess.CompletedProcess:
+    """
+    Run the repo's copy of validate_swarm.py inside the test process.
+
+    The script resolves ROOT from the working directory at import time, so
+    it is loaded as a fresh module with cwd set to the repo. argv, cwd, and
+    sys.path are restored afterwards. SystemExit becomes the return code and
+    uncaught exceptions are reported like the interpreter would (exit 1).
+    """
+    script = repo_path / "swarm" / "tools" / "validate_swarm.py"
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_cwd, saved_argv, saved_path = os.getcwd(), sys.argv, list(sys.path)
+    returncode = 0
+
+    try:
+        os.chdir(repo_path)
+        sys.argv = [str(script)] + flags
+        spec = importlib.util.spec_from_file_location("_validate_swarm_under_test", script)
+        module = importlib.util.module_from_spec(spec)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                spec.loader.exec_module(module)
+                module.main()
+            except SystemExit as e:
+                if e.code is None:
+                    returncode = 0
+                elif isinstance(e.code, int):
+                    returncode = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        os.chdir(saved_cwd)
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+
+    return subprocess.CompletedProcess(
+        args=[str(script)] + flags,
+        returncode=returncode,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+    )
+
+
+def _validator_cache_key(repo_path: Path, flags: List[str]) -> bytes:
+    """Hash flags plus every file path and content under repo_path."""
+    digest = hashlib.blake2b()
+    for flag in flags:
+        digest.update(flag.encode("utf-8") + b"\0")
+    for path in sorted(p for p in repo_path.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(repo_path).as_posix().encode("utf-8") + b"\0")
+        digest.update(hashlib.blake2b(path.read_bytes()).digest())
+    return digest.digest()
+
+
+@pytest.fixture(scope="session")
+def validator_result_cache() -> Dict[bytes, subprocess.CompletedProcess]:
+    """Session-wide store of validator results keyed by repo content hash."""
+    return {}
+
+
 @pytest.fixture
-def run_validator():
+def run_validator(validator_result_cache):
     """
     Fixture that returns a function to run the validator on a given repo path.
 
+    The repo's copy of the validator runs in-process, which avoids paying
+    interpreter startup and `uv run` resolution for every call. That reuses
+    the host's swarm package, so repos whose swarm/ sources differ from the
+    host's still get a subprocess. Set FLOW_STUDIO_TEST_VALIDATOR_SUBPROCESS=1
+    to always run it as a subprocess.
+
+    When FLOW_STUDIO_TEST_VALIDATOR_CACHE=1, results are memoized by a hash
+    of the repo contents and flags, so repeated runs on identical trees
+    skip the validator. The copied validator sources are part of the hash.
+
     Returns:
         Function(repo_path, flags=[]) -> CompletedProcess
     """
-    def _run(repo_path: Path, flags: Optional[List[str]] = None):
+    use_cache = os.environ.get(VALIDATOR_CACHE_ENV) == "1"
+    use_subprocess = os.environ.get(VALIDATOR_SUBPROCESS_ENV) == "1"
+
+    def _run(
+        repo_path: Path,
+        flags: Optional[List[str]] = None,
+        in_process: bool = True,
+    ):
         """
         Run the validator on the given repository.
 
         Args:
             repo_path: Path to repository root
             flags: Optional list of command-line flags
+            in_process: False to force a `uv run` subprocess (e.g. when
+                timing the real CLI end to end)
 
         Returns:
             subprocess.CompletedProcess with returncode, stdout, stderr
@@ -310,15 +494,24 @@ def run_validator():
         if flags is None:
             flags = []
 
-        cmd = ["uv", "run", "swarm/tools/validate_swarm.py"] + flags
+        key = _validator_cache_key(Path(repo_path), flags) if use_cache else None
+        if key is not None and key in validator_result_cache:
+            return validator_result_cache[key]
 
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True
-        )
+        if use_subprocess or not in_process or not _matches_host_swarm(Path(repo_path)):
+            cmd = ["uv", "run", "swarm/tools/validate_swarm.py"] + flags
+
+            result = subprocess.run(
+                cmd,
+                cwd=repo_path,
+                capture_output=True,
+                text=True
+            )
+        else:
+            result = _run_validator_in_process(Path(repo_path), flags)
 
+        if key is not None:
+            validator_result_cache[key] = result
         return result
 
     return _run
@@ -547,13 +740,71 @@ def flowstudio_client() -> TestClient:
     return TestClient(app)
 
 
+# ============================================================================
+# Pytest Options and Hooks
+# ============================================================================
+
+
+def pytest_addoption(parser):
+    """Register flow-studio test options."""
+    parser.addoption(
+        "--cap-cache",
+        action="store_true",
+        default=False,
+        help="Skip capability-registry tests whose inputs and validator "
+             "sources are unchanged since they last passed (uses .pytest_cache).",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report as item.rep_<phase> for fixtures."""
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+
+
 # ============================================================================
 # Pytest Configuration for BDD
 # ============================================================================
 
 
+# Set to "1" to move pytest's temp root to the RAM-backed /dev/shm, so
+# temp_repo writes and validator reads never touch a block device. Off by
+# default: shared memory is small on many CI hosts and shared with other jobs.
+TMPFS_TEMPROOT_ENV = "FLOW_STUDIO_TEST_TMPFS"
+
+_TMPFS_TEMPROOT = Path("/dev/shm")
+_TMPFS_MIN_FREE_BYTES = 1 << 30
+
+
+def _use_tmpfs_temproot() -> None:
+    """
+    Point PYTEST_DEBUG_TEMPROOT at /dev/shm when opted in via TMPFS_TEMPROOT_ENV.
+
+    Only applies when /dev/shm exists with >= 1 GiB free; otherwise the
+    default temp dir is kept. An explicit PYTEST_DEBUG_TEMPROOT (or
+    --basetemp) still wins.
+    """
+    if os.environ.get(TMPFS_TEMPROOT_ENV) != "1":
+        return
+    if "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    try:
+        if not (_TMPFS_TEMPROOT.is_dir() and os.access(_TMPFS_TEMPROOT, os.W_OK)):
+            return
+        if shutil.disk_usage(_TMPFS_TEMPROOT).free < _TMPFS_MIN_FREE_BYTES:
+            return
+    except OSError:
+        return
+    os.environ["PYTEST_DEBUG_TEMPROOT"] = str(_TMPFS_TEMPROOT)
+
+
 def pytest_configure(config):
     """Configure pytest, including BDD support."""
+    # tmp_path_factory resolves its root lazily, so this still applies
+    _use_tmpfs_temproot()
+
     # Suppress gherkin deprecation warnings early (before collection triggers them)
     # This is needed because -W error may process warnings before pyproject.toml filters
     import warnings
@@ -7,15 +7,176 @@ and that BDD @cap: tags reference valid capabilities.
 BDD Scenarios covered:
 - Scenario 1: Valid capability registry with all evidence (happy path)
 - Scenario 2: Missing capability registry returns warning (optional file)
-- Scenario 3: Implemented capability without test evidence fails
-- Scenario 4: Implemented capability without code evidence fails
+- Scenarios 3/4: Implemented capability without test or code evidence fails
 - Scenario 5: BDD @cap: tag references non-existent capability fails
 - Scenario 6: Aspirational capability without evidence passes
 - Scenario 7: Supported capability without tests passes (only code required)
 """
 
-import pytest
+import copy
+import hashlib
+import os
 from pathlib import Path
+from string import Template
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+import yaml
+
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Each test is independent; keep the module on one xdist worker so it
+# shares that worker's session baseline repo (see `make test-parallel`).
+pytestmark = pytest.mark.xdist_group(name="cap_registry")
+
+
+# ============================================================================
+# Registry Fixtures
+# ============================================================================
+
+# Single-surface, single-capability registry; scenarios differ only in
+# the capability fields and evidence block substituted below.
+_REGISTRY_TEMPLATE = Template("""
+version: 1
+surfaces:
+  $surface:
+    description: "Test surface"
+    capabilities:
+      - id: $cid
+        status: $status
+        summary: "$summary"
+$extra        evidence:
+$evidence""")
+
+_CODE_EVIDENCE = """\
+          code:
+            - path: src/test.py
+"""
+
+
+def _registry_yaml(
+    cid: str,
+    status: str,
+    summary: str,
+    evidence: str,
+    surface: str = "test",
+    extra: str = "",
+) -> str:
+    """Fill _REGISTRY_TEMPLATE for one capability."""
+    return _REGISTRY_TEMPLATE.substitute(
+        surface=surface, cid=cid, status=status, summary=summary,
+        evidence=evidence, extra=extra,
+    )
+
+
+# Registry bodies used by the tests below, parsed once at import time.
+_REGISTRY_YAML = {
+    "valid": _registry_yaml(
+        "receipts.required_fields", "implemented", "Test capability",
+        surface="receipts",
+        evidence="""\
+          code:
+            - path: swarm/runtime/receipt_io.py
+              symbol: StepReceiptData
+          tests:
+            - kind: unit
+              ref: tests/test_receipt_io.py
+""",
+    ),
+    "missing_evidence": _registry_yaml(
+        "test.missing_evidence", "implemented", "Missing evidence",
+        evidence=_CODE_EVIDENCE + """\
+          tests:
+            - kind: unit
+              ref: tests/test_something.py
+""",
+    ),
+    "bdd_missing_cap": _registry_yaml(
+        "test.exists", "implemented", "Existing capability",
+        evidence=_CODE_EVIDENCE + """\
+          tests:
+            - kind: unit
+              ref: tests/test.py
+""",
+    ),
+    "aspirational": _registry_yaml(
+        "test.future", "aspirational", "Future capability",
+        evidence="""\
+          design:
+            - path: docs/DESIGN.md
+""",
+    ),
+    "supported": _registry_yaml(
+        "test.partial", "supported", "Partially tested capability",
+        extra='        notes: "Tests incomplete"\n',
+        evidence=_CODE_EVIDENCE,
+    ),
+    "valid_cap_tag": _registry_yaml(
+        "test.feature", "implemented", "Test capability",
+        evidence=_CODE_EVIDENCE + """\
+          tests:
+            - kind: bdd
+              ref: "@cap:test.feature"
+""",
+    ),
+    "multiple_surfaces": """
+version: 1
+surfaces:
+  surface1:
+    description: "First surface"
+    capabilities:
+      - id: surface1.cap1
+        status: implemented
+        summary: "First capability"
+        evidence:
+          code:
+            - path: src/s1.py
+          tests:
+            - kind: unit
+              ref: tests/test_s1.py
+  surface2:
+    description: "Second surface"
+    capabilities:
+      - id: surface2.cap1
+        status: implemented
+        summary: "Second capability"
+        evidence:
+          code:
+            - path: src/s2.py
+          # Missing tests - should fail
+""",
+}
+
+_REGISTRIES: Dict[str, Dict[str, Any]] = {
+    name: yaml.safe_load(text) for name, text in _REGISTRY_YAML.items()
+}
+
+# Validator stderr markers, matched against result.stderr.
+_ERR_CAP = "CAPABILITY"
+_ERR_CAP_SECTION = "CAPABILITY Errors"
+_ERR_NO_TESTS = "no test evidence"
+_ERR_NO_CODE = "no code evidence"
+_ERR_NOT_IN_REGISTRY = "not in registry"
+
+# Feature files, kept as bytes so they are written without re-encoding.
+_FEATURE_NONEXISTENT_CAP = b"""
+Feature: Test feature
+
+  @cap:test.nonexistent
+  Scenario: Test scenario
+    Given something
+    Then something else
+"""
+
+_FEATURE_VALID_CAP = b"""
+Feature: Test feature
+
+  @cap:test.feature
+  Scenario: Test scenario
+    Given something
+    Then something else
+"""
 
 
 # ============================================================================
@@ -23,22 +184,96 @@ from pathlib import Path
 # ============================================================================
 
 
-def create_capability_registry(repo_path: Path, content: str) -> Path:
-    """Create specs/capabilities.yaml with given content."""
-    specs_dir = repo_path / "specs"
-    specs_dir.mkdir(parents=True, exist_ok=True)
-    registry_path = specs_dir / "capabilities.yaml"
-    registry_path.write_text(content, encoding="utf-8")
+# Everything a cached result depends on besides the test id and parameters:
+# this module (tests, helpers, fixtures), conftest.py, and the validator
+_CAP_CACHE_SOURCES = [Path(__file__), Path(__file__).parent / "conftest.py"] + sorted(
+    [Path(__file__).parent.parent / "swarm" / "tools" / "validate_swarm.py"]
+    + list((Path(__file__).parent.parent / "swarm" / "validator").glob("*.py"))
+)
+
+
+def _cap_cache_key(request) -> str:
+    """Hash a test's id and parameters with the sources in _CAP_CACHE_SOURCES."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(request.node.nodeid.encode("utf-8"))
+    callspec = getattr(request.node, "callspec", None)
+    if callspec is not None:
+        h.update(repr(sorted(callspec.params.items())).encode("utf-8"))
+    for source in _CAP_CACHE_SOURCES:
+        h.update(source.read_bytes())
+    return h.hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def _cap_cache(request):
+    """
+    With --cap-cache, skip tests that already passed on identical inputs.
+
+    Off by default. Results live in .pytest_cache under capreg/<key>;
+    editing this module, conftest.py, or the validator changes the key.
+    """
+    cache = getattr(request.config, "cache", None)
+    if not request.config.getoption("--cap-cache") or cache is None:
+        yield
+        return
+
+    cache_path = f"capreg/{_cap_cache_key(request)}"
+    if cache.get(cache_path, None) == "passed":
+        pytest.skip("cached pass (--cap-cache)")
+
+    yield
+
+    rep = getattr(request.node, "rep_call", None)
+    if rep is not None and rep.passed:
+        cache.set(cache_path, "passed")
+
+
+@pytest.fixture
+def cap_repo(temp_repo) -> SimpleNamespace:
+    """temp_repo with specs/ and features/ created up front."""
+    repo = SimpleNamespace(
+        path=temp_repo,
+        specs_dir=temp_repo / "specs",
+        features_dir=temp_repo / "features",
+    )
+    repo.specs_dir.mkdir()
+    repo.features_dir.mkdir()
+    return repo
+
+
+def create_capability_registry(repo: SimpleNamespace, content: bytes) -> Path:
+    """Create specs/capabilities.yaml with given UTF-8 content."""
+    registry_path = repo.specs_dir / "capabilities.yaml"
+    registry_path.write_bytes(content)
     return registry_path
 
 
-def create_feature_file(repo_path: Path, name: str, content: str) -> Path:
-    """Create a feature file in features/ directory."""
-    features_dir = repo_path / "features"
-    features_dir.mkdir(parents=True, exist_ok=True)
-    feature_path = features_dir / f"{name}.feature"
-    feature_path.write_text(content, encoding="utf-8")
-    return feature_path
+def dump_registry(data: Dict[str, Any]) -> bytes:
+    """Render a pre-parsed registry back to UTF-8 YAML."""
+    return yaml.dump(data, Dumper=_Dumper, sort_keys=False, encoding="utf-8")
+
+
+def write_registry_dict(repo: SimpleNamespace, data: Dict[str, Any]) -> Path:
+    """Write a pre-parsed registry to specs/capabilities.yaml."""
+    return create_capability_registry(repo, dump_registry(data))
+
+
+def write_tree(repo: SimpleNamespace, files: Dict[str, bytes]) -> None:
+    """
+    Write several repo-relative files in one pass.
+
+    Parent directories are created once per distinct parent, then each
+    file is written with a single os.open/os.write/os.close.
+    """
+    paths = {repo.path / rel: content for rel, content in files.items()}
+    for parent in {path.parent for path in paths}:
+        os.makedirs(parent, exist_ok=True)
+    for path, content in paths.items():
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
 
 
 # ============================================================================
@@ -46,7 +281,7 @@ def create_feature_file(repo_path: Path, name: str, content: str) -> Path:
 # ============================================================================
 
 
-def test_valid_capability_registry(temp_repo, run_validator):
+def test_valid_capability_registry(cap_repo, run_validator):
     """
     Scenario 1: Valid capability registry with all evidence.
 
@@ -55,30 +290,14 @@ def test_valid_capability_registry(temp_repo, run_validator):
     When: I run the validator
     Then: Validator passes with no capability errors
     """
-    create_capability_registry(temp_repo, """
-version: 1
-surfaces:
-  receipts:
-    description: "Test surface"
-    capabilities:
-      - id: receipts.required_fields
-        status: implemented
-        summary: "Test capability"
-        evidence:
-          code:
-            - path: swarm/runtime/receipt_io.py
-              symbol: StepReceiptData
-          tests:
-            - kind: unit
-              ref: tests/test_receipt_io.py
-""")
+    write_registry_dict(cap_repo, _REGISTRIES["valid"])
 
-    result = run_validator(temp_repo)
+    result = run_validator(cap_repo.path)
     # Should pass (no CAPABILITY errors)
-    assert "CAPABILITY Errors" not in result.stderr
+    assert _ERR_CAP_SECTION not in result.stderr
 
 
-def test_missing_capability_registry_is_warning(temp_repo, run_validator):
+def test_missing_capability_registry_is_warning(cap_repo, run_validator):
     """
     Scenario 2: Missing capability registry returns warning.
 
@@ -88,7 +307,7 @@ def test_missing_capability_registry_is_warning(temp_repo, run_validator):
     And: A warning is emitted about missing registry
     """
     # Don't create any capability registry
-    result = run_validator(temp_repo)
+    result = run_validator(cap_repo.path)
     # Should pass - registry is optional
     assert result.returncode == 0
 
@@ -98,66 +317,31 @@ def test_missing_capability_registry_is_warning(temp_repo, run_validator):
 # ============================================================================
 
 
-def test_implemented_without_test_evidence_fails(temp_repo, run_validator):
+@pytest.mark.parametrize(
+    "missing,expected_msg",
+    [("tests", _ERR_NO_TESTS), ("code", _ERR_NO_CODE)],
+    ids=["scenario3-no-tests", "scenario4-no-code"],
+)
+def test_implemented_without_evidence_fails(cap_repo, run_validator, missing, expected_msg):
     """
-    Scenario 3: Implemented capability without test evidence fails.
+    Scenarios 3 and 4: Implemented capability missing test or code evidence fails.
 
     Given: A capability with status 'implemented'
-    And: No test evidence in the evidence section
+    And: Its evidence section lacks test (3) or code (4) pointers
     When: I run the validator
     Then: Validator fails with CAPABILITY error
-    And: Error mentions missing test evidence
+    And: Error mentions the missing evidence kind
     """
-    create_capability_registry(temp_repo, """
-version: 1
-surfaces:
-  test:
-    description: "Test surface"
-    capabilities:
-      - id: test.no_tests
-        status: implemented
-        summary: "Missing test evidence"
-        evidence:
-          code:
-            - path: src/test.py
-""")
-
-    result = run_validator(temp_repo)
-    assert "CAPABILITY" in result.stderr
-    assert "no test evidence" in result.stderr
-
-
-def test_implemented_without_code_evidence_fails(temp_repo, run_validator):
-    """
-    Scenario 4: Implemented capability without code evidence fails.
-
-    Given: A capability with status 'implemented'
-    And: No code evidence in the evidence section
-    When: I run the validator
-    Then: Validator fails with CAPABILITY error
-    And: Error mentions missing code evidence
-    """
-    create_capability_registry(temp_repo, """
-version: 1
-surfaces:
-  test:
-    description: "Test surface"
-    capabilities:
-      - id: test.no_code
-        status: implemented
-        summary: "Missing code evidence"
-        evidence:
-          tests:
-            - kind: unit
-              ref: tests/test_something.py
-""")
+    registry = copy.deepcopy(_REGISTRIES["missing_evidence"])
+    del registry["surfaces"]["test"]["capabilities"][0]["evidence"][missing]
+    write_registry_dict(cap_repo, registry)
 
-    result = run_validator(temp_repo)
-    assert "CAPABILITY" in result.stderr
-    assert "no code evidence" in result.stderr
+    result = run_validator(cap_repo.path)
+    assert _ERR_CAP in result.stderr
+    assert expected_msg in result.stderr
 
 
-def test_bdd_cap_tag_references_nonexistent_capability(temp_repo, run_validator):
+def test_bdd_cap_tag_references_nonexistent_capability(cap_repo, run_validator):
     """
     Scenario 5: BDD @cap: tag references non-existent capability fails.
 
@@ -167,38 +351,17 @@ def test_bdd_cap_tag_references_nonexistent_capability(temp_repo, run_validator)
     Then: Validator fails with CAPABILITY error
     And: Error mentions the invalid tag
     """
-    # Create registry without the referenced capability
-    create_capability_registry(temp_repo, """
-version: 1
-surfaces:
-  test:
-    description: "Test surface"
-    capabilities:
-      - id: test.exists
-        status: implemented
-        summary: "Existing capability"
-        evidence:
-          code:
-            - path: src/test.py
-          tests:
-            - kind: unit
-              ref: tests/test.py
-""")
-
-    # Create feature file with invalid @cap: tag
-    create_feature_file(temp_repo, "test", """
-Feature: Test feature
-
-  @cap:test.nonexistent
-  Scenario: Test scenario
-    Given something
-    Then something else
-""")
-
-    result = run_validator(temp_repo)
-    assert "CAPABILITY" in result.stderr
+    # Registry without the referenced capability, plus a feature file
+    # with an invalid @cap: tag
+    write_tree(cap_repo, {
+        "specs/capabilities.yaml": dump_registry(_REGISTRIES["bdd_missing_cap"]),
+        "features/test.feature": _FEATURE_NONEXISTENT_CAP,
+    })
+
+    result = run_validator(cap_repo.path)
+    assert _ERR_CAP in result.stderr
     assert "test.nonexistent" in result.stderr
-    assert "not in registry" in result.stderr
+    assert _ERR_NOT_IN_REGISTRY in result.stderr
 
 
 # ============================================================================
@@ -206,7 +369,7 @@ Feature: Test feature
 # ============================================================================
 
 
-def test_aspirational_without_evidence_passes(temp_repo, run_validator):
+def test_aspirational_without_evidence_passes(cap_repo, run_validator):
     """
     Scenario 6: Aspirational capability without evidence passes.
 
@@ -215,26 +378,14 @@ def test_aspirational_without_evidence_passes(temp_repo, run_validator):
     When: I run the validator
     Then: Validator passes (aspirational doesn't need evidence)
     """
-    create_capability_registry(temp_repo, """
-version: 1
-surfaces:
-  test:
-    description: "Test surface"
-    capabilities:
-      - id: test.future
-        status: aspirational
-        summary: "Future capability"
-        evidence:
-          design:
-            - path: docs/DESIGN.md
-""")
+    write_registry_dict(cap_repo, _REGISTRIES["aspirational"])
 
-    result = run_validator(temp_repo)
+    result = run_validator(cap_repo.path)
     # Should pass - aspirational doesn't need code/test evidence
-    assert "CAPABILITY Errors" not in result.stderr
+    assert _ERR_CAP_SECTION not in result.stderr
 
 
-def test_supported_without_tests_passes(temp_repo, run_validator):
+def test_supported_without_tests_passes(cap_repo, run_validator):
     """
     Scenario 7: Supported capability without tests passes.
 
@@ -243,24 +394,11 @@ def test_supported_without_tests_passes(temp_repo, run_validator):
     When: I run the validator
     Then: Validator passes (supported only requires code)
     """
-    create_capability_registry(temp_repo, """
-version: 1
-surfaces:
-  test:
-    description: "Test surface"
-    capabilities:
-      - id: test.partial
-        status: supported
-        summary: "Partially tested capability"
-        notes: "Tests incomplete"
-        evidence:
-          code:
-            - path: src/test.py
-""")
+    write_registry_dict(cap_repo, _REGISTRIES["supported"])
 
-    result = run_validator(temp_repo)
+    result = run_validator(cap_repo.path)
     # Should pass - supported only requires code evidence
-    assert "CAPABILITY Errors" not in result.stderr
+    assert _ERR_CAP_SECTION not in result.stderr
 
 
 # ============================================================================
@@ -268,68 +406,22 @@ surfaces:
 # ============================================================================
 
 
-def test_valid_cap_tag_passes(temp_repo, run_validator):
+def test_valid_cap_tag_passes(cap_repo, run_validator):
     """Valid @cap: tag that references existing capability passes."""
-    create_capability_registry(temp_repo, """
-version: 1
-surfaces:
-  test:
-    description: "Test surface"
-    capabilities:
-      - id: test.feature
-        status: implemented
-        summary: "Test capability"
-        evidence:
-          code:
-            - path: src/test.py
-          tests:
-            - kind: bdd
-              ref: "@cap:test.feature"
-""")
-
-    create_feature_file(temp_repo, "test", """
-Feature: Test feature
-
-  @cap:test.feature
-  Scenario: Test scenario
-    Given something
-    Then something else
-""")
+    write_tree(cap_repo, {
+        "specs/capabilities.yaml": dump_registry(_REGISTRIES["valid_cap_tag"]),
+        "features/test.feature": _FEATURE_VALID_CAP,
+    })
 
-    result = run_validator(temp_repo)
+    result = run_validator(cap_repo.path)
     # Should pass - tag references valid capability
-    assert "CAPABILITY Errors" not in result.stderr
+    assert _ERR_CAP_SECTION not in result.stderr
 
 
-def test_multiple_surfaces_validated(temp_repo, run_validator):
+def test_multiple_surfaces_validated(cap_repo, run_validator):
     """All surfaces in registry are validated."""
-    create_capability_registry(temp_repo, """
-version: 1
-surfaces:
-  surface1:
-    description: "First surface"
-    capabilities:
-      - id: surface1.cap1
-        status: implemented
-        summary: "First capability"
-        evidence:
-          code:
-            - path: src/s1.py
-          tests:
-            - kind: unit
-              ref: tests/test_s1.py
-  surface2:
-    description: "Second surface"
-    capabilities:
-      - id: surface2.cap1
-        status: implemented
-        summary: "Second capability"
-        evidence:
-          code:
-            - path: src/s2.py
-          # Missing tests - should fail
-""")
+    write_registry_dict(cap_repo, _REGISTRIES["multiple_surfaces"])
 
-    result = run_validator(temp_repo)
-    assert "CAPABILITY" in result.stderr
+    result = run_validator(cap_repo.path)
+    assert _ERR_CAP in result.stderr
     assert "surface2.cap1" in result.stderr
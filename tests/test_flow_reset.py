@@ -15,15 +15,31 @@ from swarm.config.flow_registry import (
 )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def flow_registry():
+    """Load a clean FlowRegistry once for this module.
+
+    Every test here only reads the registry, so one load is shared and
+    the singleton is reset again after the module so later modules start
+    clean.
+    """
+    FlowRegistry.reset()
+    yield FlowRegistry.get_instance()
+    FlowRegistry.reset()
+
+
 class TestFlow8Reset:
     """Tests for Flow 8 (Reset) integration."""
 
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset registry between tests."""
-        FlowRegistry.reset()
-        yield
-        FlowRegistry.reset()
+    @pytest.fixture(scope="class")
+    def reset_steps(self):
+        """Steps of the reset flow, loaded once for the class."""
+        return get_flow_steps("reset")
+
+    @pytest.fixture(scope="class")
+    def steps_by_id(self, reset_steps):
+        """Reset flow steps keyed by step id."""
+        return {s.id: s for s in reset_steps}
 
     def test_reset_flow_registered(self):
         """Test that reset flow is registered in the flow registry."""
@@ -50,15 +66,13 @@ class TestFlow8Reset:
         all_keys = get_flow_keys()
         assert "reset" in all_keys
 
-    def test_reset_flow_has_eight_steps(self):
+    def test_reset_flow_has_eight_steps(self, reset_steps):
         """Test that reset flow has exactly 8 steps."""
-        steps = get_flow_steps("reset")
-        assert len(steps) == 8
+        assert len(reset_steps) == 8
 
-    def test_reset_flow_step_ids(self):
+    def test_reset_flow_step_ids(self, reset_steps):
         """Test that reset flow has the expected step IDs."""
-        steps = get_flow_steps("reset")
-        step_ids = [s.id for s in steps]
+        step_ids = [s.id for s in reset_steps]
 
         expected_ids = [
             "diagnose",
@@ -73,10 +87,8 @@ class TestFlow8Reset:
 
         assert step_ids == expected_ids
 
-    def test_reset_flow_step_agents(self):
+    def test_reset_flow_step_agents(self, reset_steps):
         """Test that each reset step has the correct agent."""
-        steps = get_flow_steps("reset")
-
         expected_agents = {
             "diagnose": ("reset-diagnose",),
             "stash_wip": ("reset-stash-wip",),
@@ -88,16 +100,13 @@ class TestFlow8Reset:
             "verify_clean": ("reset-verify-clean",),
         }
 
-        for step in steps:
+        for step in reset_steps:
             assert step.agents == expected_agents[step.id], (
                 f"Step {step.id} has wrong agents: {step.agents}"
             )
 
-    def test_reset_flow_routing_configuration(self):
+    def test_reset_flow_routing_configuration(self, steps_by_id):
         """Test that routing is configured correctly for reset flow."""
-        steps = get_flow_steps("reset")
-        steps_by_id = {s.id: s for s in steps}
-
         # diagnose should route to stash_wip
         diagnose = steps_by_id["diagnose"]
         assert diagnose.routing is not None
@@ -118,11 +127,9 @@ class TestFlow8Reset:
         assert verify.routing.kind == "linear"
         assert verify.routing.next is None
 
-    def test_reset_flow_teaching_notes(self):
+    def test_reset_flow_teaching_notes(self, reset_steps):
         """Test that teaching notes are present on reset steps."""
-        steps = get_flow_steps("reset")
-
-        for step in steps:
+        for step in reset_steps:
             assert step.teaching_notes is not None, (
                 f"Step {step.id} is missing teaching_notes"
             )
@@ -172,13 +179,6 @@ class TestFlow8Reset:
 class TestFlow8AsUtilityFlow:
     """Tests for Flow 8 as a utility/injected flow."""
 
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset registry between tests."""
-        FlowRegistry.reset()
-        yield
-        FlowRegistry.reset()
-
     def test_utility_flows_excluded_from_sdlc_count(self):
         """Test that utility flows don't count toward SDLC total."""
         registry = FlowRegistry.get_instance()
@@ -856,6 +856,45 @@ class TestPhase6EdgeCases:
             f"New event sequence {new_event.seq} should be greater than {max_seq_before}"
         )
 
+    def test_sequence_numbers_see_interleaved_writer(
+        self, temp_run_dir: Dict[str, Path], monkeypatch
+    ) -> None:
+        """Verify a line appended by another writer mid-append is not skipped.
+
+        The other writer lands after this process scanned the log but
+        before its own line, so the next append must rescan from there.
+        """
+        env = temp_run_dir
+        run_id = generate_run_id()
+        run_path = _write_initial_run_artifacts(env["runs_dir"], run_id, "signal")
+
+        def log_event(index: int) -> RunEvent:
+            return RunEvent(
+                run_id=run_id,
+                ts=datetime.now(timezone.utc),
+                kind="log",
+                flow_key="signal",
+                payload={"index": index},
+            )
+
+        storage.append_event(run_id, log_event(0), runs_dir=env["runs_dir"])
+
+        next_seq = storage._next_seq
+
+        def next_seq_after_foreign_write(rid: str) -> int:
+            with open(run_path / storage.EVENTS_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"run_id": rid, "seq": 50, "kind": "log"}) + "\n")
+            return next_seq(rid)
+
+        monkeypatch.setattr(storage, "_next_seq", next_seq_after_foreign_write)
+        storage.append_event(run_id, log_event(1), runs_dir=env["runs_dir"])
+        monkeypatch.setattr(storage, "_next_seq", next_seq)
+
+        storage.append_event(run_id, log_event(2), runs_dir=env["runs_dir"])
+
+        events = storage.read_events(run_id, runs_dir=env["runs_dir"])
+        assert events[-1].seq > 50
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -54,6 +54,18 @@ class TestNormalization:
         normalized = normalize_error_output(error)
         assert "123e4567-e89b-12d3-a456-426614174000" not in normalized
 
+    def test_normalize_removes_uuids_without_digits(self):
+        """All-letter hex UUIDs should still be removed."""
+        error = "Run abcdefab-abcd-abcd-abcd-abcdefabcdef failed"
+        normalized = normalize_error_output(error)
+        assert "abcdefab" not in normalized
+
+    def test_normalize_removes_non_ascii_digits(self):
+        """Line numbers in non-ASCII digits should be removed too."""
+        error = "Error at line \u0664\u0662 in module"
+        normalized = normalize_error_output(error)
+        assert normalized == "error at in module"
+
     def test_normalize_collapses_whitespace(self):
         """Multiple whitespace should be collapsed to single space."""
         error = "Error    with   multiple    spaces"
@@ -265,6 +277,37 @@ class TestProgressTracker:
         # 2 unique out of 3, velocity = 2/3
         assert tracker.get_velocity() == pytest.approx(2/3, rel=0.01)
 
+    def test_velocity_uses_sliding_window(self):
+        """Velocity should only reflect the last stall_threshold iterations."""
+        tracker = ProgressTracker(stall_threshold=3)
+        for error in ("Error A", "Error A", "Error A", "Error B"):
+            tracker.record_iteration(error)
+        # Window is A, A, B
+        assert tracker.get_velocity() == pytest.approx(2/3, rel=0.01)
+        tracker.record_iteration("Error C")
+        # Window is A, B, C
+        assert tracker.get_velocity() == 1.0
+
+    def test_repeated_error_reuses_signature(self, monkeypatch):
+        """Recording the same raw error again should not re-hash it."""
+        import swarm.runtime.progress_tracker as progress_tracker
+
+        tracker = ProgressTracker(stall_threshold=3)
+        calls = []
+        original = progress_tracker.compute_error_signature
+        monkeypatch.setattr(
+            progress_tracker,
+            "compute_error_signature",
+            lambda error: calls.append(error) or original(error),
+        )
+        error = "TypeError: foo"
+        for _ in range(3):
+            tracker.record_iteration(error)
+        tracker.record_iteration("KeyError: bar")
+
+        assert calls == [error, "KeyError: bar"]
+        assert tracker.error_signatures[0] == tracker.error_signatures[2]
+
     def test_record_success_breaks_stall(self):
         """Recording success should break a stall pattern."""
         tracker = ProgressTracker(stall_threshold=3)
@@ -283,6 +326,17 @@ class TestProgressTracker:
         assert len(tracker.error_signatures) == 0
         assert not tracker.is_stalled()
 
+    def test_reset_clears_stall_count(self):
+        """Reset should restart the consecutive-signature run."""
+        tracker = ProgressTracker(stall_threshold=2)
+        tracker.record_iteration("Same error")
+        tracker.record_iteration("Same error")
+        tracker.reset()
+        assert tracker.get_stall_count() == 0
+        tracker.record_iteration("Same error")
+        assert tracker.get_stall_count() == 1
+        assert not tracker.is_stalled()
+
     def test_len_returns_iteration_count(self):
         """len(tracker) should return number of iterations."""
         tracker = ProgressTracker()
@@ -334,6 +388,42 @@ class TestStallInfo:
         assert info.stall_count == 6
         assert info.recommendation == "escalate"
 
+    def test_get_stall_info_zero_threshold(self):
+        """A zero stall threshold should not divide by zero."""
+        tracker = ProgressTracker(stall_threshold=0)
+        tracker.record_iteration("Same error")
+        tracker.record_iteration("Same error")
+        info = tracker.get_stall_info()
+
+        assert info.is_stalled
+        assert info.recommendation == "escalate"
+
+    def test_zero_threshold_different_errors_not_stalled(self):
+        """A zero stall threshold should not stall on a fresh tracker or changing errors."""
+        tracker = ProgressTracker(stall_threshold=0)
+        assert not tracker.is_stalled()
+
+        tracker.record_iteration("Error 1")
+        tracker.record_iteration("Error 2")
+
+        assert not tracker.is_stalled()
+        assert not tracker.get_stall_info().is_stalled
+
+    def test_stall_info_cached_until_next_iteration(self):
+        """Repeated polls should share one StallInfo until state changes."""
+        tracker = ProgressTracker(stall_threshold=3)
+        tracker.record_iteration("Error 1")
+        info = tracker.get_stall_info()
+        assert tracker.get_stall_info() is info
+
+        tracker.record_iteration("Error 1")
+        updated = tracker.get_stall_info()
+        assert updated is not info
+        assert updated.stall_count == 2
+
+        tracker.reset()
+        assert tracker.get_stall_info().total_iterations == 0
+
     def test_stall_info_last_signature(self):
         """StallInfo should include the last signature."""
         tracker = ProgressTracker()
@@ -394,6 +484,16 @@ class TestSerialization:
         assert len(data["timestamps"]) == 2
         assert len(data["categories"]) == 2
 
+    def test_tracker_to_dict_includes_deferred_categories(self):
+        """Categories extracted lazily should still be serialized."""
+        tracker = ProgressTracker()
+        tracker.record_iteration("ImportError: no module")
+        tracker.record_iteration("TypeError: not callable")
+
+        data = tracker_to_dict(tracker)
+
+        assert data["categories"] == ["import_error", "type_error"]
+
     def test_tracker_from_dict(self):
         """ProgressTracker should deserialize from dict correctly."""
         tracker = ProgressTracker(stall_threshold=4)
@@ -407,6 +507,39 @@ class TestSerialization:
         assert len(restored.error_signatures) == 2
         assert restored.error_signatures == tracker.error_signatures
 
+    def test_tracker_timestamps_roundtrip(self):
+        """Serialized timestamps should survive a roundtrip unchanged."""
+        tracker = ProgressTracker()
+        tracker.record_iteration("Error A")
+        tracker.record_success()
+
+        data = tracker_to_dict(tracker)
+        restored = tracker_from_dict(data)
+
+        assert tracker_to_dict(restored)["timestamps"] == data["timestamps"]
+        assert [ts for _, _, ts in restored.get_signature_history()] == [
+            datetime.fromisoformat(ts) for ts in data["timestamps"]
+        ]
+
+    def test_record_batch_matches_incremental_recording(self):
+        """Bulk-appended history should yield the same derived state."""
+        source = ProgressTracker(stall_threshold=3)
+        for error in ("Error A", "Error B", "Error B", "Error B"):
+            source.record_iteration(error)
+        sigs, cats, stamps = zip(*source.get_signature_history())
+
+        restored = ProgressTracker(stall_threshold=3)
+        # Split so the trailing run spans two batches
+        restored.record_batch(sigs[:2], cats[:2], stamps[:2])
+        restored.record_batch(sigs[2:], cats[2:], stamps[2:])
+
+        assert len(restored) == len(source)
+        assert restored.get_stall_count() == 3
+        assert restored.is_stalled()
+        assert restored.get_velocity() == source.get_velocity()
+        assert restored.get_stall_info().unique_signatures == 2
+        assert restored.get_signature_history() == source.get_signature_history()
+
     def test_tracker_roundtrip(self):
         """ProgressTracker should survive serialization roundtrip."""
         tracker = ProgressTracker(stall_threshold=3)
@@ -497,6 +630,18 @@ class TestFactoryFunction:
         tracker = create_tracker(stall_threshold=7)
         assert tracker.stall_threshold == 7
 
+    def test_create_tracker_custom_capacity(self):
+        """create_tracker should bound history to the requested capacity."""
+        tracker = create_tracker(stall_threshold=3, capacity=4)
+        for i in range(6):
+            tracker.record_iteration(f"Error {chr(65 + i)}")
+        assert len(tracker.error_signatures) == 4
+        assert len(tracker) == 6
+
+        restored = tracker_from_dict(tracker_to_dict(tracker))
+        assert restored.capacity == 4
+        assert restored.error_signatures == tracker.error_signatures
+
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
@@ -521,6 +666,30 @@ class TestEdgeCases:
         tracker.record_iteration("Error: \u2603 snowman failed \U0001F4A5")
         assert len(tracker) == 1
 
+    def test_history_is_bounded(self):
+        """History buffers are capped; counts still cover every iteration."""
+        tracker = ProgressTracker(stall_threshold=3)
+        for _ in range(200):
+            tracker.record_iteration("Same error")
+
+        assert len(tracker) == 200
+        assert len(tracker.error_signatures) == 128
+        assert len(tracker.get_signature_history()) == 128
+        info = tracker.get_stall_info()
+        assert info.stall_count == 200
+        assert info.total_iterations == 200
+
+    def test_unique_signatures_forget_evicted_history(self):
+        """unique_signatures should only count retained history."""
+        tracker = ProgressTracker(stall_threshold=3)
+        tracker.record_iteration("Error A")
+        for _ in range(127):
+            tracker.record_iteration("Error B")
+        assert tracker.get_stall_info().unique_signatures == 2
+
+        tracker.record_iteration("Error B")
+        assert tracker.get_stall_info().unique_signatures == 1
+
     def test_signature_history(self):
         """get_signature_history should return correct data."""
         tracker = ProgressTracker()
@@ -17,6 +17,7 @@ step_result is a StepResult object (not a dict).
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 from swarm.config.flow_registry import StepDefinition, StepRouting
@@ -83,6 +84,13 @@ class TestStepResultToDict:
         result = _step_result_to_dict(input_dict)
         assert result is input_dict  # Same object, not a copy
 
+    def test_read_only_mapping_is_copied(self) -> None:
+        """Non-dict mappings keep their fields instead of becoming empty."""
+        input_mapping = MappingProxyType({"status": "VERIFIED", "output": "test"})
+        result = _step_result_to_dict(input_mapping)
+        assert isinstance(result, dict)
+        assert result == {"status": "VERIFIED", "output": "test"}
+
     def test_converts_stepresult_dataclass(self) -> None:
         """StepResult-like dataclass is converted to dict with all fields."""
         step_result = MockStepResult(
@@ -3,11 +3,20 @@ Tests for the shadow_fork module.
 
 These tests verify the Shadow Fork isolation layer for safe speculative
 execution, including branch creation, checkpointing, rollback, and cleanup.
+
+Git is faked on the ShadowFork class and restored after each test, every
+test works in its own tmp_path, and the module-level registries are reset
+around each test, so the file needs no xdist_group and runs under
+``make test-parallel`` (``-n auto``).
 """
 
-from unittest.mock import patch
+import io
+import logging
+import os
+from unittest.mock import MagicMock, patch
 
 import pytest
+from swarm.runtime import shadow_fork
 from swarm.runtime.shadow_fork import (
     MARKER_FILE,
     PRE_PUSH_HOOK_MARKER,
@@ -17,6 +26,53 @@ from swarm.runtime.shadow_fork import (
 )
 
 
+# ``git status --porcelain=v2 --branch`` for a clean checkout of main
+STATUS_ON_MAIN = "# branch.oid abc123\n# branch.head main\n# branch.upstream origin/main"
+
+
+class FakeGit:
+    """Stand-in for ShadowFork._run_git that replays scripted results.
+
+    Results are taken from ``side_effect`` in order, then ``return_value``;
+    the argument list of every call is recorded in ``calls``. ShadowFork
+    instances have no ``__dict__``, so the fake is installed on the class
+    and restored by ``_isolated_module_state``.
+    """
+
+    def __init__(self, fork):
+        self.calls = []
+        self.side_effect = []
+        self.return_value = None
+        type(fork)._run_git = self
+
+    def __call__(self, args, timeout=30.0, check=True):
+        self.calls.append(args)
+        if self.side_effect:
+            return self.side_effect.pop(0)
+        if self.return_value is None:
+            raise AssertionError(f"Unexpected git call: {args}")
+        return self.return_value
+
+
+@pytest.fixture(autouse=True)
+def _isolated_module_state(monkeypatch):
+    """Keep the fork registry, marker cache and FakeGit swaps per-test."""
+    monkeypatch.setattr(ShadowFork, "_run_git", ShadowFork._run_git)
+    shadow_fork._ACTIVE.clear()
+    shadow_fork._STATE_CACHE.clear()
+    yield
+    shadow_fork._ACTIVE.clear()
+    shadow_fork._STATE_CACHE.clear()
+
+
+@pytest.fixture
+def hooks_dir(tmp_path):
+    """Create the .git/hooks directory ShadowFork installs its guard into."""
+    path = tmp_path / ".git" / "hooks"
+    path.mkdir(parents=True)
+    return path
+
+
 class TestShadowForkBasics:
     """Basic tests for ShadowFork dataclass."""
 
@@ -29,6 +85,14 @@ class TestShadowForkBasics:
         assert fork.base_branch == "main"
         assert fork._push_allowed is False
 
+    def test_has_slots(self, tmp_path):
+        """Test ShadowFork instances carry no per-instance __dict__."""
+        fork = ShadowFork(repo_root=tmp_path)
+        assert not hasattr(fork, "__dict__")
+        fork._push_allowed = True
+        with pytest.raises(AttributeError):
+            fork.unexpected = 1
+
     def test_custom_base_branch(self, tmp_path):
         """Test creating with custom base branch."""
         fork = ShadowFork(repo_root=tmp_path, base_branch="develop")
@@ -38,29 +102,32 @@ class TestShadowForkBasics:
 class TestShadowForkCreate:
     """Tests for shadow fork creation."""
 
+    @pytest.mark.usefixtures("hooks_dir")
     def test_create_success(self, tmp_path):
         """Test successful shadow fork creation."""
         fork = ShadowFork(repo_root=tmp_path)
 
-        with patch.object(fork, "_run_git") as mock_git:
+        with patch.object(ShadowFork, "_run_git") as mock_git:
             mock_git.side_effect = [
-                (True, "main", ""),  # Get current branch
-                (True, "", ""),      # Check for uncommitted changes
-                (True, "", ""),      # Verify base branch exists
-                (True, "", ""),      # Create and switch to shadow branch
-                (True, "", ""),      # Install push guard (rev-parse in block_upstream_push)
+                (True, STATUS_ON_MAIN, ""),  # Current branch and worktree status
+                (True, "", ""),              # Create and switch to shadow branch
             ]
 
-            # Create hooks directory for the test
-            (tmp_path / ".git" / "hooks").mkdir(parents=True)
-
             branch = fork.create(base_branch="main")
 
+            assert mock_git.call_count == 2
+
             assert branch.startswith(SHADOW_BRANCH_PREFIX)
             assert fork.shadow_branch == branch
             assert fork.original_branch == "main"
             assert (tmp_path / MARKER_FILE).exists()
 
+        # Marker is written via a temp file that is renamed into place
+        assert [p.name for p in tmp_path.iterdir() if p.is_file()] == [MARKER_FILE]
+        loaded = load_shadow_state(tmp_path)
+        assert loaded.shadow_branch == branch
+        assert loaded.original_branch == "main"
+
     def test_create_fails_if_already_active(self, tmp_path):
         """Test that create fails if shadow fork is already active."""
         # Create marker file
@@ -72,38 +139,97 @@ class TestShadowForkCreate:
         with pytest.raises(RuntimeError, match="Shadow fork already active"):
             fork.create()
 
+    @pytest.mark.usefixtures("hooks_dir")
+    def test_create_fails_if_active_in_process(self, tmp_path):
+        """Test that a second fork in the same process is refused without the marker."""
+        fork = ShadowFork(repo_root=tmp_path)
+        # Another spelling of the same root still finds the active fork
+        (tmp_path / "sub").mkdir()
+        other = ShadowFork(repo_root=tmp_path / "sub" / "..")
+
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, STATUS_ON_MAIN, ""),  # Current branch and worktree status
+            (True, "", ""),              # Create and switch to shadow branch
+        ]
+        fork.create()
+
+        (tmp_path / MARKER_FILE).unlink()
+        with pytest.raises(RuntimeError, match="Shadow fork already active"):
+            other.create()
+
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, "main", ""),  # Get current branch
+            (True, "", ""),      # Delete shadow branch
+        ]
+        fork.cleanup(success=True)
+
+        git = FakeGit(other)
+        git.side_effect = [
+            (True, STATUS_ON_MAIN, ""),
+            (True, "", ""),
+        ]
+        assert other.create().startswith(SHADOW_BRANCH_PREFIX)
+
     def test_create_fails_if_base_branch_missing(self, tmp_path):
         """Test that create fails if base branch doesn't exist."""
         fork = ShadowFork(repo_root=tmp_path)
 
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.side_effect = [
-                (True, "main", ""),    # Get current branch
-                (True, "", ""),        # Check for uncommitted changes
-                (False, "", "fatal"),  # Base branch doesn't exist
-            ]
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, STATUS_ON_MAIN, ""),  # Current branch and worktree status
+            (False, "", "fatal: 'nonexistent' is not a commit"),  # Create shadow branch
+            (False, "", ""),             # Diagnose: base branch doesn't exist
+        ]
 
-            with pytest.raises(RuntimeError, match="does not exist"):
-                fork.create(base_branch="nonexistent")
+        with pytest.raises(RuntimeError, match="does not exist"):
+            fork.create(base_branch="nonexistent")
+        assert fork.shadow_branch is None
 
-    def test_create_warns_on_uncommitted_changes(self, tmp_path, caplog):
-        """Test that create warns about uncommitted changes."""
+    def test_create_fails_if_branch_cannot_be_created(self, tmp_path):
+        """Test that create reports a checkout failure when the base exists."""
         fork = ShadowFork(repo_root=tmp_path)
 
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.side_effect = [
-                (True, "main", ""),           # Get current branch
-                (True, " M file.txt", ""),    # Uncommitted changes exist
-                (True, "", ""),               # Verify base branch exists
-                (True, "", ""),               # Create and switch to shadow branch
-            ]
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, STATUS_ON_MAIN, ""),  # Current branch and worktree status
+            (False, "", "fatal: cannot lock ref"),  # Create shadow branch
+            (True, "", ""),              # Diagnose: base branch exists
+        ]
+
+        with pytest.raises(RuntimeError, match="Failed to create shadow branch"):
+            fork.create()
+
+    def test_create_fails_if_detached(self, tmp_path):
+        """Test that create refuses to run on a detached HEAD."""
+        fork = ShadowFork(repo_root=tmp_path)
 
-            # Create hooks directory for the test
-            (tmp_path / ".git" / "hooks").mkdir(parents=True)
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, "# branch.oid abc123\n# branch.head (detached)", ""),
+        ]
 
+        with pytest.raises(RuntimeError, match="Not on a branch"):
             fork.create()
 
-            assert "uncommitted changes" in caplog.text.lower()
+    @pytest.mark.usefixtures("hooks_dir")
+    def test_create_warns_on_uncommitted_changes(self, tmp_path, caplog):
+        """Test that create warns about uncommitted changes."""
+        fork = ShadowFork(repo_root=tmp_path)
+
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, STATUS_ON_MAIN + "\n1 .M N... 100644 100644 100644 a b file.txt", ""),
+            (True, "", ""),  # Create and switch to shadow branch
+        ]
+
+        fork.create()
+
+        assert any(
+            r.levelno == logging.WARNING and "uncommitted changes" in r.getMessage()
+            for r in caplog.records
+        )
 
 
 class TestShadowForkGetDiff:
@@ -117,13 +243,54 @@ class TestShadowForkGetDiff:
             base_branch="main",
         )
 
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.return_value = (True, "+new line\n-old line", "")
+        git = FakeGit(fork)
+        git.return_value = (True, "+new line\n-old line", "")
 
-            diff = fork.get_diff()
+        diff = fork.get_diff()
 
-            assert "+new line" in diff
-            assert "-old line" in diff
+        assert "+new line" in diff
+        assert "-old line" in diff
+
+    def test_get_diff_into_streams_raw_bytes(self, tmp_path):
+        """Test the diff is copied into the sink in chunks, undecoded."""
+        fork = ShadowFork(
+            repo_root=tmp_path,
+            shadow_branch="shadow/test",
+            base_branch="main",
+        )
+        payload = b"+caf\xe9\n" * 50_000
+        proc = MagicMock()
+        proc.__enter__.return_value = proc
+        proc.stdout = io.BytesIO(payload)
+        proc.wait.return_value = 0
+        sink = io.BytesIO()
+
+        with patch("swarm.runtime.shadow_fork.subprocess.Popen", return_value=proc) as popen:
+            written = fork.get_diff_into(sink)
+
+        assert written == len(payload)
+        assert sink.getvalue() == payload
+        assert popen.call_args.args[0][1:] == ["diff", "main...shadow/test"]
+
+    def test_get_diff_into_failure(self, tmp_path, caplog):
+        """Test a failing git diff is reported as -1."""
+        fork = ShadowFork(
+            repo_root=tmp_path,
+            shadow_branch="shadow/test",
+        )
+        proc = MagicMock()
+        proc.__enter__.return_value = proc
+        proc.stdout = io.BytesIO(b"")
+        proc.wait.return_value = 128
+
+        def popen(args, stderr, **kwargs):
+            stderr.write(b"fatal: bad revision")
+            return proc
+
+        with patch("swarm.runtime.shadow_fork.subprocess.Popen", side_effect=popen):
+            assert fork.get_diff_into(io.BytesIO()) == -1
+
+        assert any("fatal: bad revision" in r.getMessage() for r in caplog.records)
 
     def test_get_diff_no_shadow(self, tmp_path, caplog):
         """Test get_diff when no shadow branch is active."""
@@ -132,7 +299,7 @@ class TestShadowForkGetDiff:
         diff = fork.get_diff()
 
         assert diff == ""
-        assert "No shadow branch active" in caplog.text
+        assert any("No shadow branch active" in r.getMessage() for r in caplog.records)
 
 
 class TestShadowForkCheckpoint:
@@ -140,22 +307,29 @@ class TestShadowForkCheckpoint:
 
     def test_commit_checkpoint_success(self, tmp_path):
         """Test successful checkpoint creation."""
+        sha = "abc123" + "0" * 34
         fork = ShadowFork(
             repo_root=tmp_path,
             shadow_branch="shadow/test",
         )
 
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.side_effect = [
-                (True, "", ""),       # git add -A
-                (False, "", ""),      # git diff --cached --quiet (has changes)
-                (True, "", ""),       # git commit
-                (True, "abc123", ""), # git rev-parse HEAD
-            ]
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, "", ""),  # git add -A
+            (True, f"[shadow/test {sha}] [checkpoint] test checkpoint", ""),
+        ]
 
-            sha = fork.commit_checkpoint("test checkpoint")
+        result = fork.commit_checkpoint("test checkpoint")
 
-            assert sha == "abc123"
+        assert result == sha
+        assert len(git.calls) == 2
+        assert git.calls[1] == [
+            "-c",
+            "core.abbrev=no",
+            "commit",
+            "-m",
+            "[checkpoint] test checkpoint",
+        ]
 
     def test_commit_checkpoint_no_changes(self, tmp_path):
         """Test checkpoint when there are no changes."""
@@ -164,16 +338,32 @@ class TestShadowForkCheckpoint:
             shadow_branch="shadow/test",
         )
 
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.side_effect = [
-                (True, "", ""),       # git add -A
-                (True, "", ""),       # git diff --cached --quiet (no changes)
-                (True, "def456", ""), # git rev-parse HEAD (current)
-            ]
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, "", ""),       # git add -A
+            (False, "nothing to commit, working tree clean", ""),
+            (True, "def456", ""), # git rev-parse HEAD (current)
+        ]
 
-            sha = fork.commit_checkpoint("no changes")
+        sha = fork.commit_checkpoint("no changes")
 
-            assert sha == "def456"
+        assert sha == "def456"
+
+    def test_commit_checkpoint_failure(self, tmp_path):
+        """Test checkpoint raises when git commit fails for another reason."""
+        fork = ShadowFork(
+            repo_root=tmp_path,
+            shadow_branch="shadow/test",
+        )
+
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, "", ""),  # git add -A
+            (False, "", "fatal: unable to write new index file"),
+        ]
+
+        with pytest.raises(RuntimeError, match="unable to write"):
+            fork.commit_checkpoint("broken")
 
     def test_commit_checkpoint_no_shadow(self, tmp_path):
         """Test checkpoint fails when no shadow branch is active."""
@@ -193,16 +383,16 @@ class TestShadowForkRollback:
             shadow_branch="shadow/test",
         )
 
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.side_effect = [
-                (True, "", ""),  # Verify commit exists
-                (True, "", ""),  # Hard reset
-            ]
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, "", ""),  # Verify commit exists
+            (True, "", ""),  # Hard reset
+        ]
 
-            result = fork.rollback_to("abc123")
+        result = fork.rollback_to("abc123")
 
-            assert result is True
-            mock_git.assert_any_call(["reset", "--hard", "abc123"])
+        assert result is True
+        assert ["reset", "--hard", "abc123"] in git.calls
 
     def test_rollback_commit_not_found(self, tmp_path):
         """Test rollback fails when commit doesn't exist."""
@@ -211,12 +401,12 @@ class TestShadowForkRollback:
             shadow_branch="shadow/test",
         )
 
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.return_value = (False, "", "bad object")
+        git = FakeGit(fork)
+        git.return_value = (False, "", "bad object")
 
-            result = fork.rollback_to("nonexistent")
+        result = fork.rollback_to("nonexistent")
 
-            assert result is False
+        assert result is False
 
     def test_rollback_no_shadow(self, tmp_path):
         """Test rollback fails when no shadow branch is active."""
@@ -239,15 +429,15 @@ class TestShadowForkBridge:
         )
         fork._push_allowed = True
 
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.side_effect = [
-                (True, "", ""),  # Checkout main
-                (True, "", ""),  # Merge shadow branch
-            ]
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, "", ""),  # Checkout main
+            (True, "", ""),  # Merge shadow branch
+        ]
 
-            result = fork.bridge_to_main()
+        result = fork.bridge_to_main()
 
-            assert result is True
+        assert result is True
 
     def test_bridge_fails_without_allow_push(self, tmp_path):
         """Test bridge fails when push is not allowed."""
@@ -272,11 +462,9 @@ class TestShadowForkBridge:
 class TestShadowForkPushGuard:
     """Tests for push guard functionality."""
 
-    def test_block_upstream_push(self, tmp_path):
+    def test_block_upstream_push(self, tmp_path, hooks_dir):
         """Test installing push guard hook."""
         fork = ShadowFork(repo_root=tmp_path)
-        hooks_dir = tmp_path / ".git" / "hooks"
-        hooks_dir.mkdir(parents=True)
 
         fork.block_upstream_push()
 
@@ -285,12 +473,17 @@ class TestShadowForkPushGuard:
         content = hook_path.read_text(encoding="utf-8")
         assert PRE_PUSH_HOOK_MARKER in content
         assert MARKER_FILE in content
+        assert content.startswith("#!/bin/sh\n")
+        if os.name == "posix":
+            assert os.access(hook_path, os.X_OK)
+
+        # Installing again leaves a single guard
+        fork.block_upstream_push()
+        assert hook_path.read_text(encoding="utf-8") == content
 
-    def test_block_upstream_push_appends_to_existing(self, tmp_path):
+    def test_block_upstream_push_appends_to_existing(self, tmp_path, hooks_dir):
         """Test that push guard appends to existing hook."""
         fork = ShadowFork(repo_root=tmp_path)
-        hooks_dir = tmp_path / ".git" / "hooks"
-        hooks_dir.mkdir(parents=True)
         hook_path = hooks_dir / "pre-push"
         hook_path.write_text("#!/bin/sh\necho 'existing hook'\n")
 
@@ -300,11 +493,23 @@ class TestShadowForkPushGuard:
         assert "existing hook" in content
         assert PRE_PUSH_HOOK_MARKER in content
 
-    def test_allow_push(self, tmp_path):
+    def test_allow_push_keeps_existing_hook(self, tmp_path, hooks_dir):
+        """Test removing the guard leaves a user's hook byte-for-byte intact."""
+        fork = ShadowFork(repo_root=tmp_path)
+        hook_path = hooks_dir / "pre-push"
+        original = b"#!/bin/sh\necho 'caf\xe9'\n"
+        hook_path.write_bytes(original)
+
+        fork.block_upstream_push()
+        fork.allow_push()
+
+        content = hook_path.read_bytes()
+        assert content.startswith(original)
+        assert PRE_PUSH_HOOK_MARKER.encode() not in content
+
+    def test_allow_push(self, tmp_path, hooks_dir):
         """Test removing push guard."""
         fork = ShadowFork(repo_root=tmp_path)
-        hooks_dir = tmp_path / ".git" / "hooks"
-        hooks_dir.mkdir(parents=True)
 
         # Install guard first
         fork.block_upstream_push()
@@ -321,6 +526,7 @@ class TestShadowForkPushGuard:
 class TestShadowForkCleanup:
     """Tests for cleanup functionality."""
 
+    @pytest.mark.usefixtures("hooks_dir")
     def test_cleanup_success(self, tmp_path):
         """Test cleanup after successful run."""
         fork = ShadowFork(
@@ -334,21 +540,19 @@ class TestShadowForkCleanup:
         marker = tmp_path / MARKER_FILE
         marker.write_text("test")
 
-        # Create hooks directory
-        (tmp_path / ".git" / "hooks").mkdir(parents=True)
-
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.side_effect = [
-                (True, "shadow/test", ""),  # Get current branch
-                (True, "", ""),              # Checkout base branch
-                (True, "", ""),              # Delete shadow branch
-            ]
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, "shadow/test", ""),  # Get current branch
+            (True, "", ""),              # Checkout base branch
+            (True, "", ""),              # Delete shadow branch
+        ]
 
-            fork.cleanup(success=True)
+        fork.cleanup(success=True)
 
-            assert not marker.exists()
-            assert fork.shadow_branch is None
+        assert not marker.exists()
+        assert fork.shadow_branch is None
 
+    @pytest.mark.usefixtures("hooks_dir")
     def test_cleanup_failure(self, tmp_path):
         """Test cleanup after failed run."""
         fork = ShadowFork(
@@ -362,22 +566,19 @@ class TestShadowForkCleanup:
         marker = tmp_path / MARKER_FILE
         marker.write_text("test")
 
-        # Create hooks directory
-        (tmp_path / ".git" / "hooks").mkdir(parents=True)
+        git = FakeGit(fork)
+        git.side_effect = [
+            (True, "shadow/test", ""),  # Get current branch
+            (True, "", ""),              # Checkout original branch
+            (True, "", ""),              # Delete shadow branch
+        ]
 
-        with patch.object(fork, "_run_git") as mock_git:
-            mock_git.side_effect = [
-                (True, "shadow/test", ""),  # Get current branch
-                (True, "", ""),              # Checkout original branch
-                (True, "", ""),              # Delete shadow branch
-            ]
+        fork.cleanup(success=False)
 
-            fork.cleanup(success=False)
-
-            assert not marker.exists()
-            assert fork.shadow_branch is None
-            # Should have tried to checkout original branch
-            mock_git.assert_any_call(["checkout", "feature-x"], check=False)
+        assert not marker.exists()
+        assert fork.shadow_branch is None
+        # Should have tried to checkout original branch
+        assert ["checkout", "feature-x"] in git.calls
 
 
 class TestLoadShadowState:
@@ -400,6 +601,22 @@ class TestLoadShadowState:
         assert fork.original_branch == "feature-x"
         assert fork.base_branch == "main"
 
+    def test_load_state_reparses_changed_marker(self, tmp_path):
+        """Test repeated loads return fresh forks and see marker rewrites."""
+        marker = tmp_path / MARKER_FILE
+        marker.write_text("shadow_branch=shadow/a\noriginal_branch=main\n")
+
+        first = load_shadow_state(tmp_path)
+        second = load_shadow_state(tmp_path)
+        assert first is not second
+        assert second.shadow_branch == "shadow/a"
+
+        marker.write_text("shadow_branch=shadow/bb\noriginal_branch=main\n")
+        assert load_shadow_state(tmp_path).shadow_branch == "shadow/bb"
+
+        marker.unlink()
+        assert load_shadow_state(tmp_path) is None
+
     def test_load_no_state(self, tmp_path):
         """Test loading when no shadow fork is active."""
         fork = load_shadow_state(tmp_path)
@@ -410,90 +627,80 @@ class TestLoadShadowState:
 class TestShadowForkIntegration:
     """Integration tests for the full shadow fork workflow."""
 
+    @pytest.mark.usefixtures("hooks_dir")
     def test_full_workflow_success(self, tmp_path):
         """Test complete success workflow: create -> checkpoint -> bridge -> cleanup."""
-        # Create hooks directory
-        (tmp_path / ".git" / "hooks").mkdir(parents=True)
-
         fork = ShadowFork(repo_root=tmp_path)
 
-        with patch.object(fork, "_run_git") as mock_git:
-            # Create shadow
-            mock_git.side_effect = [
-                (True, "main", ""),    # Get current branch
-                (True, "", ""),        # Check uncommitted changes
-                (True, "", ""),        # Verify base branch
-                (True, "", ""),        # Create shadow branch
-            ]
-            branch = fork.create()
-            assert branch.startswith(SHADOW_BRANCH_PREFIX)
-
-            # Checkpoint
-            mock_git.side_effect = [
-                (True, "", ""),        # git add
-                (False, "", ""),       # git diff (has changes)
-                (True, "", ""),        # git commit
-                (True, "abc123", ""),  # git rev-parse
-            ]
-            sha = fork.commit_checkpoint("WIP")
-            assert sha == "abc123"
-
-            # Bridge to main
-            fork._push_allowed = True
-            mock_git.side_effect = [
-                (True, "", ""),  # Checkout main
-                (True, "", ""),  # Merge
-            ]
-            result = fork.bridge_to_main()
-            assert result is True
-
-            # Cleanup
-            mock_git.side_effect = [
-                (True, "main", ""),   # Get current branch
-                (True, "", ""),       # Delete shadow branch
-            ]
-            fork.cleanup(success=True)
-            assert fork.shadow_branch is None
+        git = FakeGit(fork)
+        # Create shadow
+        git.side_effect = [
+            (True, STATUS_ON_MAIN, ""),  # Current branch and worktree status
+            (True, "", ""),              # Create shadow branch
+        ]
+        branch = fork.create()
+        assert branch.startswith(SHADOW_BRANCH_PREFIX)
+
+        # Checkpoint
+        git.side_effect = [
+            (True, "", ""),        # git add
+            (True, "", ""),        # git commit
+            (True, "abc123", ""),  # git rev-parse (SHA not in output)
+        ]
+        sha = fork.commit_checkpoint("WIP")
+        assert sha == "abc123"
+
+        # Bridge to main
+        fork._push_allowed = True
+        git.side_effect = [
+            (True, "", ""),  # Checkout main
+            (True, "", ""),  # Merge
+        ]
+        result = fork.bridge_to_main()
+        assert result is True
+
+        # Cleanup
+        git.side_effect = [
+            (True, "main", ""),   # Get current branch
+            (True, "", ""),       # Delete shadow branch
+        ]
+        fork.cleanup(success=True)
+        assert fork.shadow_branch is None
 
+    @pytest.mark.usefixtures("hooks_dir")
     def test_full_workflow_failure(self, tmp_path):
         """Test complete failure workflow: create -> checkpoint -> rollback -> cleanup."""
-        # Create hooks directory
-        (tmp_path / ".git" / "hooks").mkdir(parents=True)
-
         fork = ShadowFork(repo_root=tmp_path)
 
-        with patch.object(fork, "_run_git") as mock_git:
-            # Create shadow
-            mock_git.side_effect = [
-                (True, "feature-x", ""),  # Get current branch
-                (True, "", ""),           # Check uncommitted changes
-                (True, "", ""),           # Verify base branch
-                (True, "", ""),           # Create shadow branch
-            ]
-            fork.create()
-
-            # Checkpoint
-            mock_git.side_effect = [
-                (True, "", ""),        # git add
-                (False, "", ""),       # git diff (has changes)
-                (True, "", ""),        # git commit
-                (True, "abc123", ""),  # git rev-parse
-            ]
-            sha = fork.commit_checkpoint("WIP")
-
-            # Rollback
-            mock_git.side_effect = [
-                (True, "", ""),  # Verify commit
-                (True, "", ""),  # Hard reset
-            ]
-            result = fork.rollback_to(sha)
-            assert result is True
-
-            # Cleanup (failure case)
-            mock_git.side_effect = [
-                (True, fork.shadow_branch, ""),  # Get current branch
-                (True, "", ""),                   # Checkout original
-                (True, "", ""),                   # Delete shadow
-            ]
-            fork.cleanup(success=False)
-            assert fork.shadow_branch is None
+        git = FakeGit(fork)
+        # Create shadow
+        git.side_effect = [
+            (True, "# branch.oid abc123\n# branch.head feature-x", ""),
+            (True, "", ""),  # Create shadow branch
+        ]
+        fork.create()
+
+        # Checkpoint
+        git.side_effect = [
+            (True, "", ""),        # git add
+            (True, "", ""),        # git commit
+            (True, "abc123", ""),  # git rev-parse (SHA not in output)
+        ]
+        sha = fork.commit_checkpoint("WIP")
+
+        # Rollback
+        git.side_effect = [
+            (True, "", ""),  # Verify commit
+            (True, "", ""),  # Hard reset
+        ]
+        result = fork.rollback_to(sha)
+        assert result is True
+
+        # Cleanup (failure case)
+        git.side_effect = [
+            (True, fork.shadow_branch, ""),  # Get current branch
+            (True, "", ""),                   # Checkout original
+            (True, "", ""),                   # Delete shadow
+        ]
+        fork.cleanup(success=False)
+        assert fork.shadow_branch is None
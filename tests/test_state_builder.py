@@ -7,15 +7,20 @@ Tests cover:
 - verify_run_state: State verification against stored state
 - recover_run_state: Crash recovery functionality
 - Edge cases: Missing events, malformed data, partial runs
+
+Every test uses its own tmp_path and run_id, so the file distributes
+cleanly across workers (`make test-parallel`, i.e. pytest -n auto).
 """
 
+import inspect
 from datetime import datetime, timezone
 
 import pytest
 
-from swarm.runtime import storage
+from swarm.runtime import state_builder, storage
 from swarm.runtime.state_builder import (
     rebuild_run_state,
+    rebuild_run_states,
     recover_run_state,
     verify_run_state,
     _apply_event,
@@ -149,6 +154,77 @@ class TestRebuildRunState:
         assert "1" in state.handoff_envelopes
         assert state.handoff_envelopes["1"].summary == "Step 1 completed successfully"
 
+    def test_rebuild_decodes_only_last_envelope_per_step(self, tmp_path, monkeypatch):
+        """Should decode one envelope per step when a step completes repeatedly."""
+        run_id = "test-rebuild-003b"
+        now = datetime.now(timezone.utc)
+
+        for i in range(3):
+            envelope = HandoffEnvelope(
+                step_id="1",
+                flow_key="signal",
+                run_id=run_id,
+                routing_signal=RoutingSignal(decision=RoutingDecision.LOOP),
+                summary=f"Iteration {i}",
+                status="succeeded",
+            )
+            storage.append_event(
+                run_id,
+                RunEvent(
+                    run_id=run_id,
+                    ts=now,
+                    kind="step_completed",
+                    flow_key="signal",
+                    step_id="1",
+                    payload={"envelope": handoff_envelope_to_dict(envelope)},
+                ),
+                runs_dir=tmp_path,
+            )
+
+        decoded = []
+        original_from_dict = state_builder.handoff_envelope_from_dict
+
+        def counting_from_dict(data):
+            decoded.append(data["summary"])
+            return original_from_dict(data)
+
+        monkeypatch.setattr(state_builder, "handoff_envelope_from_dict", counting_from_dict)
+        state = rebuild_run_state(run_id, runs_dir=tmp_path)
+
+        assert decoded == ["Iteration 2"]
+        assert state.handoff_envelopes["1"].summary == "Iteration 2"
+
+    def test_rebuild_falls_back_past_malformed_last_envelope(self, tmp_path):
+        """Should keep the newest envelope that decodes when a later one is malformed."""
+        run_id = "test-rebuild-003c"
+        now = datetime.now(timezone.utc)
+
+        envelope = HandoffEnvelope(
+            step_id="1",
+            flow_key="signal",
+            run_id=run_id,
+            routing_signal=RoutingSignal(decision=RoutingDecision.LOOP),
+            summary="Valid iteration",
+            status="succeeded",
+        )
+        for envelope_data in (handoff_envelope_to_dict(envelope), {"artifacts": 5}):
+            storage.append_event(
+                run_id,
+                RunEvent(
+                    run_id=run_id,
+                    ts=now,
+                    kind="step_completed",
+                    flow_key="signal",
+                    step_id="1",
+                    payload={"envelope": envelope_data},
+                ),
+                runs_dir=tmp_path,
+            )
+
+        state = rebuild_run_state(run_id, runs_dir=tmp_path)
+
+        assert state.handoff_envelopes["1"].summary == "Valid iteration"
+
     def test_rebuild_run_completed(self, tmp_path):
         """Should mark run as succeeded on run_completed event."""
         run_id = "test-rebuild-004"
@@ -212,6 +288,48 @@ class TestRebuildRunState:
         with pytest.raises(FileNotFoundError, match="No events found"):
             rebuild_run_state("nonexistent-run", runs_dir=tmp_path)
 
+    def test_iter_events_streams(self, tmp_path):
+        """Should read events lazily via a generator."""
+        run_id = "test-stream-001"
+        now = datetime.now(timezone.utc)
+        _append_steps(run_id, tmp_path, 0, 2, now)
+
+        events = storage.iter_events(run_id, runs_dir=tmp_path)
+        assert inspect.isgenerator(events)
+        assert [e.seq for e in events] == [1, 2, 3, 4]
+        assert [e.seq for e in storage.iter_events(run_id, tmp_path, since_seq=2)] == [3, 4]
+
+
+class TestRebuildRunStates:
+    """Test batch rebuild across worker processes."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_rebuilds_each_run_and_skips_missing(self, tmp_path, max_workers):
+        """Should rebuild every run with events and omit runs without."""
+        now = datetime.now(timezone.utc)
+        for run_id, flow_key in (("test-batch-001", "signal"), ("test-batch-002", "build")):
+            storage.append_event(
+                run_id,
+                RunEvent(
+                    run_id=run_id,
+                    ts=now,
+                    kind="run_started",
+                    flow_key=flow_key,
+                    payload={"flow_key": flow_key},
+                ),
+                runs_dir=tmp_path,
+            )
+
+        states = rebuild_run_states(
+            ["test-batch-001", "test-batch-002", "test-batch-missing"],
+            runs_dir=tmp_path,
+            max_workers=max_workers,
+        )
+
+        assert set(states) == {"test-batch-001", "test-batch-002"}
+        assert states["test-batch-001"].flow_key == "signal"
+        assert states["test-batch-002"].flow_key == "build"
+
 
 class TestRouteDecisionEvents:
     """Test route_decision event handling."""
@@ -547,6 +665,190 @@ class TestCheckpointEvents:
         assert state.current_step_id == "6"
         assert state.loop_state.get("critic-loop") == 3
 
+    def test_checkpoint_replaces_history(self, tmp_path):
+        """Should replace flow_transition_history wholesale from a checkpoint."""
+        run_id = "test-checkpoint-002"
+        now = datetime.now(timezone.utc)
+
+        history = [{"flow_key": "signal", "action": "completed"}]
+        events = [
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="run_started",
+                flow_key="build",
+                payload={"flow_key": "build"},
+            ),
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="flow_started",
+                flow_key="build",
+                payload={"flow_key": "build"},
+            ),
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="checkpoint",
+                flow_key="build",
+                payload={"state_snapshot": {"flow_transition_history": history}},
+            ),
+        ]
+
+        for event in events:
+            storage.append_event(run_id, event, runs_dir=tmp_path)
+
+        state = rebuild_run_state(run_id, runs_dir=tmp_path)
+
+        assert state.flow_transition_history == history
+
+
+def _append_steps(run_id, runs_dir, start, count, now):
+    """Append step_started/step_completed pairs for steps start..start+count-1."""
+    for i in range(start, start + count):
+        storage.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="step_started",
+                flow_key="build",
+                step_id=str(i),
+                payload={"step_index": i},
+            ),
+            runs_dir=runs_dir,
+        )
+        storage.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="step_completed",
+                flow_key="build",
+                step_id=str(i),
+                payload={"next_step_index": i + 1},
+            ),
+            runs_dir=runs_dir,
+        )
+
+
+class TestSnapshots:
+    """Test snapshot + tail replay."""
+
+    def test_snapshot_plus_tail_matches_full_replay(self, tmp_path, monkeypatch):
+        """Should replay only events after the snapshot and match a full rebuild."""
+        run_id = "test-snapshot-001"
+        now = datetime.now(timezone.utc)
+
+        storage.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="run_started",
+                flow_key="build",
+                payload={"flow_key": "build", "flow_index": 3},
+            ),
+            runs_dir=tmp_path,
+        )
+        _append_steps(run_id, tmp_path, 0, 3, now)
+
+        # 7 events replayed -> snapshot at seq 7
+        rebuild_run_state(run_id, runs_dir=tmp_path, snapshot_every=5)
+        version, _, offset = storage.load_latest_snapshot(run_id, runs_dir=tmp_path)
+        assert version == 7
+        assert offset > 0
+
+        _append_steps(run_id, tmp_path, 3, 1, now)
+
+        applied = []
+        decoded = []
+        original_apply = state_builder._apply_event
+        original_from_dict = storage.run_event_from_dict
+
+        def counting_apply(state, event):
+            applied.append(event.seq)
+            return original_apply(state, event)
+
+        def counting_from_dict(data):
+            decoded.append(data["seq"])
+            return original_from_dict(data)
+
+        monkeypatch.setattr(state_builder, "_apply_event", counting_apply)
+        monkeypatch.setattr(storage, "run_event_from_dict", counting_from_dict)
+        state = rebuild_run_state(run_id, runs_dir=tmp_path, snapshot_every=5)
+        # Reading resumes at the snapshot's own event; older lines are not decoded
+        assert decoded == [7, 8, 9]
+        assert applied == [8, 9]
+
+        full = rebuild_run_state(run_id, runs_dir=tmp_path, use_snapshot=False)
+        for attr in ("status", "flow_key", "current_flow_index", "step_index",
+                     "current_step_id", "completed_nodes", "flow_transition_history"):
+            assert getattr(state, attr) == getattr(full, attr)
+        assert state.completed_nodes == ["0", "1", "2", "3"]
+
+    def test_misaligned_snapshot_offset_falls_back_to_full_replay(self, tmp_path):
+        """Should ignore a snapshot whose offset does not land on its event."""
+        run_id = "test-snapshot-004"
+        now = datetime.now(timezone.utc)
+        _append_steps(run_id, tmp_path, 0, 2, now)
+
+        bogus = RunState(run_id=run_id, flow_key="bogus", status="failed")
+        storage.write_snapshot(run_id, 2, bogus, runs_dir=tmp_path, offset=5)
+
+        state = rebuild_run_state(run_id, runs_dir=tmp_path)
+
+        assert state.flow_key == "build"
+        assert state.completed_nodes == ["0", "1"]
+
+    def test_force_recover_ignores_snapshot(self, tmp_path):
+        """Should replay the whole log on forced recovery even with a snapshot."""
+        run_id = "test-snapshot-002"
+        now = datetime.now(timezone.utc)
+
+        storage.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="run_started",
+                flow_key="build",
+                payload={"flow_key": "build"},
+            ),
+            runs_dir=tmp_path,
+        )
+        _append_steps(run_id, tmp_path, 0, 1, now)
+
+        bogus = RunState(run_id=run_id, flow_key="bogus", status="failed")
+        storage.write_snapshot(run_id, 3, bogus, runs_dir=tmp_path)
+
+        assert rebuild_run_state(run_id, runs_dir=tmp_path).flow_key == "bogus"
+
+        recovered = recover_run_state(run_id, runs_dir=tmp_path, force=True)
+        assert recovered.flow_key == "build"
+        assert recovered.status == "running"
+
+    def test_snapshot_ahead_of_log_is_ignored(self, tmp_path):
+        """Should ignore a snapshot newer than the last event in the log."""
+        run_id = "test-snapshot-003"
+        now = datetime.now(timezone.utc)
+
+        storage.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="run_started",
+                flow_key="build",
+                payload={"flow_key": "build"},
+            ),
+            runs_dir=tmp_path,
+        )
+        bogus = RunState(run_id=run_id, flow_key="bogus", status="failed")
+        storage.write_snapshot(run_id, 99, bogus, runs_dir=tmp_path)
+
+        assert rebuild_run_state(run_id, runs_dir=tmp_path).flow_key == "build"
+
 
 class TestVerifyRunState:
     """Test state verification against stored state."""
@@ -616,6 +918,44 @@ class TestVerifyRunState:
 
         assert verify_run_state(run_id, runs_dir=tmp_path) is False
 
+    def test_verify_reuses_result_until_files_change(self, tmp_path, monkeypatch):
+        """Should skip the rebuild while neither state nor events changed."""
+        run_id = "test-verify-002b"
+        now = datetime.now(timezone.utc)
+
+        storage.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="run_started",
+                flow_key="signal",
+                payload={"flow_key": "signal"},
+            ),
+            runs_dir=tmp_path,
+        )
+        state = RunState(run_id=run_id, flow_key="signal", status="running")
+        storage.write_run_state(run_id, state, runs_dir=tmp_path)
+
+        assert verify_run_state(run_id, runs_dir=tmp_path) is True
+
+        rebuilds = []
+        original_rebuild = state_builder.rebuild_run_state
+
+        def counting_rebuild(*args, **kwargs):
+            rebuilds.append(kwargs)
+            return original_rebuild(*args, **kwargs)
+
+        monkeypatch.setattr(state_builder, "rebuild_run_state", counting_rebuild)
+        assert verify_run_state(run_id, runs_dir=tmp_path) is True
+        assert rebuilds == []
+
+        state.status = "succeeded"
+        storage.write_run_state(run_id, state, runs_dir=tmp_path)
+        assert verify_run_state(run_id, runs_dir=tmp_path) is False
+        # Verification replays the whole log and leaves no snapshot behind
+        assert rebuilds == [{"use_snapshot": False, "snapshot_every": 0}]
+
     def test_verify_no_stored_state_but_events_exist(self, tmp_path):
         """Should return False when events exist but no stored state."""
         run_id = "test-verify-003"
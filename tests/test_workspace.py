@@ -8,12 +8,14 @@ from pathlib import Path
 
 import pytest
 
+from conftest import clone_tree
 from swarm.runtime.workspace import (
     RealWorkspace,
     ShadowForkWorkspace,
     ForensicsSnapshot,
     PromotionResult,
     create_workspace,
+    _numstat_totals,
 )
 from swarm.runtime.boundary_enforcement import (
     BoundaryScanner,
@@ -21,6 +23,7 @@ from swarm.runtime.boundary_enforcement import (
     Violation,
     ViolationType,
     ViolationSeverity,
+    _parse_status_v2,
 )
 from swarm.runtime.engines.models import StepContext
 from swarm.runtime.types import RunSpec
@@ -31,26 +34,22 @@ from swarm.runtime.types import RunSpec
 # =============================================================================
 
 
-@pytest.fixture
-def temp_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository."""
-    repo = tmp_path / "repo"
+@pytest.fixture(scope="session")
+def _pristine_repo(tmp_path_factory) -> Path:
+    """Create a git repository with one commit, once per session.
+
+    Tests must not use this directly; temp_repo hands out private clones.
+    """
+    repo = tmp_path_factory.mktemp("workspace") / "repo"
     repo.mkdir()
 
     # Initialize git repo
     import subprocess
 
-    subprocess.run(["git", "init"], cwd=str(repo), capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=str(repo),
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=str(repo),
-        capture_output=True,
-    )
+    subprocess.run(["git", "init", "-b", "main"], cwd=str(repo), capture_output=True)
+    # Append the identity directly instead of two `git config` processes
+    with open(repo / ".git" / "config", "a", encoding="utf-8") as f:
+        f.write("[user]\n\temail = test@test.com\n\tname = Test User\n")
 
     # Create initial commit
     (repo / "README.md").write_text("# Test Repo")
@@ -64,6 +63,18 @@ def temp_repo(tmp_path: Path) -> Path:
     return repo
 
 
+@pytest.fixture
+def temp_repo(tmp_path: Path, _pristine_repo: Path) -> Path:
+    """Create a temporary git repository.
+
+    Cloned from a session-wide pristine repo. Git object files are never
+    rewritten in place, so they are hardlinked; everything else is copied.
+    """
+    repo = tmp_path / "repo"
+    clone_tree(_pristine_repo, repo, lambda rel: rel.startswith(".git/objects/"))
+    return repo
+
+
 @pytest.fixture
 def run_spec() -> RunSpec:
     """Create a minimal run spec."""
@@ -106,6 +117,52 @@ class TestRealWorkspace:
         assert snapshot.workspace_type == "real"
         assert snapshot.workspace_root == str(temp_repo.resolve())
 
+    def test_snapshot_forensics_counts_staged_diff(self, temp_repo: Path):
+        """Test that diff_stats reflect staged changes."""
+        import subprocess
+
+        (temp_repo / "README.md").write_text("# Test Repo\nline two\n")
+        (temp_repo / "new.txt").write_text("a\nb\n")
+        subprocess.run(["git", "add", "."], cwd=str(temp_repo), capture_output=True)
+
+        workspace = RealWorkspace(repo_root=temp_repo, run_id="test-run")
+        snapshot = workspace.snapshot_forensics()
+
+        assert snapshot.diff_stats == {
+            "files_changed": 2,
+            "insertions": 4,
+            "deletions": 1,
+        }
+
+    def test_snapshot_forensics_keeps_first_status_path(self, temp_repo: Path):
+        """Test that the leading status column of the first line is preserved."""
+        (temp_repo / "README.md").write_text("# Changed")
+
+        workspace = RealWorkspace(repo_root=temp_repo, run_id="test-run")
+        snapshot = workspace.snapshot_forensics()
+
+        assert snapshot.status == " M README.md"
+        assert snapshot.file_changes["modified"] == ["README.md"]
+
+    def test_parse_status_buckets(self, temp_repo: Path):
+        """Test that porcelain codes map to change buckets."""
+        workspace = RealWorkspace(repo_root=temp_repo, run_id="test-run")
+        status = "\n".join([
+            "A  added.py",
+            "AM added_then_edited.py",
+            " M edited.py",
+            "R  old.py -> new.py",
+            " D removed.py",
+            "?? scratch.txt",
+        ])
+
+        changes = workspace._parse_status(status)
+
+        assert changes["added"] == ["added.py", "added_then_edited.py"]
+        assert changes["modified"] == ["edited.py", "old.py -> new.py"]
+        assert changes["deleted"] == ["removed.py"]
+        assert changes["untracked"] == ["scratch.txt"]
+
     def test_promote_is_noop(self, temp_repo: Path):
         """Test that promote() is a no-op for real workspace."""
         workspace = RealWorkspace(repo_root=temp_repo, run_id="test-run")
@@ -147,6 +204,64 @@ class TestShadowForkWorkspace:
         expected = temp_repo / "swarm" / "runs" / "test-run"
         assert workspace.run_base == expected
 
+    def test_snapshot_forensics_after_checkpoint(self, temp_repo: Path):
+        """Test that shadow snapshots report diff, status, and divergence."""
+        workspace = ShadowForkWorkspace(repo_root=temp_repo, run_id="test-run")
+        workspace.create()
+        (temp_repo / "feature.py").write_text("x = 1\ny = 2\n")
+        assert workspace.checkpoint("add feature")
+        (temp_repo / "scratch.txt").write_text("notes")
+
+        snapshot = workspace.snapshot_forensics()
+
+        assert snapshot.workspace_type == "shadow"
+        assert snapshot.upstream_divergence == {"behind": 0, "ahead": 1}
+        assert snapshot.diff_stats["insertions"] >= 2
+        assert snapshot.file_changes["untracked"] == ["scratch.txt"]
+
+        workspace.cleanup(success=False)
+
+    def test_divergence_memoized_per_commit(self, temp_repo: Path):
+        """Test that divergence is reused until the base branch or HEAD moves."""
+        import subprocess
+
+        workspace = ShadowForkWorkspace(repo_root=temp_repo, run_id="test-run")
+        workspace.create()
+
+        rev_lists = []
+        git_text = workspace._git_text
+
+        def counting_git_text(args):
+            if args[0] == "rev-list":
+                rev_lists.append(args)
+            return git_text(args)
+
+        workspace._git_text = counting_git_text
+
+        assert workspace._get_divergence() == {"behind": 0, "ahead": 0}
+        assert workspace._get_divergence() == {"behind": 0, "ahead": 0}
+        assert len(rev_lists) == 1
+
+        (temp_repo / "feature.py").write_text("x = 1\n")
+        workspace.checkpoint("add feature")
+
+        assert workspace._get_divergence() == {"behind": 0, "ahead": 1}
+        assert len(rev_lists) == 2
+
+        # A commit made outside the workspace (e.g. by an agent) is seen too
+        (temp_repo / "agent.py").write_text("y = 2\n")
+        subprocess.run(["git", "add", "agent.py"], cwd=str(temp_repo), capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "agent commit"],
+            cwd=str(temp_repo),
+            capture_output=True,
+        )
+
+        assert workspace._get_divergence() == {"behind": 0, "ahead": 2}
+        assert len(rev_lists) == 3
+
+        workspace.cleanup(success=False)
+
     def test_record_boundary_violation(self, temp_repo: Path):
         """Test recording boundary violations."""
         workspace = ShadowForkWorkspace(repo_root=temp_repo, run_id="test-run")
@@ -162,6 +277,88 @@ class TestShadowForkWorkspace:
         assert violations[0].path == "/outside/path"
         assert violations[0].operation == "write"
         assert violations[0].step_id == "test-step"
+        assert violations[0].timestamp.endswith("+00:00")
+
+    def test_boundary_violations_are_bounded(self, temp_repo: Path, monkeypatch):
+        """Test that only the most recent violations are retained."""
+        monkeypatch.setattr(
+            "swarm.runtime.workspace.MAX_BOUNDARY_VIOLATIONS", 3
+        )
+        workspace = ShadowForkWorkspace(repo_root=temp_repo, run_id="test-run")
+
+        for i in range(5):
+            workspace.record_boundary_violation(path=f"/outside/{i}", operation="write")
+
+        violations = workspace.get_boundary_violations()
+        assert [v.path for v in violations] == [
+            "/outside/2",
+            "/outside/3",
+            "/outside/4",
+        ]
+
+
+# =============================================================================
+# Git Output Helper Tests
+# =============================================================================
+
+
+class TestNumstatTotals:
+    """Tests for _numstat_totals parsing."""
+
+    def test_empty_output(self):
+        """Test that empty output yields zero counts."""
+        assert _numstat_totals(b"") == {
+            "files_changed": 0,
+            "insertions": 0,
+            "deletions": 0,
+        }
+
+    def test_sums_entries(self):
+        """Test that insertions and deletions are summed across files."""
+        output = b"3\t1\ta.py\x0010\t0\tb.py\x00"
+        assert _numstat_totals(output) == {
+            "files_changed": 2,
+            "insertions": 13,
+            "deletions": 1,
+        }
+
+    def test_binary_and_rename_entries(self):
+        """Test that binary files count as changed and rename paths are skipped."""
+        output = b"-\t-\timage.png\x002\t2\t\x00old.py\x00new.py\x00"
+        assert _numstat_totals(output) == {
+            "files_changed": 2,
+            "insertions": 2,
+            "deletions": 2,
+        }
+
+
+class TestParseStatusV2:
+    """Tests for boundary scanner status parsing."""
+
+    def test_unborn_branch(self):
+        """Test that an unborn branch yields an empty HEAD and no changes."""
+        output = b"# branch.oid (initial)\x00# branch.head main\x00"
+        assert _parse_status_v2(output) == ("", set(), "")
+
+    def test_entries(self):
+        """Test ordinary, renamed, and untracked entries."""
+        sha = "97bad1abbdb88482d8a5fcc2b0a1b7af4f729041"
+        output = (
+            b"# branch.oid " + sha.encode() + b"\x00# branch.head main\x00"
+            b"2 R. N... 100644 100644 100644 aaa aaa R100 b.txt\x00a.txt\x00"
+            b"1 .M N... 100644 100644 100644 bbb bbb sp ace.txt\x00"
+            b"? new.txt\x00"
+        )
+
+        head, changed, text = _parse_status_v2(output)
+
+        assert head == sha
+        assert changed == {"a.txt", "b.txt", "sp ace.txt", "new.txt"}
+        assert text.split("\n") == [
+            "R  a.txt -> b.txt",
+            " M sp ace.txt",
+            "?? new.txt",
+        ]
 
 
 # =============================================================================
@@ -225,6 +422,46 @@ class TestBoundaryScanner:
         assert isinstance(state, WorkspaceState)
         assert state.timestamp  # Should have a timestamp
         assert isinstance(state.changed_files, set)
+        assert len(state.git_ref) == 40  # HEAD sha from the status header
+
+    def test_capture_state_shadow_records_real_repo_ref(self, temp_repo: Path):
+        """Test that shadow captures include the real repo HEAD."""
+        workspace = ShadowForkWorkspace(repo_root=temp_repo, run_id="test-run")
+        scanner = BoundaryScanner(
+            workspace=workspace,
+            step_id="test-step",
+            repo_root=temp_repo,
+        )
+
+        state = scanner.capture_state()
+
+        assert state.real_repo_ref == state.git_ref
+        assert len(state.real_repo_ref) == 40
+
+    def test_capture_state_shadow_separate_root(self, temp_repo: Path, tmp_path: Path):
+        """Test that a shadow workspace outside the real repo reads its HEAD."""
+        import shutil
+        import subprocess
+
+        other = tmp_path / "other"
+        shutil.copytree(temp_repo, other)
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "Diverge"],
+            cwd=str(other),
+            capture_output=True,
+            check=True,
+        )
+        workspace = ShadowForkWorkspace(repo_root=other, run_id="test-run")
+        scanner = BoundaryScanner(
+            workspace=workspace,
+            step_id="test-step",
+            repo_root=temp_repo,
+        )
+
+        state = scanner.capture_state()
+
+        assert len(state.real_repo_ref) == 40
+        assert state.real_repo_ref != state.git_ref
 
     def test_scan_with_no_changes(self, temp_repo: Path):
         """Test scanning with no changes reports no violations."""
@@ -266,6 +503,43 @@ class TestBoundaryScanner:
         ]
         assert len(secret_violations) > 0
 
+    def test_secret_exposure_reports_matched_pattern(self, temp_repo: Path):
+        """Test that secret matching is case-insensitive and names the pattern."""
+        workspace = RealWorkspace(repo_root=temp_repo, run_id="test-run")
+        scanner = BoundaryScanner(
+            workspace=workspace,
+            step_id="test-step",
+            repo_root=temp_repo,
+        )
+        state = WorkspaceState(
+            timestamp="t",
+            changed_files={"config/Prod_API_KEY.txt", "src/app.py"},
+        )
+
+        violations = scanner._check_secret_exposure(state)
+
+        assert [v.path for v in violations] == ["config/Prod_API_KEY.txt"]
+        assert "matched 'api_key'" in violations[0].detail
+
+    def test_secret_patterns_overridden_by_subclass(self, temp_repo: Path):
+        """Test that a subclass's SECRET_PATTERNS replace the shared regex."""
+
+        class CustomScanner(BoundaryScanner):
+            SECRET_PATTERNS = {"private"}
+
+        workspace = RealWorkspace(repo_root=temp_repo, run_id="test-run")
+        default = BoundaryScanner(workspace=workspace, step_id="s", repo_root=temp_repo)
+        custom = CustomScanner(workspace=workspace, step_id="s", repo_root=temp_repo)
+        state = WorkspaceState(
+            timestamp="t",
+            changed_files={"keys/private.pem", "config/token.txt"},
+        )
+
+        assert default._secret_re is BoundaryScanner._SECRET_RE
+        assert [v.path for v in custom._check_secret_exposure(state)] == [
+            "keys/private.pem"
+        ]
+
 
 # =============================================================================
 # StepContext Integration Tests